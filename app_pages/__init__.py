@@ -0,0 +1 @@
+"""Pages of the app, imported by ``main()`` in streamlit_app.py when first opened."""
@@ -0,0 +1,52 @@
+"""Admin sidebar panel shown when APP_PROFILING=1."""
+import functools
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.resources import (
+    collect_metrics, get_browser_cache, get_catalog_store, get_figure_cache, get_recommendation_cache,
+)
+from market_research.profiling import deep_sizeof, render_exposition
+
+def performance_panel(metrics):
+    """Admin sidebar panel with render timings, cache hit rates and memory use"""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    session_bytes = deep_sizeof(st.session_state.to_dict())
+    metrics.record_session_size(ctx.session_id if ctx else 'local', session_bytes)
+
+    with st.sidebar.expander("📈 Hiệu năng (admin)"):
+        store = get_catalog_store()
+        col1, col2 = st.columns(2)
+        col1.metric("Số lần chạy lại", metrics.reruns)
+        col2.metric("Phần mềm", len(store))
+        st.caption(f"Phiên bản danh mục {store.version} · {store.tombstones} bản ghi chờ dọn · "
+                   f"session_state ≈ {session_bytes / 1024:,.1f} KB")
+
+        sections = metrics.sections()
+        if sections:
+            st.dataframe(pd.DataFrame([{
+                'Phần': stats.name,
+                'Số lần': stats.calls,
+                'TB (ms)': round(1000 * stats.total / stats.calls, 1),
+                'Gần nhất (ms)': round(1000 * stats.last, 1),
+                'Max (ms)': round(1000 * stats.max, 1),
+            } for stats in sections]), hide_index=True, use_container_width=True)
+
+        for label, cache in (("Cache biểu đồ", get_figure_cache()), ("Cache tư vấn AI", get_recommendation_cache()),
+                             ("Cache danh sách", get_browser_cache())):
+            lookups = cache.hits + cache.misses
+            rate = f"{100 * cache.hits / lookups:.0f}%" if lookups else "—"
+            st.write(f"**{label}:** {rate} trúng ({cache.hits}/{lookups})")
+
+        samples = collect_metrics(metrics, store, get_figure_cache(), get_recommendation_cache(),
+                                  get_browser_cache())
+        st.download_button("📥 Prometheus metrics", render_exposition(samples),
+                           file_name="metrics.txt", mime="text/plain", on_click="ignore")
+        st.button("⏺️ Ghi cProfile lần chạy tiếp theo",
+                  on_click=functools.partial(st.session_state.__setitem__, 'profile_next_run', True))
+        if 'last_profile' in st.session_state:
+            st.download_button("📥 Tải cProfile (.prof)", st.session_state.last_profile,
+                               file_name="rerun.prof", mime="application/octet-stream", on_click="ignore")
@@ -0,0 +1,901 @@
+"""Market research page: surveys, comparison, AI consultation, report and catalog admin.
+
+Imported by ``main()`` the first time the page is opened. plotly is imported
+inside the sections that draw charts.
+"""
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+from app_pages.resources import (
+    cached_chart, get_browser_cache, get_catalog_frame, get_catalog_store, get_consultation_queue,
+    get_market_aggregates, get_name_index, get_product_matrix, get_report_builder, get_search_index,
+    get_similarity_index, get_text_index, get_vendor_refresher, profile_section,
+)
+from market_research.bulk_import import detect_format, import_catalog
+from market_research.catalog import PRODUCT_FIELDS
+from market_research.comparison import PresenceMatrix, product_labels
+from market_research.consultation import CANCELLED, DONE, FAILED, QueueFullError
+from market_research.engine import SEARCH_TOP_K, rank_surveys as rank_survey_batch, search_survey
+from market_research.export import EXPORT_FORMATS, export_rows
+from market_research.name_index import TYPEAHEAD_TOP_K
+from market_research.survey_results import SurveyResults
+
+RESULTS_PREVIEW = 10
+SIMILAR_TOP_K = 10
+COMPARISON_MAX = 100
+BROWSER_PAGE_SIZES = [10, 25, 50, 100]
+CONSULTATION_POLL_SECONDS = 1.0
+SCORING_WORKERS = int(os.environ.get('SCORING_WORKERS', '1'))
+
+def generate_id():
+    return uuid.uuid4().hex[:8]
+
+def market_research_page():
+    st.header("🔍 THAM KHẢO PHẦN MẀM THỊ TRƯỜNG")
+    st.markdown("---")
+    
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+        "🔍 Khảo sát Thị trường", 
+        "📊 So sánh Phần mềm", 
+        "💡 AI Tư vấn", 
+        "📋 Báo cáo Phân tích",
+        "⚙️ Quản lý Database"
+    ])
+    
+    with tab1, profile_section('market_survey_section'):
+        market_survey_section()
+    
+    with tab2, profile_section('software_comparison_section'):
+        software_comparison_section()
+    
+    with tab3, profile_section('ai_consultation_section'):
+        ai_consultation_section()
+    
+    with tab4, profile_section('market_analysis_report'):
+        market_analysis_report()
+    
+    with tab5, profile_section('database_management_section'):
+        database_management_section()
+
+def market_survey_section():
+    st.subheader("🔍 KHẢO SÁT THỊ TRƯỜNG PHẦN MỀM")
+    
+    # Survey creation
+    with st.expander("➕ Tạo Khảo sát Mới", expanded=True):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            survey_name = st.text_input("Tên khảo sát", placeholder="Ví dụ: Khảo sát ERP cho doanh nghiệp vừa")
+            software_category = st.selectbox("Loại phần mềm", 
+                                           ['ERP', 'CRM', 'HR', 'Accounting', 'Project Management', 'BI/Analytics', 'Other'])
+            budget_range = st.selectbox("Ngân sách", 
+                                      ['< 100 triệu VNĐ', '100-500 triệu VNĐ', '500 triệu - 2 tỷ VNĐ', '> 2 tỷ VNĐ'])
+        
+        with col2:
+            company_size = st.selectbox("Quy mô công ty", 
+                                      ['< 50 nhân viên', '50-200 nhân viên', '200-1000 nhân viên', '> 1000 nhân viên'])
+            deployment_preference = st.multiselect("Hình thức triển khai ưu tiên",
+                                                 ['On-premise', 'Cloud', 'Hybrid'])
+            priority_features = st.multiselect("Tính năng ưu tiên",
+                                             ['Cost-effective', 'Easy to use', 'Scalability', 'Integration', 
+                                              'Security', 'Mobile support', 'Local support', 'Customization'])
+        
+        requirements = st.text_area("Yêu cầu chi tiết",
+                                  placeholder="Mô tả chi tiết về yêu cầu nghiệp vụ, tính năng cần thiết...")
+        
+        if st.button("🚀 Tạo Khảo sát", type="primary"):
+            if survey_name and software_category:
+                survey_id = generate_id()
+                st.session_state.market_research[survey_id] = {
+                    'name': survey_name,
+                    'category': software_category,
+                    'budget_range': budget_range,
+                    'company_size': company_size,
+                    'deployment_preference': deployment_preference,
+                    'priority_features': priority_features,
+                    'requirements': requirements,
+                    'created_date': datetime.now().isoformat(),
+                    'status': 'Active',
+                    'research_results': SurveyResults()
+                }
+                st.success(f"✅ Khảo sát '{survey_name}' đã được tạo thành công!")
+                st.rerun()
+    
+    # Display existing surveys
+    if st.session_state.market_research:
+        st.subheader("📋 Danh sách Khảo sát")
+        
+        surveys = st.session_state.market_research
+        # Results ranked against an older catalog are refreshed together
+        snapshot = get_catalog_store().snapshot()
+        stale = [survey for survey in surveys.values()
+                 if survey['research_results'].version not in (None, snapshot.version)]
+        if stale:
+            rank_surveys(stale)
+        if st.button("🔄 Chấm điểm lại tất cả khảo sát"):
+            rank_surveys(list(surveys.values()))
+            st.success(f"✅ Đã cập nhật kết quả cho {len(surveys)} khảo sát!")
+        
+        for survey_id, survey in st.session_state.market_research.items():
+            with st.expander(f"📊 {survey['name']} - {survey['category']}"):
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.write(f"**Ngân sách:** {survey['budget_range']}")
+                    st.write(f"**Quy mô:** {survey['company_size']}")
+                
+                with col2:
+                    st.write(f"**Triển khai:** {', '.join(survey['deployment_preference'])}")
+                    st.write(f"**Trạng thái:** {survey['status']}")
+                
+                with col3:
+                    st.write(f"**Ngày tạo:** {survey['created_date'][:10]}")
+                    st.write(f"**Kết quả:** {len(survey['research_results'])} phần mềm")
+                
+                # Resolved against the catalog now, so later edits to a product show up
+                top_results = list(survey['research_results'].resolve(snapshot, limit=RESULTS_PREVIEW))
+                if top_results:
+                    st.dataframe(pd.DataFrame(top_results, columns=['name', 'vendor', 'price_range', 'match_score']),
+                                 use_container_width=True, hide_index=True)
+                
+                if st.button("🔍 Tìm kiếm Phần mềm", key=f"search_{survey_id}"):
+                    # Auto search based on survey criteria
+                    results = search_software_by_criteria(survey)
+                    survey['research_results'] = results
+                    st.success(f"✅ Đã tìm thấy {len(results)} phần mềm phù hợp!")
+                    st.rerun()
+
+def search_software_by_criteria(survey, top_k=SEARCH_TOP_K):
+    """Search software based on survey criteria; returns id and score references"""
+    return search_survey(get_search_index(), get_text_index(), survey, top_k)
+
+def rank_surveys(surveys, top_k=SEARCH_TOP_K):
+    """Re-rank many surveys in one matrix pass and store their results"""
+    results = rank_survey_batch(get_product_matrix(), get_text_index(), surveys, top_k, SCORING_WORKERS)
+    for survey, survey_results in zip(surveys, results):
+        survey['research_results'] = survey_results
+
+def software_comparison_section():
+    st.subheader("📊 SO SÁNH PHẦN MỀM")
+    
+    # Software selection for comparison
+    snapshot = get_catalog_store().snapshot()
+    
+    if not len(snapshot):
+        st.info("📝 Chưa có dữ liệu phần mềm để so sánh")
+        return
+    
+    frame = get_catalog_frame(snapshot)
+    matches = name_typeahead("🔎 Tìm phần mềm để thêm vào so sánh", key="comparison_query")
+    # Options are the current selection plus the top matches, never the whole catalog
+    chosen = st.session_state.get('comparison_selection', [])
+    selected_ids = st.multiselect(f"Chọn phần mềm để so sánh (tối đa {COMPARISON_MAX}):",
+                                  list(dict.fromkeys(chosen + matches)),
+                                  format_func=lambda product_id: product_label(snapshot, product_id),
+                                  max_selections=COMPARISON_MAX, key="comparison_selection")
+    # Products deleted since they were chosen
+    selected_ids = [product_id for product_id in selected_ids if snapshot.get(product_id) is not None]
+    
+    if len(selected_ids) >= 2:
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        # Get selected software data
+        comparison_data = [snapshot.get(product_id) for product_id in selected_ids]
+        # Columns are per product id: names alone may repeat
+        labels = product_labels(comparison_data)
+        selected_rows = frame.df.iloc[frame.positions(selected_ids)].set_axis(labels)
+        
+        # Comparison table
+        st.subheader("📋 Bảng So sánh Chi tiết")
+        
+        def build_comparison_df():
+            comparison_df_data = {
+                'Tiêu chí': ['Tên sản phẩm', 'Nhà cung cấp', 'Loại', 'Giá', 'Triển khai', 
+                            'Đánh giá', 'Thị phần', 'Hỗ trợ VN', 'Website']
+            }
+            
+            for label, sw in zip(labels, comparison_data):
+                comparison_df_data[label] = [
+                    sw['name'],
+                    sw['vendor'],
+                    sw['category'],
+                    sw['price_range'],
+                    ', '.join(sw['deployment']),
+                    f"{sw['rating']}/5.0",
+                    sw['market_share'],
+                    '✅' if sw['support_vietnam'] else '❌',
+                    sw['website']
+                ]
+            
+            return pd.DataFrame(comparison_df_data)
+        
+        comparison_df = cached_chart(frame.version, selected_ids, 'comparison_table',
+                                     build_comparison_df)
+        st.dataframe(comparison_df, use_container_width=True)
+        
+        # Visualization
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Rating comparison
+            def build_rating_chart():
+                fig_rating = go.Figure(data=[
+                    go.Bar(name='Rating', 
+                          x=selected_rows.index,
+                          y=selected_rows['rating'])
+                ])
+                fig_rating.update_layout(title='So sánh Đánh giá (Rating)')
+                return fig_rating
+            
+            fig_rating = cached_chart(frame.version, selected_ids, 'rating_bar',
+                                      build_rating_chart)
+            st.plotly_chart(fig_rating, use_container_width=True)
+        
+        with col2:
+            # Market share comparison
+            fig_market = cached_chart(frame.version, selected_ids, 'market_share_pie', lambda: px.pie(
+                values=selected_rows['market_share'].fillna(0),
+                names=selected_rows.index,
+                title='Thị phần'
+            ))
+            st.plotly_chart(fig_market, use_container_width=True)
+        
+        # Detailed feature comparison
+        st.subheader("🔍 So sánh Tính năng Chi tiết")
+        presence_comparison(frame.version, selected_ids, comparison_data)
+        
+        # Export comparison
+        export_download_button("📥 Tải báo cáo so sánh",
+                               lambda: comparison_df.to_dict('records'),
+                               list(comparison_df.columns), "software_comparison", key="export_comparison")
+    
+    similar_products_panel(snapshot, selected_ids)
+
+def presence_comparison(version, selected_ids, comparison_data):
+    """Features, pros, cons and deployment of all compared products as one heatmap or pivot table"""
+    import plotly.express as px
+
+    presence = cached_chart(version, selected_ids, 'presence_matrix',
+                            lambda: PresenceMatrix(comparison_data))
+    if not len(presence):
+        st.info("📝 Các phần mềm đã chọn chưa có thông tin tính năng")
+        return
+    
+    view = st.radio("Hiển thị", ["Biểu đồ nhiệt", "Bảng"], horizontal=True, key="presence_view")
+    grid = cached_chart(version, selected_ids, 'presence_grid', presence.to_frame)
+    coverage = cached_chart(version, selected_ids, 'presence_coverage', presence.coverage)
+    if view == "Biểu đồ nhiệt":
+        def build_heatmap():
+            labels = [f"{group}: {item}" for group, item in grid.index]
+            fig = px.imshow(grid.to_numpy(dtype=int), x=list(grid.columns), y=labels,
+                            color_continuous_scale=[[0, '#f0f2f6'], [1, '#2e7d32']], aspect='auto')
+            fig.update_layout(coloraxis_showscale=False, height=max(400, 22 * len(labels)),
+                              xaxis={'side': 'top'}, margin={'l': 0, 'r': 0, 't': 40, 'b': 0})
+            fig.update_traces(hovertemplate='%{x}<br>%{y}<extra></extra>')
+            return fig
+        
+        fig = cached_chart(version, selected_ids, 'presence_heatmap', build_heatmap)
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        table = cached_chart(version, selected_ids, 'presence_table', lambda: pd.concat(
+            [coverage, grid.replace({True: '✅', False: ''})], axis=1
+        ).reset_index())
+        st.dataframe(table, use_container_width=True, hide_index=True)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Độ phủ theo mục:**")
+        common = coverage[coverage['Số sản phẩm'] == len(selected_ids)]
+        unique = coverage[coverage['Số sản phẩm'] == 1]
+        st.write(f"{len(common)} mục chung cho tất cả, {len(unique)} mục chỉ một phần mềm có")
+        st.dataframe(coverage.reset_index(), use_container_width=True, hide_index=True)
+    with col2:
+        st.write("**Số mục theo phần mềm:**")
+        st.dataframe(presence.product_coverage(), use_container_width=True)
+
+def similar_products_panel(snapshot, selected_ids):
+    """Products whose name, vendor, features, pros and cons resemble a chosen one"""
+    st.subheader("🔗 Phần mềm Tương tự")
+    matches = name_typeahead("🔎 Tìm phần mềm", key="similar_query")
+    options = list(dict.fromkeys(selected_ids + matches))
+    if not options:
+        st.caption("Chọn phần mềm để so sánh hoặc tìm theo tên để xem các phần mềm tương tự")
+        return
+    product_id = st.selectbox("Tìm phần mềm tương tự với:", options,
+                              format_func=lambda product_id: product_label(snapshot, product_id),
+                              key="similar_reference")
+    rows = []
+    for other_id, similarity in get_similarity_index().similar(product_id, k=SIMILAR_TOP_K):
+        product = snapshot.get(other_id)
+        if product is not None:
+            rows.append({'Tên': product['name'], 'Nhà cung cấp': product['vendor'],
+                         'Danh mục': product['category'], 'Độ tương đồng': f"{similarity:.0%}"})
+    if rows:
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    else:
+        st.info("📝 Không tìm thấy phần mềm tương tự")
+
+def name_typeahead(label, key):
+    """Live search box; returns the ids of the best matching products from the server-side name index"""
+    query = st.text_input(label, key=key, type="search", live=True,
+                          placeholder="Nhập tên hoặc nhà cung cấp...")
+    if not query:
+        return []
+    return get_name_index().search(query, k=TYPEAHEAD_TOP_K)
+
+def product_label(snapshot, product_id):
+    sw = snapshot.get(product_id)
+    return f"{sw['name']} - {sw['vendor']}" if sw is not None else f"#{product_id}"
+
+def describe_duplicates(store, duplicates):
+    """'Name (similarity)' list of likely duplicates that still exist"""
+    names = [f"{store.get(product_id)['name']} ({similarity:.0%})" for product_id, similarity in duplicates
+             if store.get(product_id) is not None]
+    return ', '.join(names)
+
+def ai_consultation_section():
+    st.subheader("💡 AI TƯ VẤN CHỌN PHẦN MỀM")
+    
+    # AI Consultation Form
+    with st.form("ai_consultation"):
+        st.write("**Mô tả yêu cầu của bạn để AI tư vấn phần mềm phù hợp:**")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            business_type = st.selectbox("Loại hình kinh doanh",
+                                       ['Sản xuất', 'Thương mại', 'Dịch vụ', 'Công nghệ', 'Tài chính', 'Y tế', 'Giáo dục'])
+            current_pain_points = st.text_area("Vấn đề hiện tại đang gặp phải",
+                                             placeholder="Ví dụ: Quản lý kho không hiệu quả, báo cáo tài chính chậm...")
+        
+        with col2:
+            integration_needs = st.text_area("Yêu cầu tích hợp",
+                                           placeholder="Ví dụ: Cần tích hợp với hệ thống kế toán hiện tại...")
+            special_requirements = st.text_area("Yêu cầu đặc biệt",
+                                              placeholder="Ví dụ: Phải tuân thủ quy định về dữ liệu cá nhân...")
+        
+        submitted = st.form_submit_button("🤖 Nhận Tư vấn AI", type="primary")
+        
+        if submitted:
+            try:
+                st.session_state.consultation_job = get_consultation_queue().submit({
+                    'business_type': business_type,
+                    'pain_points': current_pain_points,
+                    'integration_needs': integration_needs,
+                    'special_requirements': special_requirements
+                })
+            except QueueFullError:
+                st.error("❌ Hệ thống đang quá tải, vui lòng thử lại sau ít phút")
+    
+    job_id = st.session_state.get('consultation_job')
+    if job_id:
+        job = get_consultation_queue().get(job_id)
+        if job is None:
+            del st.session_state.consultation_job
+        elif job.done:
+            show_consultation_result(job)
+        else:
+            # Poll the job without blocking the rest of the page
+            st.fragment(run_every=CONSULTATION_POLL_SECONDS)(consultation_progress)(job_id)
+
+def consultation_progress(job_id):
+    job = get_consultation_queue().get(job_id)
+    if job is None or job.done:
+        st.rerun()
+    
+    st.progress(job.progress, text=f"🤖 {job.message or 'AI đang phân tích yêu cầu của bạn...'}")
+    if job.text:
+        st.write(job.text)
+    if st.button("⏹️ Hủy tư vấn", key=f"cancel_{job_id}"):
+        get_consultation_queue().cancel(job_id)
+        st.rerun()
+
+def show_consultation_result(job):
+    if job.status == CANCELLED:
+        st.info("⏹️ Đã hủy yêu cầu tư vấn")
+        return
+    if job.status == FAILED:
+        st.error(f"❌ Lỗi tư vấn AI: {job.error}")
+        return
+    
+    ai_recommendation = job.result
+    st.success("✅ AI đã hoàn thành phân tích!")
+    
+    # Display AI recommendations
+    st.subheader("🎯 KHUYẾN NGHỊ TỪ AI")
+    
+    tab1, tab2, tab3 = st.tabs(["🏆 Top Khuyến nghị", "📊 Phân tích", "⚠️ Lưu ý"])
+    
+    with tab1:
+        for i, rec in enumerate(ai_recommendation['top_recommendations'], 1):
+            with st.container():
+                st.write(f"### {i}. {rec['name']}")
+                col1, col2, col3 = st.columns(3)
+                
+                with col1:
+                    st.metric("Độ phù hợp", f"{rec['match_score']}/100")
+                with col2:
+                    st.metric("Đánh giá", f"{rec['rating']}/5.0")
+                with col3:
+                    st.metric("Chi phí ước tính", rec['estimated_cost'])
+                
+                st.write(f"**Lý do khuyến nghị:** {rec['reason']}")
+                st.write("---")
+    
+    with tab2:
+        st.write(ai_recommendation['analysis'])
+    
+    with tab3:
+        st.write(ai_recommendation['considerations'])
+
+def market_analysis_report():
+    import plotly.express as px
+
+    st.subheader("📋 BÁO CÁO PHÂN TÍCH THỊ TRƯỜNG")
+    
+    # Market overview
+    st.write("### 📊 Tổng quan Thị trường")
+    
+    # Calculate market statistics
+    summary = get_market_aggregates().summary()
+    total_software = summary.total
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Tổng số phần mềm", total_software)
+    
+    with col2:
+        st.metric("Số danh mục", len(summary.categories))
+    
+    with col3:
+        st.metric("Hỗ trợ VN", f"{summary.vietnam_support}/{total_software}")
+    
+    with col4:
+        st.metric("Đánh giá TB", f"{summary.avg_rating:.1f}/5.0")
+    
+    # Category breakdown
+    st.write("### 📈 Phân tích theo Danh mục")
+    
+    if summary.categories:
+        df_category = cached_chart(summary.version, (), 'category_table', lambda: pd.DataFrame(
+            summary.categories, columns=['Danh mục', 'Số lượng', 'Đánh giá TB', 'Hỗ trợ VN (%)']
+        ))
+        st.dataframe(df_category, use_container_width=True)
+        
+        # Visualizations
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig1 = cached_chart(summary.version, (), 'category_count_bar', lambda: px.bar(
+                df_category, x='Danh mục', y='Số lượng', title='Số lượng Phần mềm theo Danh mục'
+            ))
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            fig2 = cached_chart(summary.version, (), 'category_rating_bar', lambda: px.bar(
+                df_category, x='Danh mục', y='Đánh giá TB', title='Đánh giá Trung bình theo Danh mục'
+            ))
+            st.plotly_chart(fig2, use_container_width=True)
+    
+    # Trend analysis
+    st.write("### 📈 Phân tích Xu hướng")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("**Xu hướng Triển khai:**")
+        deployment_count = summary.deployment_counts
+        
+        fig_deployment = cached_chart(summary.version, (), 'deployment_pie', lambda: px.pie(
+            values=list(deployment_count.values()),
+            names=list(deployment_count.keys()),
+            title='Hình thức Triển khai'
+        ))
+        st.plotly_chart(fig_deployment, use_container_width=True)
+    
+    with col2:
+        st.write("**Top Features phổ biến:**")
+        
+        # Get top 10 features
+        top_features = summary.top_features
+        
+        def build_features_chart():
+            fig_features = px.bar(
+                x=[item[1] for item in top_features],
+                y=[item[0] for item in top_features],
+                orientation='h',
+                title='Top 10 Tính năng Phổ biến'
+            )
+            fig_features.update_layout(yaxis={'categoryorder': 'total ascending'})
+            return fig_features
+        
+        if top_features:
+            fig_features = cached_chart(summary.version, (), 'top_features_bar', build_features_chart)
+            st.plotly_chart(fig_features, use_container_width=True)
+    
+    # Export report
+    market_report_panel()
+
+def market_report_panel():
+    """Full XLSX report generated in the background, reused while the catalog is unchanged"""
+    snapshot = get_catalog_store().snapshot()
+    job = get_report_builder().get(snapshot.version)
+    if job is not None and not job.done:
+        st.fragment(run_every=CONSULTATION_POLL_SECONDS)(market_report_progress)(snapshot.version)
+        return
+    
+    if job is not None and job.status == DONE:
+        mime, extension = EXPORT_FORMATS['xlsx']
+        st.download_button(
+            "📥 Tải Báo cáo Thị trường",
+            data=Path(job.path).read_bytes,
+            file_name=f"market_analysis_v{job.version}_{datetime.now().strftime('%Y%m%d')}{extension}",
+            mime=mime,
+            key="export_market",
+            on_click="ignore"
+        )
+        return
+    
+    if job is not None and job.status == FAILED:
+        st.error(f"❌ Lỗi tạo báo cáo: {job.error}")
+    if st.button("📊 Xuất Báo cáo Thị trường (Excel)", key="generate_market_report"):
+        get_report_builder().request(snapshot)
+        st.rerun()
+
+def market_report_progress(version):
+    job = get_report_builder().get(version)
+    if job is None or job.done:
+        st.rerun()
+    
+    st.progress(job.progress, text=job.message or "Đang chuẩn bị báo cáo...")
+
+def export_download_button(label, rows, columns, file_stem, key):
+    """Format picker plus a download button that generates the file only when clicked"""
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox("Định dạng", list(EXPORT_FORMATS), format_func=str.upper,
+                           key=f"{key}_format", label_visibility="collapsed")
+    mime, extension = EXPORT_FORMATS[fmt]
+    with col2:
+        st.download_button(
+            label,
+            data=lambda: export_rows(rows(), columns, fmt),
+            file_name=f"{file_stem}_{datetime.now().strftime('%Y%m%d')}{extension}",
+            mime=mime,
+            key=key,
+            on_click="ignore"
+        )
+
+def database_management_section():
+    st.subheader("⚙️ QUẢN LÝ DATABASE PHẦN MỀM")
+    store = get_catalog_store()
+    snapshot = store.snapshot()
+    
+    # Add new software
+    with st.expander("➕ Thêm Phần mềm Mới"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_name = st.text_input("Tên phần mềm")
+            new_vendor = st.text_input("Nhà cung cấp")
+            new_category = st.selectbox("Danh mục", 
+                                      snapshot.categories() + ['Tạo mới'])
+            if new_category == 'Tạo mới':
+                new_category = st.text_input("Tên danh mục mới")
+        
+        with col2:
+            new_price = st.text_input("Khoảng giá", placeholder="Ví dụ: 100-500 USD/month")
+            new_deployment = st.multiselect("Hình thức triển khai", 
+                                          ['Cloud', 'On-premise', 'Hybrid'])
+            new_rating = st.slider("Đánh giá", 1.0, 5.0, 4.0, 0.1)
+        
+        new_features = st.text_input("Tính năng chính (phân cách bằng dấu phẩy)")
+        new_pros = st.text_input("Ưu điểm (phân cách bằng dấu phẩy)")
+        new_cons = st.text_input("Nhược điểm (phân cách bằng dấu phẩy)")
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            new_market_share = st.text_input("Thị phần", placeholder="Ví dụ: 15%")
+        with col2:
+            new_website = st.text_input("Website")
+        with col3:
+            new_support_vn = st.checkbox("Hỗ trợ tại Việt Nam")
+        
+        allow_duplicate = st.checkbox("Vẫn thêm nếu trùng với phần mềm đã có")
+        if st.button("➕ Thêm Phần mềm"):
+            if new_name and new_vendor and new_category:
+                new_software = {
+                    'name': new_name,
+                    'vendor': new_vendor,
+                    'category': new_category,
+                    'price_range': new_price,
+                    'deployment': new_deployment,
+                    'features': [f.strip() for f in new_features.split(',') if f.strip()],
+                    'pros': [p.strip() for p in new_pros.split(',') if p.strip()],
+                    'cons': [c.strip() for c in new_cons.split(',') if c.strip()],
+                    'rating': new_rating,
+                    'market_share': new_market_share,
+                    'website': new_website,
+                    'support_vietnam': new_support_vn
+                }
+                
+                duplicates = describe_duplicates(store, get_similarity_index().duplicates(new_software))
+                if duplicates and not allow_duplicate:
+                    st.warning(f"⚠️ Có thể trùng với: {duplicates}. "
+                               "Chọn 'Vẫn thêm nếu trùng' để xác nhận.")
+                else:
+                    store.add_product(new_software)
+                    st.success(f"✅ Đã thêm phần mềm '{new_name}' thành công!")
+                    st.rerun()
+    
+    # Manage existing software
+    st.write("### 📋 Danh sách Phần mềm Hiện tại")
+    
+    product_browser(store, snapshot)
+    
+    # Import/Export data
+    st.write("### 📤📥 Import/Export Dữ liệu")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Export current database; list fields are written comma-separated
+        export_download_button("📥 Tải Database", snapshot.products,
+                               ['id'] + list(PRODUCT_FIELDS), "software_database", key="export_database")
+    
+    with col2:
+        # Bulk import, committed batch by batch
+        uploaded_file = st.file_uploader("📥 Import Database (CSV, XLSX, JSONL)", type=['csv', 'xlsx', 'jsonl', 'json'])
+        if uploaded_file and st.button("🔄 Import Dữ liệu"):
+            progress_bar = st.progress(0.0, text="Đang import...")
+            total_bytes = max(uploaded_file.size, 1)
+            
+            def show_progress(report):
+                done = min(uploaded_file.tell() / total_bytes, 1.0)
+                progress_bar.progress(done, text=f"Đã đọc {report.rows_read:,} dòng "
+                                                 f"({report.rows_per_second:,.0f} dòng/giây)")
+            
+            try:
+                report = import_catalog(store, uploaded_file, detect_format(uploaded_file.name),
+                                        progress=show_progress, duplicates=get_similarity_index().duplicates)
+            except Exception as e:
+                st.error(f"❌ Lỗi import: {str(e)}")
+            else:
+                progress_bar.progress(1.0, text="Hoàn tất")
+                st.success(f"✅ Đã import {report.imported:,}/{report.rows_read:,} dòng "
+                           f"trong {report.elapsed:.1f}s ({report.rows_per_second:,.0f} dòng/giây)")
+                if report.rejected_count:
+                    st.warning(f"⚠️ {report.rejected_count:,} dòng bị từ chối")
+                    st.dataframe(pd.DataFrame(report.rejected, columns=['Dòng', 'Lý do']),
+                                 use_container_width=True)
+                if report.duplicate_count:
+                    st.warning(f"⚠️ {report.duplicate_count:,} dòng có thể trùng với phần mềm đã có")
+                    duplicates = pd.DataFrame(report.duplicates,
+                                              columns=['Dòng', 'Tên', 'Có thể trùng với', 'Độ tương đồng'])
+                    duplicates['Độ tương đồng'] = duplicates['Độ tương đồng'].map('{:.0%}'.format)
+                    st.dataframe(duplicates, use_container_width=True)
+    
+    vendor_refresh_panel()
+
+def vendor_refresh_panel():
+    """Refresh rating, market share and website from vendor feeds in the background"""
+    refresher = get_vendor_refresher()
+    if refresher is None:
+        return
+    
+    with st.expander("🔄 Cập nhật Dữ liệu từ Nhà cung cấp"):
+        job = refresher.job
+        if job is not None and not job.done:
+            st.fragment(run_every=CONSULTATION_POLL_SECONDS)(vendor_refresh_progress)()
+            return
+        
+        if job is not None:
+            finished = datetime.fromtimestamp(job.finished).strftime('%d/%m/%Y %H:%M')
+            if job.status == FAILED:
+                st.error(f"❌ Lỗi cập nhật lúc {finished}: {job.error}")
+            else:
+                st.info(f"Lần cập nhật gần nhất ({finished}): {job.updated:,} phần mềm thay đổi, "
+                        f"{job.not_modified:,} nhà cung cấp không đổi, {job.failed:,} lỗi")
+            if job.errors:
+                st.dataframe(pd.DataFrame(job.errors, columns=['URL', 'Lỗi']), use_container_width=True)
+        
+        if st.button("🔄 Cập nhật ngay"):
+            refresher.start()
+            st.rerun()
+
+def vendor_refresh_progress():
+    job = get_vendor_refresher().job
+    if job.done:
+        st.rerun()
+    
+    st.progress(job.completed / max(job.total, 1),
+                text=f"Đã kiểm tra {job.completed:,}/{job.total:,} nhà cung cấp, {job.updated:,} phần mềm thay đổi")
+    if st.button("⏹️ Dừng cập nhật"):
+        job.cancel()
+        st.rerun()
+
+BROWSER_SORTS = {
+    'Tên (A-Z)': ('name', False),
+    'Nhà cung cấp (A-Z)': ('vendor', False),
+    'Danh mục': ('category', False),
+    'Đánh giá cao nhất': ('rating', True),
+    'Thị phần lớn nhất': ('market_share', True)
+}
+
+def product_browser(store, snapshot):
+    """Paginated product list; only the rows of the current page are rendered"""
+    frame = get_catalog_frame(snapshot)
+    
+    col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+    with col1:
+        category = st.selectbox("Danh mục", ['Tất cả'] + list(frame.df['category'].cat.categories),
+                                key="browser_category")
+    with col2:
+        search_text = st.text_input("Tìm theo tên / nhà cung cấp", key="browser_search", type="search",
+                                    live=True)
+    with col3:
+        sort_label = st.selectbox("Sắp xếp", list(BROWSER_SORTS), key="browser_sort")
+    with col4:
+        page_size = st.selectbox("Số dòng", BROWSER_PAGE_SIZES, key="browser_page_size")
+    
+    sort, descending = BROWSER_SORTS[sort_label]
+    filters = (None if category == 'Tất cả' else category, search_text, sort, descending)
+    
+    def browser_order():
+        ids = get_name_index().matches(search_text, filters[0]) if search_text else None
+        return frame.query(filters[0], ids, sort, descending).astype('int32')
+    
+    # Filtering and sorting run once per (catalog version, filters); paging only slices
+    positions = get_browser_cache().get_or_build((frame.version,) + filters, browser_order)
+    
+    total_pages = max(1, -(-len(positions) // page_size))
+    # No key: the widget resets to page 1 whenever the page count changes
+    page = st.number_input(f"Trang (tổng {total_pages})", min_value=1, max_value=total_pages, value=1)
+    start = (page - 1) * page_size
+    window = frame.df.iloc[positions[start:start + page_size]]
+    st.caption(f"Hiển thị {start + 1 if len(window) else 0}-{start + len(window)} / {len(positions):,} phần mềm")
+    
+    selected = st.session_state.setdefault('selected_products', set())
+    editing = st.session_state.get('editing_product')
+    if editing is not None:
+        product_edit_form(store, editing)
+    if selected:
+        batch_actions(store, selected)
+    
+    for row in window.itertuples(index=False):
+        product_id = int(row.id)
+        col0, col1, col2, col3 = st.columns([0.3, 3, 1, 1])
+        
+        with col0:
+            st.checkbox("Chọn", value=product_id in selected, key=f"select_{product_id}",
+                        label_visibility="collapsed", on_change=toggle_selection, args=(product_id,))
+        
+        with col1:
+            market_share = '-' if pd.isna(row.market_share) else f"{row.market_share:g}%"
+            st.write(f"**{row.name}** - {row.vendor} ({row.category})")
+            st.write(f"Đánh giá: {row.rating}/5.0 | Thị phần: {market_share}")
+        
+        with col2:
+            if st.button("✏️ Sửa", key=f"edit_{product_id}"):
+                st.session_state.editing_product = product_id
+                st.rerun()
+        
+        with col3:
+            if st.button("🗑️ Xóa", key=f"delete_{product_id}"):
+                store.delete_product(product_id)
+                selected.discard(product_id)
+                st.session_state.pop(f"select_{product_id}", None)
+                st.success(f"✅ Đã xóa {row.name}")
+                st.rerun()
+
+def toggle_selection(product_id):
+    st.session_state.selected_products ^= {product_id}
+
+def clear_selection(selected):
+    """Empty the selection and untick its checkboxes, which ignore ``value=`` once keyed"""
+    for product_id in selected:
+        st.session_state.pop(f"select_{product_id}", None)
+    selected.clear()
+
+def product_edit_form(store, product_id):
+    """In-place edit of one product, addressed by its stable id"""
+    sw = store.get(product_id)
+    if sw is None:
+        st.warning("⚠️ Phần mềm này đã bị xóa")
+        del st.session_state.editing_product
+        return
+    
+    with st.form(f"edit_form_{product_id}"):
+        st.write(f"**✏️ Chỉnh sửa: {sw['name']}**")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            name = st.text_input("Tên phần mềm", sw['name'])
+            vendor = st.text_input("Nhà cung cấp", sw['vendor'])
+            category = st.text_input("Danh mục", sw['category'])
+            price = st.text_input("Khoảng giá", sw['price_range'] or '')
+        
+        with col2:
+            deployment = st.multiselect("Hình thức triển khai", ['Cloud', 'On-premise', 'Hybrid'],
+                                        default=[d for d in sw['deployment'] if d in ('Cloud', 'On-premise', 'Hybrid')])
+            rating = st.slider("Đánh giá", 1.0, 5.0, float(sw['rating'] or 4.0), 0.1)
+            market_share = st.text_input("Thị phần", sw['market_share'] or '')
+            website = st.text_input("Website", sw['website'] or '')
+        
+        features = st.text_input("Tính năng chính (phân cách bằng dấu phẩy)", ', '.join(sw['features']))
+        pros = st.text_input("Ưu điểm (phân cách bằng dấu phẩy)", ', '.join(sw['pros']))
+        cons = st.text_input("Nhược điểm (phân cách bằng dấu phẩy)", ', '.join(sw['cons']))
+        support_vn = st.checkbox("Hỗ trợ tại Việt Nam", bool(sw['support_vietnam']))
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            save = st.form_submit_button("💾 Lưu", type="primary")
+        with col2:
+            cancel = st.form_submit_button("Hủy")
+    
+    if save:
+        if not (name and vendor and category):
+            st.error("❌ Tên, nhà cung cấp và danh mục là bắt buộc")
+            return
+        store.update_product(product_id, {
+            'name': name,
+            'vendor': vendor,
+            'category': category,
+            'price_range': price,
+            'deployment': deployment,
+            'features': [f.strip() for f in features.split(',') if f.strip()],
+            'pros': [p.strip() for p in pros.split(',') if p.strip()],
+            'cons': [c.strip() for c in cons.split(',') if c.strip()],
+            'rating': rating,
+            'market_share': market_share,
+            'website': website,
+            'support_vietnam': support_vn
+        })
+        del st.session_state.editing_product
+        st.success(f"✅ Đã cập nhật '{name}'")
+        st.rerun()
+    if cancel:
+        del st.session_state.editing_product
+        st.rerun()
+
+def batch_actions(store, selected):
+    """Delete or edit every selected product in one catalog write"""
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        st.write(f"**Đã chọn {len(selected)} phần mềm**")
+    with col2:
+        if st.button("🗑️ Xóa đã chọn", key="batch_delete"):
+            deleted = store.delete_products(list(selected))
+            clear_selection(selected)
+            st.success(f"✅ Đã xóa {len(deleted)} phần mềm")
+            st.rerun()
+    with col3:
+        if st.button("Bỏ chọn", key="batch_clear"):
+            clear_selection(selected)
+            st.rerun()
+    
+    with st.expander("✏️ Sửa hàng loạt"):
+        with st.form("batch_edit"):
+            category = st.text_input("Danh mục mới (để trống nếu giữ nguyên)")
+            deployment = st.multiselect("Hình thức triển khai (để trống nếu giữ nguyên)",
+                                        ['Cloud', 'On-premise', 'Hybrid'])
+            support_vn = st.selectbox("Hỗ trợ tại Việt Nam", ['Giữ nguyên', 'Có', 'Không'])
+            if st.form_submit_button("💾 Áp dụng"):
+                changes = {}
+                if category:
+                    changes['category'] = category
+                if deployment:
+                    changes['deployment'] = deployment
+                if support_vn != 'Giữ nguyên':
+                    changes['support_vietnam'] = support_vn == 'Có'
+                if changes:
+                    updated = store.update_products({product_id: changes for product_id in selected})
+                    st.success(f"✅ Đã cập nhật {len(updated)} phần mềm")
+                    st.rerun()
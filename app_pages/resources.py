@@ -0,0 +1,198 @@
+"""Process-wide resources shared by the app's pages.
+
+The accessors are ``st.cache_resource`` functions, so the catalog, its
+indexes, caches and worker pools are created once per process and shared by
+every session. Modules that pull in pandas or numpy are imported inside the
+accessors that need them, which keeps importing this module cheap.
+"""
+import os
+import functools
+
+import streamlit as st
+
+from market_research.aggregates import MarketAggregates
+from market_research.catalog import CatalogStore
+from market_research.consultation import ConsultationQueue, HttpBackend, LocalBackend
+from market_research.lru import LRUCache
+from market_research.market_report import MarketReportBuilder
+from market_research.name_index import NameIndex
+from market_research.profiling import NULL_SECTION, RenderMetrics, Sample, serve_metrics
+from market_research.recommendation_cache import CachedBackend, RecommendationCache
+from market_research.search_index import SearchIndex
+from market_research.text_index import TextIndex
+from market_research.vendor_refresh import VendorRefresher
+
+FIGURE_CACHE_SIZE = 256
+BROWSER_CACHE_SIZE = 8
+CONSULTATION_WORKERS = int(os.environ.get('AI_WORKERS', '16'))
+RECOMMENDATION_CACHE_SIZE = 1024
+RECOMMENDATION_CACHE_TTL = 3600
+PROFILING_ENABLED = os.environ.get('APP_PROFILING') == '1'
+
+@st.cache_resource
+def get_catalog_store():
+    """Catalog shared by every session in this process."""
+    return CatalogStore(os.environ.get('CATALOG_DB_PATH', 'catalog.db'))
+
+@st.cache_resource
+def get_search_index():
+    """Inverted index kept in sync with the shared catalog."""
+    index = SearchIndex()
+    get_catalog_store().add_listener(index)
+    return index
+
+@st.cache_resource
+def get_text_index():
+    """BM25 index over product text kept in sync with the shared catalog."""
+    index = TextIndex()
+    get_catalog_store().add_listener(index)
+    return index
+
+@st.cache_resource
+def get_name_index():
+    """Typeahead index over product names and vendors kept in sync with the shared catalog."""
+    index = NameIndex()
+    get_catalog_store().add_listener(index)
+    return index
+
+@st.cache_resource
+def get_market_aggregates():
+    """Market report counters kept in sync with the shared catalog."""
+    aggregates = MarketAggregates(top_n=10)
+    get_catalog_store().add_listener(aggregates)
+    return aggregates
+
+@st.cache_resource
+def get_report_builder():
+    """Background generator of the market report workbook, one file per catalog version.
+    
+    Reports are kept in MARKET_REPORT_DIR, by default next to the catalog database.
+    """
+    db_path = os.environ.get('CATALOG_DB_PATH', 'catalog.db')
+    return MarketReportBuilder(os.environ.get('MARKET_REPORT_DIR') or f'{db_path}.reports')
+
+@st.cache_resource(max_entries=2)
+def _catalog_frame(version, _snapshot):
+    from market_research.frame import CatalogFrame  # pandas
+    return CatalogFrame(_snapshot)
+
+def get_catalog_frame(snapshot=None):
+    """Columnar view of ``snapshot`` (default: the latest), built once per catalog version."""
+    if snapshot is None:
+        snapshot = get_catalog_store().snapshot()
+    return _catalog_frame(snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=2)
+def _product_matrix(version, _frame):
+    from market_research.batch_scoring import ProductMatrix  # numpy
+    return ProductMatrix(_frame)
+
+def get_product_matrix(snapshot=None):
+    """Survey scoring matrices for ``snapshot`` (default: the latest), built once per catalog version."""
+    frame = get_catalog_frame(snapshot)
+    return _product_matrix(frame.version, frame)
+
+@st.cache_resource
+def get_similarity_index():
+    """MinHash/LSH similar-product and duplicate index kept in sync with the shared catalog."""
+    from market_research.similarity import SimilarityIndex  # numpy
+    index = SimilarityIndex()
+    get_catalog_store().add_listener(index)
+    return index
+
+@st.cache_resource
+def get_figure_cache():
+    """Figures and DataFrames shared by all sessions, bounded by LRU eviction."""
+    return LRUCache(maxsize=FIGURE_CACHE_SIZE)
+
+@st.cache_resource
+def get_browser_cache():
+    """Row orders of the product browser per filter, kept apart from the figure cache.
+    
+    An entry holds a position per matching row (megabytes on a large catalog),
+    so only the few most recent filters are kept.
+    """
+    return LRUCache(maxsize=BROWSER_CACHE_SIZE)
+
+def cached_chart(version, selection, kind, build):
+    """Memoize a chart or table on (catalog version, selected products, chart kind)."""
+    return get_figure_cache().get_or_build((version, tuple(selection), kind), build)
+
+@st.cache_resource
+def get_consultation_queue():
+    """Worker pool running AI consultations off the script thread.
+    
+    Set AI_BACKEND_URL to use a model server (see market_research.stub_llm_server);
+    otherwise recommendations come from generate_ai_recommendation in-process.
+    """
+    backend_url = os.environ.get('AI_BACKEND_URL')
+    if backend_url:
+        backend = HttpBackend(backend_url, pool_size=CONSULTATION_WORKERS)
+    else:
+        from market_research.engine import generate_ai_recommendation
+
+        # Bind the index here: workers run outside the Streamlit script context
+        backend = LocalBackend(functools.partial(generate_ai_recommendation, text_index=get_text_index()))
+    backend = CachedBackend(backend, get_recommendation_cache())
+    return ConsultationQueue(backend, max_workers=CONSULTATION_WORKERS)
+
+@st.cache_resource
+def get_recommendation_cache():
+    """Recommendations keyed on normalized inputs, dropped when the catalog changes.
+    
+    Set RECOMMENDATION_CACHE_PATH to also keep entries in an SQLite file.
+    """
+    cache = RecommendationCache(maxsize=RECOMMENDATION_CACHE_SIZE, ttl=RECOMMENDATION_CACHE_TTL,
+                                path=os.environ.get('RECOMMENDATION_CACHE_PATH'))
+    get_catalog_store().add_listener(cache)
+    return cache
+
+@st.cache_resource
+def get_vendor_refresher():
+    """Vendor data refresh running off the script thread; None unless VENDOR_DATA_URL is set.
+    
+    Set VENDOR_REFRESH_INTERVAL (seconds) to also refresh periodically.
+    """
+    url_template = os.environ.get('VENDOR_DATA_URL')
+    if not url_template:
+        return None
+    refresher = VendorRefresher(get_catalog_store(), url_template)
+    interval = os.environ.get('VENDOR_REFRESH_INTERVAL')
+    if interval:
+        refresher.schedule(float(interval))
+    return refresher
+
+@st.cache_resource
+def get_render_metrics():
+    """Render timings shared by all sessions.
+    
+    Set METRICS_PORT to also serve them for Prometheus on http://<host>:<port>/metrics,
+    where the host is METRICS_HOST (default 127.0.0.1).
+    """
+    metrics = RenderMetrics()
+    port = os.environ.get('METRICS_PORT')
+    if port:
+        # Bind the objects here: the metrics server thread has no script context
+        serve_metrics(functools.partial(collect_metrics, metrics, get_catalog_store(),
+                                        get_figure_cache(), get_recommendation_cache(),
+                                        get_browser_cache()), int(port),
+                      os.environ.get('METRICS_HOST', '127.0.0.1'))
+    return metrics
+
+def collect_metrics(metrics, store, figure_cache, recommendation_cache, browser_cache):
+    """All samples for the Prometheus exposition"""
+    yield from metrics.samples()
+    yield Sample('app_catalog_products', 'gauge', 'Live products in the catalog', len(store))
+    yield Sample('app_catalog_version', 'gauge', 'Catalog version', store.version)
+    yield Sample('app_catalog_tombstones', 'gauge', 'Deleted rows awaiting compaction', store.tombstones)
+    for name, cache in (('figures', figure_cache), ('recommendations', recommendation_cache),
+                        ('browser', browser_cache)):
+        labels = (('cache', name),)
+        yield Sample('app_cache_hits_total', 'counter', 'Cache hits', cache.hits, labels)
+        yield Sample('app_cache_misses_total', 'counter', 'Cache misses', cache.misses, labels)
+
+def profile_section(name):
+    """Time a block into the shared render metrics; a no-op unless APP_PROFILING=1."""
+    if not PROFILING_ENABLED:
+        return NULL_SECTION
+    return get_render_metrics().section(name)
@@ -0,0 +1,13 @@
+"""AppTest entry point for the benchmarks: the market research page on its own."""
+import sys
+from pathlib import Path
+
+import streamlit as st
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from app_pages.market_research import market_research_page  # noqa: E402
+
+# Normally done by streamlit_app.py on every rerun
+st.session_state.setdefault('market_research', {})
+
+market_research_page()
@@ -0,0 +1,236 @@
+"""Benchmark the market research page on synthetic catalogs.
+
+Each scale tier generates a catalog into a temporary SQLite file, then drives
+the page headlessly with Streamlit's AppTest: cold and warm renders, creating
+and searching a survey, comparing products and re-rendering after a catalog
+write. Per-section render times come from the app's own profiling metrics
+(APP_PROFILING). Exports and batch survey scoring are timed directly.
+
+    python -m benchmarks.bench_app --tier small
+    python -m benchmarks.bench_app --tier 10000 --tier medium --repeat 5
+    python -m benchmarks.bench_app --compare old.json new.json
+
+Results are written as JSON (one file per tier) so runs from different
+commits can be compared with ``--compare``.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ['APP_PROFILING'] = '1'
+
+from benchmarks.synthetic_catalog import CATEGORIES, populate_store  # noqa: E402
+
+TIERS = {'small': 10_000, 'medium': 100_000, 'large': 1_000_000}
+EXPORT_FORMATS = ('csv', 'xlsx', 'parquet')
+REGRESSION_THRESHOLD = 1.2
+ROOT = Path(__file__).resolve().parent.parent
+DRIVER = Path(__file__).resolve().parent / 'app_driver.py'
+
+
+class Recorder:
+    """Collects named timings across repeats."""
+
+    def __init__(self):
+        self.runs: Dict[str, List[float]] = {}
+
+    def add(self, name: str, seconds: float):
+        self.runs.setdefault(name, []).append(seconds)
+
+    def time(self, name: str, fn: Callable[[], object]):
+        start = time.perf_counter()
+        result = fn()
+        self.add(name, time.perf_counter() - start)
+        return result
+
+    def summary(self) -> Dict[str, dict]:
+        return {name: {'median': statistics.median(runs), 'min': min(runs), 'runs': runs}
+                for name, runs in self.runs.items()}
+
+
+def run_tier(products: int, repeat: int, exports, timeout: float) -> Dict[str, dict]:
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    from market_research.batch_scoring import ProductMatrix, score_surveys
+    from market_research.catalog import PRODUCT_FIELDS, CatalogStore
+    from market_research.export import export_rows
+    from market_research.frame import CatalogFrame
+
+    recorder = Recorder()
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'catalog.db')
+        recorder.time('load_catalog', lambda: populate_store(CatalogStore(db_path, seed=None), products))
+        os.environ['CATALOG_DB_PATH'] = db_path
+        st.cache_resource.clear()
+
+        at = AppTest.from_file(str(DRIVER), default_timeout=timeout)
+
+        def render(name):
+            recorder.time(name, at.run)
+            if at.exception:
+                raise RuntimeError(f'{name}: {at.exception[0].message}')
+            from app_pages import resources
+
+            for stats in resources.get_render_metrics().sections():
+                recorder.add(f'{name}/{stats.name}', stats.last)
+            return resources
+
+        resources = render('cold_render')
+        for _ in range(repeat):
+            render('warm_render')
+
+        at.text_input[0].input('Benchmark survey')
+        at.selectbox[0].select('CRM')
+        at.multiselect[0].set_value(['Cloud'])
+        at.text_area[0].input('Quản lý khách hàng, email marketing và báo cáo bán hàng')
+        _button(at, 'Tạo Khảo sát').click()
+        render('survey_create')
+        _button(at, 'Tìm kiếm Phần mềm').click()
+        render('survey_search')
+
+        # The comparison picker takes product ids offered by the name typeahead
+        store = resources.get_catalog_store()
+        chosen = []
+        for product_id in resources.get_catalog_frame().df['id'].head(4).tolist():
+            at.text_input(key='comparison_query').set_value(store.get(product_id)['name'])
+            render('comparison_search')
+            chosen.append(product_id)
+            _multiselect(at, 'Chọn phần mềm').set_value(chosen)
+        render('comparison')
+
+        sample = dict(store.get(next(iter(store.snapshot().products()))['id']))
+        sample['name'] += ' (bench)'
+        recorder.time('catalog_write', lambda: store.add_product(sample))
+        render('render_after_write')
+
+        snapshot = store.snapshot()
+        columns = ['id'] + list(PRODUCT_FIELDS)
+        for fmt in exports:
+            for _ in range(repeat):
+                recorder.time(f'export_{fmt}', lambda: export_rows(snapshot.products(), columns, fmt).read())
+
+        recorder.time('frame_build', lambda: CatalogFrame(snapshot))
+        matrix = recorder.time('matrix_build', lambda: ProductMatrix(resources.get_catalog_frame()))
+        surveys = _surveys(100)
+        for _ in range(repeat):
+            recorder.time('batch_score_100_surveys', lambda: score_surveys(matrix, surveys, k=50))
+        index = resources.get_search_index()
+        for _ in range(repeat):
+            recorder.time('index_search', lambda: index.search('CRM', ['Cloud'], True, '100-500 triệu VNĐ',
+                                                               '50-200 nhân viên', k=50))
+        st.cache_resource.clear()  # release the catalog before the temp dir goes
+    return recorder.summary()
+
+
+def compare(old_path: str, new_path: str, threshold: float) -> int:
+    """Print median timings side by side; returns the number of regressions."""
+    old, new = (json.loads(Path(path).read_text()) for path in (old_path, new_path))
+    print(f"{'benchmark':48} {old.get('commit', '')[:8]:>10} {new.get('commit', '')[:8]:>10}  ratio")
+    regressions = 0
+    for name in sorted(set(old['results']) | set(new['results'])):
+        before = old['results'].get(name, {}).get('median')
+        after = new['results'].get(name, {}).get('median')
+        if before is None or after is None:
+            print(f'{name:48} {_ms(before):>10} {_ms(after):>10}')
+            continue
+        ratio = after / before if before else float('inf')
+        flag = '  REGRESSION' if ratio > threshold else ''
+        regressions += bool(flag)
+        print(f'{name:48} {_ms(before):>10} {_ms(after):>10}  {ratio:5.2f}{flag}')
+    return regressions
+
+
+def _button(at, label):
+    return next(button for button in at.button if label in button.label)
+
+
+def _multiselect(at, label):
+    return next(widget for widget in at.multiselect if widget.label.startswith(label))
+
+
+def _surveys(n: int) -> List[dict]:
+    rng = random.Random(0)
+    from market_research.pricing import BUDGET_RANGES, COMPANY_HEADCOUNT
+
+    return [{
+        'category': rng.choice(list(CATEGORIES)),
+        'deployment_preference': rng.sample(['Cloud', 'On-premise', 'Hybrid'], rng.randint(0, 2)),
+        'priority_features': rng.choice([[], ['Local support']]),
+        'budget_range': rng.choice(list(BUDGET_RANGES)),
+        'company_size': rng.choice(list(COMPANY_HEADCOUNT)),
+    } for _ in range(n)]
+
+
+def _ms(seconds) -> str:
+    return '-' if seconds is None else f'{seconds * 1000:.1f}ms'
+
+
+def _commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tier', action='append',
+                        help=f"scale tier: {', '.join(f'{k} ({v:,})' for k, v in TIERS.items())} "
+                             'or a product count; repeatable (default: small)')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--exports', default=','.join(EXPORT_FORMATS),
+                        help='comma-separated export formats to time ("" for none)')
+    parser.add_argument('--timeout', type=float, default=600, help='seconds allowed per AppTest run')
+    parser.add_argument('--out-dir', default=str(ROOT / 'benchmarks' / 'results'))
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='flag medians slower than OLD by this factor')
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return 1 if compare(*args.compare, args.threshold) else 0
+
+    logging.disable(logging.WARNING)  # AppTest runs without a server; its warnings are noise here
+    import streamlit
+
+    commit = _commit()
+    exports = [fmt for fmt in args.exports.split(',') if fmt]
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for tier in args.tier or ['small']:
+        products = TIERS[tier] if tier in TIERS else int(tier)
+        print(f'== {tier}: {products:,} products', flush=True)
+        results = run_tier(products, args.repeat, exports, args.timeout)
+        for name, result in results.items():
+            print(f"{name:48} {_ms(result['median']):>10}")
+        report = {
+            'tier': tier,
+            'products': products,
+            'commit': commit,
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'streamlit': streamlit.__version__,
+            'repeat': args.repeat,
+            'results': results,
+        }
+        path = out_dir / f'{tier}-{commit[:8]}.json'
+        path.write_text(json.dumps(report, indent=2))
+        print(f'wrote {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""Benchmark the vendor data refresh against the local stub vendor server.
+
+Generates a catalog with one vendor per ``--products-per-vendor`` products,
+serves it from market_research.stub_vendor_server with a simulated network
+latency and error rate, then times a full refresh, a revalidation pass
+(all 304s) and a pass after a share of vendors changed their data.
+
+    python -m benchmarks.bench_refresh --vendors 10000 --delay 0.05 --fail-rate 0.02
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.synthetic_catalog import generate_products
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vendors', type=int, default=10_000)
+    parser.add_argument('--products-per-vendor', type=int, default=2)
+    parser.add_argument('--delay', type=float, default=0.05, help='simulated latency per request (s)')
+    parser.add_argument('--fail-rate', type=float, default=0.02, help='share of requests answered 503')
+    parser.add_argument('--change-percent', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=64)
+    parser.add_argument('--per-host', type=int, default=64, help='the stub is a single host')
+    parser.add_argument('--port', type=int, default=8766)
+    args = parser.parse_args(argv)
+
+    from market_research.catalog import CatalogStore
+    from market_research.stub_vendor_server import load_vendors, serve
+    from market_research.vendor_refresh import VendorRefresher
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, 'catalog.db')
+        store = CatalogStore(db_path, seed=None)
+        products = list(generate_products(args.vendors * args.products_per_vendor))
+        for position, product in enumerate(products):
+            product['vendor'] = f'Vendor {position % args.vendors:05d}'
+        store.add_products(products)
+
+        stub = serve(load_vendors(db_path), port=args.port, delay=args.delay,
+                     fail_rate=args.fail_rate, change_percent=args.change_percent)
+        threading.Thread(target=stub.serve_forever, daemon=True).start()
+        refresher = VendorRefresher(store, f'http://127.0.0.1:{args.port}/vendors/{{vendor}}',
+                                    workers=args.workers, per_host=args.per_host, backoff=0.05)
+        print(f'{len(refresher.targets()):,} vendor URLs, {len(store):,} products')
+        for name in ('full', 'revalidate', 'changed'):
+            if name == 'changed':
+                stub.revision += 1
+            start = time.perf_counter()
+            job = refresher.run()
+            elapsed = time.perf_counter() - start
+            print(f'{name:12} {elapsed:8.1f}s  {job.completed / elapsed:7.0f} vendors/s  '
+                  f'fetched={job.fetched:,} not_modified={job.not_modified:,} '
+                  f'failed={job.failed:,} updated={job.updated:,}  [{job.status}]')
+        stub.shutdown()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
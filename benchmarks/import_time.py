@@ -0,0 +1,91 @@
+"""Measure cold-start import cost of the app and its pages.
+
+Every target is imported in a fresh interpreter, several times, and the
+median wall time is reported together with the cost on top of importing
+streamlit itself. ``streamlit_app`` is what every pod pays on start and on
+the first rerun; page modules are paid the first time a page is opened.
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 9 --detail streamlit_app
+
+``--detail`` prints the slowest modules from ``python -X importtime``.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+TARGETS = ['streamlit', 'streamlit_app', 'app_pages.market_research', 'app_pages.admin']
+ROOT = Path(__file__).resolve().parent.parent
+
+_PROBE = """
+import logging, sys, time
+logging.disable(logging.WARNING)
+start = time.perf_counter()
+try:
+    __import__(sys.argv[1])
+except ImportError:
+    print('nan'); raise SystemExit
+print(time.perf_counter() - start)
+"""
+
+
+def measure(module: str, repeat: int) -> Optional[float]:
+    """Median seconds to import ``module`` in a fresh interpreter; None if it does not exist."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE, module], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.split()
+        if not output or output[-1] == 'nan':
+            return None
+        runs.append(float(output[-1]))
+    return statistics.median(runs)
+
+
+def slowest_imports(module: str, n: int = 15) -> List[tuple]:
+    """(cumulative ms, module) of the ``n`` slowest imports triggered by ``module``."""
+    stderr = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'], cwd=ROOT,
+                            capture_output=True, text=True).stderr
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len('import time:'):].split('|'))
+        if cumulative.isdigit():
+            rows.append((int(cumulative) / 1000, name))
+    return sorted(rows, reverse=True)[:n]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('targets', nargs='*', default=TARGETS)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--detail', metavar='MODULE', help='print the slowest imports of MODULE')
+    parser.add_argument('--json', metavar='PATH', help='also write the results here')
+    args = parser.parse_args(argv)
+
+    results: Dict[str, Optional[float]] = {}
+    for target in args.targets:
+        results[target] = measure(target, args.repeat)
+    baseline = results.get('streamlit')
+    print(f"{'module':32} {'import':>10} {'over streamlit':>15}")
+    for target, seconds in results.items():
+        if seconds is None:
+            print(f'{target:32} {"-":>10}')
+            continue
+        extra = f'{(seconds - baseline) * 1000:+.0f}ms' if baseline is not None and target != 'streamlit' else ''
+        print(f'{target:32} {seconds * 1000:>8.0f}ms {extra:>15}')
+    if args.detail:
+        print(f'\nslowest imports under {args.detail} (cumulative):')
+        for ms, name in slowest_imports(args.detail):
+            print(f'{ms:10.1f}ms  {name}')
+    if args.json:
+        Path(args.json).write_text(json.dumps({'repeat': args.repeat, 'seconds': results}, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
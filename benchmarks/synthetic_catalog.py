@@ -0,0 +1,143 @@
+"""Synthetic software catalogs for benchmarking.
+
+Products have the same shape as the seed catalog (``software_database``):
+category, vendor, deployment list, category-specific features, pros/cons,
+rating, market share, free-text price string and Vietnam support. Output is
+deterministic for a given seed.
+
+    python -m benchmarks.synthetic_catalog --products 100000 --out catalog.jsonl
+    python -m benchmarks.synthetic_catalog --products 100000 --db catalog.db
+
+JSONL output can also be loaded through the database tab's bulk import.
+"""
+import argparse
+import json
+import random
+import sys
+from itertools import islice
+from typing import Dict, Iterator, List
+
+CATEGORIES = {
+    # category: (weight, feature vocabulary)
+    'ERP': (20, ['Financial Management', 'Supply Chain', 'Manufacturing', 'HR', 'Financials',
+                 'Inventory', 'Procurement', 'Order Management', 'E-commerce', 'Asset Management',
+                 'Multi-currency', 'Warehouse Management']),
+    'CRM': (20, ['Lead Management', 'Opportunity Management', 'Sales Analytics', 'Mobile App',
+                 'Contact Management', 'Deal Pipeline', 'Email Marketing', 'Reports',
+                 'Customer Service', 'Marketing Automation', 'Call Center', 'Quotes']),
+    'HR': (15, ['Core HR', 'Payroll', 'Talent Management', 'Analytics', 'Recruiting',
+                'Time Tracking', 'Performance Reviews', 'Learning Management', 'Benefits',
+                'Employee Self-service']),
+    'Accounting': (15, ['General Ledger', 'Invoicing', 'Accounts Payable', 'Accounts Receivable',
+                        'Tax Compliance', 'E-invoice', 'Bank Reconciliation', 'Budgeting',
+                        'Fixed Assets', 'Financial Reports']),
+    'Project Management': (10, ['Task Management', 'Gantt Charts', 'Kanban Boards', 'Time Tracking',
+                                'Resource Planning', 'Collaboration', 'Document Sharing',
+                                'Milestones', 'Portfolio Management']),
+    'BI/Analytics': (10, ['Dashboards', 'Data Visualization', 'Ad-hoc Reports', 'Data Warehouse',
+                          'ETL', 'Self-service Analytics', 'Predictive Analytics',
+                          'Embedded Analytics']),
+    'Other': (10, ['Document Management', 'Workflow Automation', 'E-signature', 'Helpdesk',
+                   'Chat', 'Integration', 'API']),
+}
+PROS = ['Comprehensive functionality', 'Strong integration', 'Industry-specific solutions',
+        'Cloud-native', 'Scalable', 'Good for SMEs', 'Market leader', 'Extensive customization',
+        'Strong ecosystem', 'Free tier available', 'User-friendly', 'Good integration', 'Modern UI',
+        'Mobile-first', 'Strong analytics', 'Vietnamese interface', 'Fast implementation',
+        'Affordable', 'Good local support']
+CONS = ['High cost', 'Complex implementation', 'Steep learning curve', 'Limited customization',
+        'Can be expensive', 'Learning curve', 'Expensive', 'Complex for small businesses',
+        'Requires training', 'Limited advanced features in free tier', 'Implementation complexity',
+        'Limited integrations', 'Small partner network', 'Slow support']
+VENDOR_PREFIXES = ['Viet', 'Saigon', 'Hanoi', 'Global', 'Cloud', 'Smart', 'Data', 'Net', 'Soft',
+                   'Asia', 'Mekong', 'Lotus', 'Blue', 'Red', 'Nova', 'Prime', 'Apex', 'Orbit']
+VENDOR_SUFFIXES = ['Soft', 'Tech', 'Systems', 'Solutions', 'Labs', 'Software', 'Digital', 'Corp']
+NAME_WORDS = ['One', 'Plus', 'Pro', 'Suite', 'Cloud', 'Hub', 'Flow', 'Works', 'Base', 'Desk',
+              'Center', 'Link', 'Go', 'X', 'Max', 'Lite', 'Edge', 'Core']
+DEPLOYMENTS = [['Cloud'], ['Cloud'], ['Cloud', 'Hybrid'], ['On-premise'], ['On-premise', 'Hybrid'],
+               ['Cloud', 'On-premise'], ['Cloud', 'On-premise', 'Hybrid']]
+
+
+def generate_products(n: int, seed: int = 0) -> Iterator[dict]:
+    """Yield ``n`` realistic, uniquely named products."""
+    rng = random.Random(seed)
+    categories = list(CATEGORIES)
+    weights = [CATEGORIES[category][0] for category in categories]
+    vendors = [f'{prefix}{suffix}' for prefix in VENDOR_PREFIXES for suffix in VENDOR_SUFFIXES]
+    for i in range(n):
+        category = rng.choices(categories, weights)[0]
+        vendor = rng.choice(vendors)
+        features = CATEGORIES[category][1]
+        short_category = category.split('/')[0].split()[0]
+        yield {
+            'name': f'{vendor} {short_category} {rng.choice(NAME_WORDS)} {i + 1}',
+            'vendor': vendor,
+            'category': category,
+            'price_range': _price(rng),
+            'deployment': list(rng.choice(DEPLOYMENTS)),
+            'features': rng.sample(features, rng.randint(3, min(6, len(features)))),
+            'pros': rng.sample(PROS, 3),
+            'cons': rng.sample(CONS, rng.randint(2, 3)),
+            'rating': round(min(5.0, max(2.5, rng.gauss(4.1, 0.4))), 1),
+            'market_share': f'{rng.paretovariate(2.5) - 1:.1f}%',
+            'website': f'https://www.{vendor.lower()}.example/{i + 1}',
+            'support_vietnam': rng.random() < 0.35,
+        }
+
+
+def generate_catalog(n: int, seed: int = 0) -> Dict[str, List[dict]]:
+    """``n`` products grouped by category, in the seed catalog's shape."""
+    catalog: Dict[str, List[dict]] = {}
+    for product in generate_products(n, seed):
+        catalog.setdefault(product['category'], []).append(product)
+    return catalog
+
+
+def populate_store(store, n: int, seed: int = 0, batch_size: int = 10_000) -> int:
+    """Add ``n`` generated products to a CatalogStore in batches."""
+    products = generate_products(n, seed)
+    added = 0
+    while True:
+        batch = list(islice(products, batch_size))
+        if not batch:
+            return added
+        store.add_products(batch)
+        added += len(batch)
+
+
+def _price(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.35:
+        low = rng.choice([5, 10, 15, 25, 49, 99])
+        return f'{low}-{low * rng.choice([3, 5, 10])} USD/user/month'
+    if kind < 0.5:
+        return f'Free - {rng.choice([300, 600, 1200, 2400]):,} USD/month'
+    if kind < 0.65:
+        low = rng.choice([10, 20, 50, 100])
+        return f'{low * 1000:,}-{low * rng.choice([5, 10]) * 1000:,} USD'
+    if kind < 0.75:
+        low = rng.choice([50, 100, 150])
+        return f'{low}-{low * 3} USD/employee/year'
+    if kind < 0.9:
+        low = rng.choice([5, 10, 20, 50])
+        return f'{low}-{low * rng.choice([2, 4])} triệu VNĐ/năm'
+    return 'Liên hệ'
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--products', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('--out', help='write JSONL here ("-" for stdout)')
+    output.add_argument('--db', help='create or extend a catalog SQLite file')
+    args = parser.parse_args()
+    if args.db:
+        from market_research.catalog import CatalogStore
+
+        print(populate_store(CatalogStore(args.db, seed=None), args.products, args.seed), 'products added')
+    else:
+        out = sys.stdout if args.out == '-' else open(args.out, 'w', encoding='utf-8')
+        with out:
+            for product in generate_products(args.products, args.seed):
+                out.write(json.dumps(product, ensure_ascii=False) + '\n')
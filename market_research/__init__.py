@@ -0,0 +1 @@
+"""Backend for the market research pages: shared catalog, indexes and caches."""
@@ -0,0 +1,116 @@
+"""Market statistics maintained incrementally from catalog changes.
+
+Each add or delete adjusts a handful of counters and sums, so the cost of
+a write is proportional to the size of the product, not the catalog. The
+report reads a MarketSummary that is materialized at most once per catalog
+version.
+"""
+import heapq
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, NamedTuple, Tuple
+
+from market_research.catalog import DEPLOYMENT_MODELS
+
+
+class CategoryStats(NamedTuple):
+    category: str
+    count: int
+    avg_rating: float
+    vietnam_support_pct: float
+
+
+class MarketSummary(NamedTuple):
+    version: int
+    total: int
+    vietnam_support: int
+    avg_rating: float
+    categories: List[CategoryStats]
+    deployment_counts: Dict[str, int]
+    top_features: List[Tuple[str, int]]
+
+
+class _CategoryTotals:
+    __slots__ = ('count', 'rated', 'rating_sum', 'vietnam')
+
+    def __init__(self):
+        self.count = 0
+        self.rated = 0
+        self.rating_sum = 0.0
+        self.vietnam = 0
+
+
+class MarketAggregates:
+    """Catalog listener keeping the counters behind the market report."""
+
+    def __init__(self, top_n: int = 10):
+        self._lock = threading.Lock()
+        self._top_n = top_n
+        self.version = 0
+        self._total = 0
+        self._vietnam = 0
+        self._categories: Dict[str, _CategoryTotals] = defaultdict(_CategoryTotals)
+        self._deployment = Counter(dict.fromkeys(DEPLOYMENT_MODELS, 0))
+        self._features = Counter()
+        self._summary = None
+
+    def apply_changes(self, added: List[dict], removed: List[dict], version: int):
+        with self._lock:
+            for product in removed:
+                self._apply(product, -1)
+            for product in added:
+                self._apply(product, 1)
+            self.version = version
+
+    def summary(self) -> MarketSummary:
+        """Return the summary for the current version, computing it only after a change."""
+        summary = self._summary
+        if summary is not None and summary.version == self.version:
+            return summary
+        with self._lock:
+            if self._summary is None or self._summary.version != self.version:
+                self._summary = self._materialize()
+            return self._summary
+
+    def _apply(self, product: dict, sign: int):
+        self._total += sign
+        totals = self._categories[product['category']]
+        totals.count += sign
+        rating = product.get('rating')
+        if rating is not None:
+            totals.rated += sign
+            totals.rating_sum += sign * float(rating)
+        if product.get('support_vietnam'):
+            self._vietnam += sign
+            totals.vietnam += sign
+        if not totals.count:
+            del self._categories[product['category']]
+        for deployment in product.get('deployment') or ():
+            self._deployment[deployment] += sign
+        for feature in product.get('features') or ():
+            self._features[feature] += sign
+            if not self._features[feature]:
+                del self._features[feature]
+
+    def _materialize(self) -> MarketSummary:
+        categories = [
+            CategoryStats(
+                category,
+                totals.count,
+                round(totals.rating_sum / totals.rated, 1) if totals.rated else 0.0,
+                round(totals.vietnam / totals.count * 100, 1),
+            )
+            for category, totals in self._categories.items()
+        ]
+        # Mean of per-category means, as the report has always shown it.
+        category_means = [totals.rating_sum / totals.rated
+                          for totals in self._categories.values() if totals.rated]
+        return MarketSummary(
+            version=self.version,
+            total=self._total,
+            vietnam_support=self._vietnam,
+            avg_rating=sum(category_means) / len(category_means) if category_means else 0.0,
+            categories=categories,
+            deployment_counts=dict(self._deployment),
+            top_features=heapq.nlargest(self._top_n, self._features.items(), key=lambda item: item[1]),
+        )
@@ -0,0 +1,202 @@
+"""Headless batch API: JSONL survey and consultation requests in, JSONL results out.
+
+    python -m market_research.batch_api run surveys.jsonl > results.jsonl
+    python -m market_research.batch_api run - --top-k 20 < surveys.jsonl
+    python -m market_research.batch_api serve --port 8780
+    curl --data-binary @surveys.jsonl 'http://127.0.0.1:8780/batch?top_k=20'
+
+Each input line is a JSON object: a survey (has ``category``) or a
+consultation (has ``business_type`` / ``pain_points``); ``"type"`` may name
+the kind explicitly. ``id`` (or ``request_id``) is echoed back, defaulting
+to the line number. Output has one line per input line, in input order:
+
+    {"id": ..., "type": "survey", "catalog_version": 7, "results": [{"id": 3, "name": ..., "match_score": 55}, ...]}
+    {"id": ..., "type": "consultation", "recommendation": {...}}
+    {"id": ..., "error": "..."}
+
+Input is processed in chunks of CHUNK_SIZE lines. All surveys of a chunk are
+scored together in one pass over the product matrix, and each chunk's
+results are written as soon as it is done, so output streams while large
+files are still being read.
+"""
+import argparse
+import json
+import os
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from market_research.engine import SEARCH_TOP_K, ResearchEngine
+
+CHUNK_SIZE = 1000
+RESULT_FIELDS = ('id', 'name', 'vendor', 'category', 'price_range', 'match_score')
+
+
+def request_kind(request: dict) -> str:
+    kind = request.get('type')
+    if kind in ('survey', 'consultation'):
+        return kind
+    if request.get('category'):
+        return 'survey'
+    if request.get('business_type') or request.get('pain_points'):
+        return 'consultation'
+    raise ValueError('not a survey (no category) or a consultation (no business_type / pain_points)')
+
+
+def process_lines(engine: ResearchEngine, lines: Iterable, top_k: int = SEARCH_TOP_K,
+                  chunk_size: int = CHUNK_SIZE) -> Iterator[dict]:
+    """Answer each non-blank JSONL line (str or bytes) in order."""
+    numbered = ((number, line) for number, line in enumerate(lines, start=1) if line.strip())
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield from _process_chunk(engine, chunk, top_k)
+
+
+def _process_chunk(engine: ResearchEngine, chunk: List[Tuple[int, str]], top_k: int) -> Iterator[dict]:
+    answers, surveys = [], []
+    for number, line in chunk:
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('request is not a JSON object')
+            answer = {'id': request.get('id', request.get('request_id', number)), 'type': request_kind(request)}
+        except ValueError as e:
+            answers.append({'id': number, 'error': str(e)})
+            continue
+        if answer['type'] == 'survey':
+            surveys.append((len(answers), request))
+        else:
+            try:
+                answer['recommendation'] = engine.recommend(request)
+            except Exception as e:
+                answer['error'] = str(e)
+        answers.append(answer)
+
+    if surveys:
+        snapshot = engine.store.snapshot()
+        try:
+            rankings = engine.rank([request for _, request in surveys], top_k)
+        except Exception:
+            # A malformed survey fails the whole pass; fall back to one at a time
+            rankings = [_rank_one(engine, request, top_k) for _, request in surveys]
+        for (position, _), results in zip(surveys, rankings):
+            if isinstance(results, Exception):
+                answers[position]['error'] = str(results)
+                continue
+            answers[position]['catalog_version'] = results.version
+            answers[position]['results'] = [{field: product.get(field) for field in RESULT_FIELDS}
+                                            for product in results.resolve(snapshot)]
+    yield from answers
+
+
+def _rank_one(engine: ResearchEngine, request: dict, top_k: int):
+    try:
+        return engine.rank([request], top_k)[0]
+    except Exception as e:
+        return e
+
+
+class BatchHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if urlsplit(self.path).path != '/health':
+            self._reply(404, {'error': 'not found'})
+            return
+        store = self.server.engine.store
+        self._reply(200, {'status': 'ok', 'catalog_version': store.version, 'products': len(store)})
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        if url.path != '/batch':
+            self._reply(404, {'error': 'not found'})
+            return
+        try:
+            top_k = int(parse_qs(url.query).get('top_k', [SEARCH_TOP_K])[0])
+            length = int(self.headers['Content-Length'])
+        except (TypeError, ValueError):
+            self._reply(400, {'error': 'Content-Length and an integer top_k are required'})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        buffer = []
+        for answer in process_lines(self.server.engine, self._body_lines(length), top_k):
+            buffer.append(json.dumps(answer, ensure_ascii=False).encode() + b'\n')
+            if len(buffer) >= 100:
+                self._write_chunk(b''.join(buffer))
+                buffer.clear()
+        if buffer:
+            self._write_chunk(b''.join(buffer))
+        self.wfile.write(b'0\r\n\r\n')
+
+    def _body_lines(self, length: int) -> Iterator[bytes]:
+        while length > 0:
+            line = self.rfile.readline(length)
+            if not line:
+                return
+            length -= len(line)
+            yield line
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(b'%x\r\n%s\r\n' % (len(data), data))
+        self.wfile.flush()
+
+    def _reply(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(engine: ResearchEngine, host: str = '127.0.0.1', port: int = 8780) -> ThreadingHTTPServer:
+    """Create the server; call ``serve_forever()`` on it (e.g. in a thread)."""
+    server = ThreadingHTTPServer((host, port), BatchHandler)
+    server.daemon_threads = True
+    server.engine = engine
+    return server
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=os.environ.get('CATALOG_DB_PATH', 'catalog.db'))
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('SCORING_WORKERS', '1')),
+                        help='processes for scoring very large categories')
+    commands = parser.add_subparsers(dest='command', required=True)
+    run = commands.add_parser('run', help='answer a JSONL file ("-" for stdin) on stdout')
+    run.add_argument('input')
+    run.add_argument('--top-k', type=int, default=SEARCH_TOP_K)
+    http = commands.add_parser('serve', help='answer POST /batch requests over HTTP')
+    http.add_argument('--host', default='127.0.0.1')
+    http.add_argument('--port', type=int, default=8780)
+    args = parser.parse_args(argv)
+
+    from market_research.catalog import CatalogStore
+
+    engine = ResearchEngine(CatalogStore(args.db), workers=args.workers)
+    if args.command == 'serve':
+        serve(engine, args.host, args.port).serve_forever()
+        return 0
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    with source:
+        for number, answer in enumerate(process_lines(engine, source, args.top_k), start=1):
+            sys.stdout.write(json.dumps(answer, ensure_ascii=False) + '\n')
+            if number % CHUNK_SIZE == 0:
+                sys.stdout.flush()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
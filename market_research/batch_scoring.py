@@ -0,0 +1,137 @@
+"""Score many surveys against the whole catalog in one vectorized pass.
+
+Products are encoded once per catalog version as a ProductMatrix:
+category codes, a deployment multi-hot block, the Vietnam-support flag and
+annual price terms. Surveys are encoded as a deployment-preference matrix,
+a local-support flag and a (headcount, budget min, budget max) row, so
+every survey x product score in a category is a matrix product plus a few
+broadcast comparisons, followed by a top-k selection. Scoring matches
+``SearchIndex.search``: same points, ties broken by ascending product id.
+
+Very large categories can be split into column shards scored in a process
+pool (``workers > 1``).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from market_research.pricing import COMPANY_HEADCOUNT, budget_bounds
+from market_research.search_index import BUDGET_SCORE, DEPLOYMENT_SCORE, LOCAL_SUPPORT_SCORE
+
+# Upper bound on survey x product cells scored at once, to cap peak memory.
+CHUNK_CELLS = 4_000_000
+# Categories smaller than this are never sharded across processes.
+SHARD_MIN_PRODUCTS = 200_000
+
+Ranking = List[Tuple[int, int]]
+
+
+class ProductMatrix:
+    """Feature matrices for one catalog version, grouped by category."""
+
+    def __init__(self, frame):
+        self.version = frame.version
+        self.deployment_models = list(frame.deployment.columns)
+        codes = frame.df['category'].cat.codes.to_numpy()
+        ids = frame.df['id'].to_numpy()
+        deployment = frame.deployment.to_numpy(dtype=np.float32)
+        vietnam = frame.df['support_vietnam'].to_numpy()
+        self.groups: Dict[str, Tuple[np.ndarray, ...]] = {}
+        for code, category in enumerate(frame.df['category'].cat.categories):
+            rows = np.flatnonzero(codes == code)
+            rows = rows[np.argsort(ids[rows], kind='stable')]
+            self.groups[category] = (ids[rows], deployment[rows], vietnam[rows], frame.price_terms[rows])
+
+    def encode_preferences(self, deployments: Sequence[str]) -> np.ndarray:
+        return np.array([model in deployments for model in self.deployment_models], dtype=np.float32)
+
+    @staticmethod
+    def encode_budget(survey: dict) -> Tuple[float, float, float]:
+        """(headcount, budget min, budget max); NaN when the survey has no budget."""
+        headcount = COMPANY_HEADCOUNT.get(survey.get('company_size'))
+        bounds = budget_bounds(survey.get('budget_range'))
+        if headcount is None or bounds is None:
+            return np.nan, np.nan, np.nan
+        return (headcount,) + bounds
+
+
+def score_surveys(matrix: ProductMatrix, surveys: List[dict],
+                  boosts: Optional[List[Dict[int, int]]] = None,
+                  k: Optional[int] = None, workers: int = 1) -> List[Ranking]:
+    """Rank the catalog for every survey; returns ``[(product_id, score), ...]`` per survey."""
+    boosts = boosts or [{} for _ in surveys]
+    rankings: List[Ranking] = [[] for _ in surveys]
+    by_category: Dict[str, List[int]] = {}
+    for position, survey in enumerate(surveys):
+        by_category.setdefault(survey['category'], []).append(position)
+
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for category, positions in by_category.items():
+            if category not in matrix.groups:
+                continue
+            ids = matrix.groups[category][0]
+            preferences = np.stack([matrix.encode_preferences(surveys[p]['deployment_preference'])
+                                    for p in positions])
+            local = np.array(['Local support' in surveys[p]['priority_features'] for p in positions])
+            budgets = np.array([matrix.encode_budget(surveys[p]) for p in positions], dtype=float)
+            chunk = max(1, CHUNK_CELLS // max(len(ids), 1))
+            for start in range(0, len(positions), chunk):
+                block = positions[start:start + chunk]
+                args = (preferences[start:start + chunk], local[start:start + chunk],
+                        budgets[start:start + chunk], [boosts[p] for p in block])
+                if executor is not None and len(ids) >= SHARD_MIN_PRODUCTS:
+                    results = _score_sharded(executor, workers, args, matrix.groups[category], k)
+                else:
+                    results = _score_block(*args, *matrix.groups[category], k)
+                for position, ranking in zip(block, results):
+                    rankings[position] = ranking
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return rankings
+
+
+def _score_block(preferences, local, budgets, boosts, ids, deployment, vietnam, prices, k) -> List[Ranking]:
+    """Score a block of surveys against one category's products."""
+    scores = np.where(preferences @ deployment.T > 0, DEPLOYMENT_SCORE, 0).astype(np.int32)
+    scores += np.outer(local, vietnam).astype(np.int32) * LOCAL_SUPPORT_SCORE
+    # Annual cost interval [fixed + per_seat * headcount] overlapping the budget;
+    # NaN (unpriced product or no budget) compares False
+    headcount, budget_min, budget_max = (budgets[:, [i]] for i in range(3))
+    cost_min = prices[:, 0] + prices[:, 2] * headcount
+    cost_max = prices[:, 1] + prices[:, 3] * headcount
+    scores += ((cost_min <= budget_max) & (cost_max >= budget_min)).astype(np.int32) * BUDGET_SCORE
+    for row, survey_boosts in enumerate(boosts):
+        if survey_boosts:
+            boost_ids = np.fromiter(survey_boosts, dtype=ids.dtype, count=len(survey_boosts))
+            columns = np.searchsorted(ids, boost_ids)
+            found = (columns < len(ids)) & (ids[np.minimum(columns, len(ids) - 1)] == boost_ids)
+            scores[row, columns[found]] += np.fromiter(survey_boosts.values(), dtype=np.int32)[found]
+
+    # Higher score first, then lower id (ids are sorted, so lower column).
+    n = scores.shape[1]
+    keys = scores.astype(np.int64) * (n + 1) - np.arange(n)
+    take = n if k is None else min(k, n)
+    rankings = []
+    for row in range(scores.shape[0]):
+        if take < n:
+            top = np.argpartition(-keys[row], take - 1)[:take]
+        else:
+            top = np.arange(n)
+        top = top[np.argsort(-keys[row, top])]
+        rankings.append(list(zip(ids[top].tolist(), scores[row, top].tolist())))
+    return rankings
+
+
+def _score_sharded(executor, workers, args, group, k) -> List[Ranking]:
+    """Split the products into column shards, score in processes and merge top-k."""
+    bounds = np.linspace(0, len(group[0]), workers + 1, dtype=int)
+    futures = [executor.submit(_score_block, *args, *(column[lo:hi] for column in group), k)
+               for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+    merged = [[] for _ in args[0]]
+    for future in futures:
+        for row, ranking in enumerate(future.result()):
+            merged[row].extend(ranking)
+    return [sorted(ranking, key=lambda item: (-item[1], item[0]))[:k] for ranking in merged]
@@ -0,0 +1,241 @@
+"""Bulk catalog import from CSV, XLSX or JSONL.
+
+Files are read in batches; every row is validated and normalized, rejected
+rows are reported with a reason, and each batch of valid rows is committed
+with a single ``CatalogStore.add_products`` call, so indexes and aggregates
+are updated once per batch rather than once per row. Rows that look like a
+product already in the catalog (or earlier in the file) are imported but
+flagged in the report.
+"""
+import csv
+import io
+import json
+import time
+from itertools import islice
+from typing import BinaryIO, Callable, Iterator, List, Optional, Tuple, Union
+
+from market_research.text import fold
+
+IMPORT_FORMATS = ('csv', 'xlsx', 'jsonl')
+BATCH_SIZE = 1000
+MAX_REPORTED_REJECTS = 500
+REFRESHABLE_FIELDS = ('rating', 'market_share', 'website')
+
+DEPLOYMENT_ALIASES = {
+    'cloud': 'Cloud', 'saas': 'Cloud',
+    'on-premise': 'On-premise', 'on-premises': 'On-premise', 'on premise': 'On-premise',
+    'onpremise': 'On-premise', 'on-prem': 'On-premise',
+    'hybrid': 'Hybrid',
+}
+TRUE_VALUES = {'true', '1', 'yes', 'y', 'co', 'x', '✅'}
+FALSE_VALUES = {'false', '0', 'no', 'n', 'khong', '', '❌'}
+
+
+class ImportReport:
+    """Outcome of one import run."""
+
+    def __init__(self):
+        self.rows_read = 0
+        self.imported = 0
+        self.rejected: List[Tuple[int, str]] = []
+        self.rejected_count = 0
+        self.duplicates: List[Tuple[int, str, str, float]] = []
+        self.duplicate_count = 0
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed if self.elapsed else 0.0
+
+    def reject(self, row_number: int, reason: str):
+        self.rejected_count += 1
+        if len(self.rejected) < MAX_REPORTED_REJECTS:
+            self.rejected.append((row_number, reason))
+
+    def flag_duplicate(self, row_number: int, name: str, existing_name: str, similarity: float):
+        self.duplicate_count += 1
+        if len(self.duplicates) < MAX_REPORTED_REJECTS:
+            self.duplicates.append((row_number, name, existing_name, similarity))
+
+
+def detect_format(file_name: str) -> str:
+    extension = file_name.rsplit('.', 1)[-1].lower()
+    if extension == 'json':
+        extension = 'jsonl'
+    if extension not in IMPORT_FORMATS:
+        raise ValueError(f'unsupported import format: {extension}')
+    return extension
+
+
+def read_rows(file: BinaryIO, fmt: str) -> Iterator[Union[dict, str]]:
+    """Yield raw rows one at a time without loading the whole file.
+
+    JSONL rows are yielded as unparsed lines, blank ones included, so that
+    ``parse_row`` can reject a malformed line by its line number.
+    """
+    if fmt == 'csv':
+        text = io.TextIOWrapper(file, encoding='utf-8-sig', newline='')
+        try:
+            yield from csv.DictReader(text)
+        finally:
+            text.detach()  # leave the caller's file open
+    elif fmt == 'xlsx':
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+            for values in rows:
+                yield dict(zip(header, values))
+        finally:
+            workbook.close()
+    elif fmt == 'jsonl':
+        text = io.TextIOWrapper(file, encoding='utf-8')
+        try:
+            yield from text
+        finally:
+            text.detach()
+    else:
+        raise ValueError(f'unsupported import format: {fmt}')
+
+
+def parse_row(raw: Union[dict, str]) -> dict:
+    """A row from ``read_rows`` as a dict; raises ValueError for a line that is not a JSON object."""
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except ValueError as e:
+            raise ValueError(f'JSON không hợp lệ: {e}') from None
+    if not isinstance(raw, dict):
+        raise ValueError(f'dòng không phải đối tượng JSON: {type(raw).__name__}')
+    return raw
+
+
+def normalize_row(raw: dict) -> dict:
+    """Validate a raw row and return a catalog product; raises ValueError."""
+    product = {}
+    for field in ('name', 'vendor', 'category'):
+        value = _text(raw.get(field))
+        if not value:
+            raise ValueError(f'thiếu trường {field}')
+        product[field] = value
+    product['price_range'] = _text(raw.get('price_range'))
+    product['deployment'] = [_deployment(value) for value in _list(raw.get('deployment'))]
+    product['features'] = _list(raw.get('features'))
+    product['pros'] = _list(raw.get('pros'))
+    product['cons'] = _list(raw.get('cons'))
+    product['rating'] = _rating(raw.get('rating'))
+    product['market_share'] = _market_share(raw.get('market_share'))
+    product['website'] = _text(raw.get('website'))
+    product['support_vietnam'] = _flag(raw.get('support_vietnam'))
+    return product
+
+
+def import_catalog(store, file: BinaryIO, fmt: str, batch_size: int = BATCH_SIZE,
+                   progress: Optional[Callable[[ImportReport], None]] = None,
+                   duplicates: Optional[Callable[[dict], List[Tuple[int, float]]]] = None) -> ImportReport:
+    """Import ``file`` into ``store`` batch by batch and return a report.
+
+    ``duplicates`` (e.g. ``SimilarityIndex.duplicates``) is called with each
+    committed product and returns ``(product_id, similarity)`` of likely
+    duplicates; matches with an earlier product are flagged in the report.
+    """
+    report = ImportReport()
+    start = time.perf_counter()
+    rows = enumerate(read_rows(file, fmt), start=1)
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        valid, row_numbers = [], []
+        blank = 0
+        for row_number, raw in batch:
+            if isinstance(raw, str) and not raw.strip():
+                blank += 1
+                continue
+            try:
+                valid.append(normalize_row(parse_row(raw)))
+            except (ValueError, TypeError) as e:
+                report.reject(row_number, str(e))
+            else:
+                row_numbers.append(row_number)
+        product_ids = store.add_products(valid)
+        if duplicates is not None:
+            for row_number, product, product_id in zip(row_numbers, valid, product_ids):
+                _flag_duplicates(report, store, row_number, dict(product, id=product_id), duplicates)
+        report.rows_read += len(batch) - blank
+        report.imported += len(valid)
+        report.elapsed = time.perf_counter() - start
+        if progress is not None:
+            progress(report)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+
+def normalize_field(field: str, value):
+    """Validate and normalize a field listed in REFRESHABLE_FIELDS; raises ValueError."""
+    return _FIELD_NORMALIZERS[field](value)
+
+
+def _flag_duplicates(report: ImportReport, store, row_number: int, product: dict, duplicates):
+    # Each pair is reported once, on the later of the two products
+    for other_id, similarity in duplicates(product):
+        other = store.get(other_id)
+        if other_id < product['id'] and other is not None:
+            report.flag_duplicate(row_number, product['name'], other['name'], similarity)
+            return
+
+
+def _text(value) -> str:
+    return '' if value is None else str(value).strip()
+
+
+def _list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        items = value
+    else:
+        items = str(value).split(',')
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def _deployment(value: str) -> str:
+    try:
+        return DEPLOYMENT_ALIASES[fold(value)]
+    except KeyError:
+        raise ValueError(f'hình thức triển khai không hợp lệ: {value}') from None
+
+
+def _rating(value) -> float:
+    if _text(value) == '':
+        raise ValueError('thiếu đánh giá')
+    rating = float(str(value).replace(',', '.'))
+    if not 0.0 <= rating <= 5.0:
+        raise ValueError(f'đánh giá ngoài khoảng 0-5: {value}')
+    return round(rating, 1)
+
+
+def _market_share(value) -> str:
+    text = _text(value).rstrip('%').strip().replace(',', '.')
+    if not text:
+        return ''
+    share = float(text)
+    if not 0.0 <= share <= 100.0:
+        raise ValueError(f'thị phần ngoài khoảng 0-100%: {value}')
+    return f'{share:g}%'
+
+
+def _flag(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = fold(_text(value))
+    if text in TRUE_VALUES:
+        return True
+    if text in FALSE_VALUES:
+        return False
+    raise ValueError(f'giá trị hỗ trợ VN không hợp lệ: {value}')
+
+
+_FIELD_NORMALIZERS = {'rating': _rating, 'market_share': _market_share, 'website': _text}
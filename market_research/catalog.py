@@ -0,0 +1,320 @@
+"""Process-wide software catalog backed by SQLite.
+
+All Streamlit sessions share one CatalogStore. Reads go through immutable,
+versioned snapshots that share unchanged data with their predecessors;
+every mutation goes through the store's write methods and publishes a new
+snapshot atomically once it has committed.
+
+Derived structures (search indexes, aggregates) register as listeners and
+are kept in sync incrementally: after each committed write the store calls
+``listener.apply_changes(added, removed, version)`` with the affected
+products and the new catalog version.
+"""
+import json
+import sqlite3
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from market_research.pricing import parse_price
+from market_research.seed import SEED_CATALOG
+
+PRODUCT_FIELDS = (
+    'name', 'vendor', 'category', 'price_range', 'deployment', 'features',
+    'pros', 'cons', 'rating', 'market_share', 'website', 'support_vietnam',
+)
+DEPLOYMENT_MODELS = ['Cloud', 'On-premise', 'Hybrid']
+BLOCK_BITS = 10  # ids per snapshot block: 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    category TEXT NOT NULL,
+    data TEXT NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_products_category ON products (category);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _record(product: dict, product_id: Optional[int] = None) -> dict:
+    record = {field: product.get(field) for field in PRODUCT_FIELDS}
+    # Derived once per write; not persisted
+    record['price'] = parse_price(record['price_range'])
+    if product_id is not None:
+        record['id'] = product_id
+    return record
+
+
+class CatalogSnapshot:
+    """Immutable view of the catalog at a given version.
+
+    Products are grouped by category into blocks of ``2 ** BLOCK_BITS``
+    consecutive ids. ``evolve`` builds the next version by copying only the
+    blocks a write touches and sharing every other block with this snapshot,
+    so a write costs O(changed blocks) and readers still holding this
+    snapshot keep a consistent view for as long as they need it.
+
+    Records and blocks are shared between snapshots and sessions, so callers
+    must copy a product before modifying it.
+    """
+
+    __slots__ = ('version', '_blocks', '_by_category', '_size')
+
+    def __init__(self, version: int = 0, blocks: Optional[Dict[int, Dict[int, dict]]] = None,
+                 by_category: Optional[Dict[str, Dict[int, Dict[int, dict]]]] = None, size: int = 0):
+        self.version = version
+        # block number -> {id: record}, every category; for lookups by id
+        self._blocks = blocks if blocks is not None else {}
+        # category -> block number -> {id: record} in id order; for iteration
+        self._by_category = by_category if by_category is not None else {}
+        self._size = size
+
+    def get(self, product_id: int) -> Optional[dict]:
+        block = self._blocks.get(product_id >> BLOCK_BITS)
+        return block.get(product_id) if block is not None else None
+
+    def categories(self) -> List[str]:
+        return list(self._by_category)
+
+    def products(self, category: Optional[str] = None) -> Iterator[dict]:
+        """Products of one category, or of every category, in id order per category."""
+        if category is None:
+            groups = self._by_category.values()
+        else:
+            groups = (self._by_category.get(category, {}),)
+        for blocks in groups:
+            for block_no in sorted(blocks):
+                yield from blocks[block_no].values()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def evolve(self, version: int, added: Iterable[dict] = (), removed: Iterable[dict] = ()) -> 'CatalogSnapshot':
+        """Return the snapshot at ``version``: this one minus ``removed`` plus ``added``.
+
+        An update is its old record in ``removed`` and its new one in ``added``.
+        """
+        blocks: Dict[int, Dict[int, dict]] = {}
+        categories: Dict[str, Dict[int, Dict[int, dict]]] = {}
+        size = self._size
+
+        def writable(block_no, category=None):
+            if category is None:
+                block = blocks.get(block_no)
+                if block is None:
+                    block = blocks[block_no] = dict(self._blocks.get(block_no, {}))
+                return block
+            category_blocks = categories.get(category)
+            if category_blocks is None:
+                category_blocks = categories[category] = {}
+            block = category_blocks.get(block_no)
+            if block is None:
+                shared = self._by_category.get(category, {}).get(block_no, {})
+                block = category_blocks[block_no] = dict(shared)
+            return block
+
+        for record in removed:
+            product_id = record['id']
+            block_no = product_id >> BLOCK_BITS
+            if writable(block_no).pop(product_id, None) is not None:
+                size -= 1
+            writable(block_no, record['category']).pop(product_id, None)
+        for record in added:
+            product_id = record['id']
+            block_no = product_id >> BLOCK_BITS
+            block = writable(block_no)
+            size += product_id not in block
+            block[product_id] = record
+            writable(block_no, record['category'])[product_id] = record
+
+        new_blocks = dict(self._blocks)
+        for block_no, block in blocks.items():
+            if block:
+                new_blocks[block_no] = block
+            else:
+                new_blocks.pop(block_no, None)
+        new_by_category = dict(self._by_category)
+        for category, changed in categories.items():
+            category_blocks = dict(new_by_category.get(category, {}))
+            for block_no, block in changed.items():
+                if block:
+                    # Re-inserted ids land at the end; keep id order within the block
+                    category_blocks[block_no] = dict(sorted(block.items()))
+                else:
+                    category_blocks.pop(block_no, None)
+            if category_blocks:
+                new_by_category[category] = category_blocks
+            else:
+                new_by_category.pop(category, None)
+        return CatalogSnapshot(version, new_blocks, new_by_category, size)
+
+
+class CatalogStore:
+    """SQLite-backed catalog with a single write path.
+
+    Products are addressed by stable integer ids. Readers work on immutable
+    snapshots and never take the store lock: ``snapshot()`` and ``get()``
+    read the published snapshot, which a writer replaces with one reference
+    assignment only after its transaction has committed. Readers therefore
+    see either all of a bulk change or none of it. Writers are serialized
+    by the lock. Deleted rows are tombstoned on disk and physically removed
+    by ``compact()``, which runs automatically once ``compact_threshold``
+    tombstones have accumulated.
+
+    ``version`` identifies a snapshot and is the invalidation key for
+    everything derived from the catalog.
+    """
+
+    def __init__(self, path: str, seed: Optional[Dict[str, List[dict]]] = SEED_CATALOG,
+                 compact_threshold: int = 1000):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self._listeners = []
+        self.compact_threshold = compact_threshold
+        with self._lock, self._conn:
+            if path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(_SCHEMA)
+            columns = {row[1] for row in self._conn.execute('PRAGMA table_info(products)')}
+            if 'deleted' not in columns:
+                self._conn.execute('ALTER TABLE products ADD COLUMN deleted INTEGER NOT NULL DEFAULT 0')
+            version = self._read_version()
+            empty = self._conn.execute('SELECT 1 FROM products LIMIT 1').fetchone() is None
+            if empty and version == 0 and seed:
+                for sw_list in seed.values():
+                    for product in sw_list:
+                        self._insert(product)
+                version = self._write_version(version + 1)
+            self._snapshot = CatalogSnapshot().evolve(version, self._load_records())
+            self._tombstones = self._conn.execute(
+                'SELECT COUNT(*) FROM products WHERE deleted = 1').fetchone()[0]
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    @property
+    def tombstones(self) -> int:
+        return self._tombstones
+
+    def get(self, product_id: int) -> Optional[dict]:
+        """Return the live record for ``product_id`` (shared; do not modify)."""
+        return self._snapshot.get(product_id)
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return the latest published snapshot."""
+        return self._snapshot
+
+    def add_listener(self, listener):
+        """Register a listener and prime it with the current catalog."""
+        with self._lock:
+            snapshot = self._snapshot
+            listener.apply_changes(list(snapshot.products()), [], snapshot.version)
+            self._listeners.append(listener)
+
+    def add_product(self, product: dict) -> int:
+        """Insert a product and return its id."""
+        return self.add_products([product])[0]
+
+    def add_products(self, products: List[dict]) -> List[int]:
+        """Insert products in one transaction and one catalog version."""
+        if not products:
+            return []
+        with self._lock:
+            with self._conn:
+                product_ids = [self._insert(product) for product in products]
+                version = self._write_version(self.version + 1)
+            added = [_record(product, product_id) for product, product_id in zip(products, product_ids)]
+            self._publish(version, added, [])
+        return product_ids
+
+    def update_product(self, product_id: int, changes: dict) -> bool:
+        """Apply ``changes`` to one product. Returns False if it no longer exists."""
+        return bool(self.update_products({product_id: changes}))
+
+    def update_products(self, changes_by_id: Dict[int, dict]) -> List[int]:
+        """Apply per-product field changes in one transaction; returns the updated ids."""
+        with self._lock:
+            old = [record for record in map(self._snapshot.get, changes_by_id) if record is not None]
+            if not old:
+                return []
+            new = [_record(dict(record, **changes_by_id[record['id']]), record['id']) for record in old]
+            with self._conn:
+                self._conn.executemany(
+                    'UPDATE products SET category = ?, data = ? WHERE id = ?',
+                    [(record['category'], _dumps(record), record['id']) for record in new],
+                )
+                version = self._write_version(self.version + 1)
+            self._publish(version, new, old)
+        return [record['id'] for record in new]
+
+    def delete_product(self, product_id: int) -> bool:
+        """Delete a product by id. Returns False if it no longer exists."""
+        return bool(self.delete_products([product_id]))
+
+    def delete_products(self, product_ids: List[int]) -> List[int]:
+        """Tombstone products in one transaction; returns the ids actually deleted."""
+        with self._lock:
+            removed = [record for record in map(self._snapshot.get, dict.fromkeys(product_ids))
+                       if record is not None]
+            if not removed:
+                return []
+            with self._conn:
+                self._conn.executemany('UPDATE products SET deleted = 1 WHERE id = ?',
+                                       [(record['id'],) for record in removed])
+                version = self._write_version(self.version + 1)
+            self._tombstones += len(removed)
+            self._publish(version, [], removed)
+            if self._tombstones >= self.compact_threshold:
+                self.compact()
+        return [record['id'] for record in removed]
+
+    def compact(self) -> int:
+        """Physically remove tombstoned rows; returns how many were removed."""
+        with self._lock:
+            with self._conn:
+                removed = self._conn.execute('DELETE FROM products WHERE deleted = 1').rowcount
+            self._tombstones = 0
+        return removed
+
+    def _publish(self, version: int, added: List[dict], removed: List[dict]):
+        # Build aside, then swap in one assignment: readers see the old or the new snapshot
+        self._snapshot = self._snapshot.evolve(version, added, removed)
+        for listener in self._listeners:
+            listener.apply_changes(added, removed, version)
+
+    def _insert(self, product: dict) -> int:
+        data = _record(product)
+        cursor = self._conn.execute(
+            'INSERT INTO products (category, data) VALUES (?, ?)',
+            (data['category'], _dumps(data)),
+        )
+        return cursor.lastrowid
+
+    def _load_records(self) -> List[dict]:
+        return [_record(json.loads(data), product_id) for product_id, data in self._conn.execute(
+            'SELECT id, data FROM products WHERE deleted = 0 ORDER BY id')]
+
+    def _read_version(self) -> int:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _write_version(self, version: int) -> int:
+        # Persisted so that version-keyed caches stay valid across restarts.
+        # Part of the caller's transaction; published only once it commits.
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+            (str(version),),
+        )
+        return version
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps({field: record.get(field) for field in PRODUCT_FIELDS}, ensure_ascii=False)
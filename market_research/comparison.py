@@ -0,0 +1,80 @@
+"""Presence matrix behind the N-way software comparison.
+
+Features, pros, cons and deployment models of the compared products are
+encoded once as sparse (item, product) coordinates. Coverage statistics are
+bincounts over those coordinates, and the heatmap / pivot table is a dense
+boolean grid built from them, so comparing 50 products costs the same
+handful of vectorized operations as comparing two.
+"""
+from collections import Counter
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+PRESENCE_FIELDS = {
+    'features': 'Tính năng',
+    'pros': 'Ưu điểm',
+    'cons': 'Nhược điểm',
+    'deployment': 'Triển khai',
+}
+
+
+def product_labels(products: List[dict]) -> List[str]:
+    """One column label per product: 'name · vendor', plus the id where that is not unique."""
+    labels = [f"{product['name']} · {product['vendor']}" for product in products]
+    counts = Counter(labels)
+    return [f"{label} #{product['id']}" if counts[label] > 1 else label
+            for label, product in zip(labels, products)]
+
+
+class PresenceMatrix:
+    """Which of the compared products have each feature, pro, con and deployment model."""
+
+    def __init__(self, products: List[dict], fields: Dict[str, str] = PRESENCE_FIELDS):
+        self.ids = [product['id'] for product in products]
+        self.products = product_labels(products)
+        self.groups = list(fields.values())
+        columns, groups, labels = [], [], []
+        for column, product in enumerate(products):
+            for field, group in fields.items():
+                values = dict.fromkeys(product.get(field) or ())  # a product lists an item once
+                columns.extend([column] * len(values))
+                groups.extend([group] * len(values))
+                labels.extend(values)
+        self.product_codes = np.asarray(columns, dtype=np.int64)
+        self.item_codes, self.items = pd.MultiIndex.from_arrays(
+            [groups, labels], names=['Nhóm', 'Mục']).factorize()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def coverage(self) -> pd.DataFrame:
+        """Products having each item and their share, most common first within each group."""
+        counts = np.bincount(self.item_codes, minlength=len(self.items))
+        stats = pd.DataFrame({
+            'Số sản phẩm': counts,
+            'Độ phủ (%)': (counts / max(len(self.products), 1) * 100).round(1),
+        }, index=self.items)
+        return stats.iloc[self._order(counts)]
+
+    def product_coverage(self) -> pd.DataFrame:
+        """Items listed per product and group."""
+        groups = self.items.codes[0][self.item_codes] if len(self.items) else self.item_codes
+        counts = np.zeros((len(self.products), len(self.items.levels[0])), dtype=np.int64)
+        np.add.at(counts, (self.product_codes, groups), 1)
+        table = pd.DataFrame(counts, index=self.products, columns=self.items.levels[0])
+        return table.reindex(columns=[group for group in self.groups if group in table.columns])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dense item x product presence grid, rows in coverage order."""
+        grid = np.zeros((len(self.items), len(self.products)), dtype=bool)
+        grid[self.item_codes, self.product_codes] = True
+        counts = grid.sum(axis=1)
+        order = self._order(counts)
+        return pd.DataFrame(grid[order], index=self.items[order], columns=self.products)
+
+    def _order(self, counts: np.ndarray) -> np.ndarray:
+        group_rank = {group: rank for rank, group in enumerate(self.groups)}
+        groups = np.array([group_rank[group] for group in self.items.get_level_values(0)], dtype=np.int64)
+        return np.lexsort((-counts, groups))
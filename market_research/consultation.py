@@ -0,0 +1,171 @@
+"""Background execution of AI consultations.
+
+Consultations run on a bounded worker pool instead of the Streamlit script
+thread. Each submission gets a job id that sessions poll for progress,
+partial output and the final recommendation, and can cancel.
+
+Backends produce a stream of events (plain dicts):
+
+    {'type': 'progress', 'value': 0.4, 'message': '...'}
+    {'type': 'text', 'text': '...'}             # partial output
+    {'type': 'result', 'result': {...}}         # final recommendation
+"""
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+if TYPE_CHECKING:
+    import requests
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+FINISHED_STATES = (DONE, FAILED, CANCELLED)
+
+
+class QueueFullError(RuntimeError):
+    """Raised when too many consultations are already pending."""
+
+
+class LocalBackend:
+    """Runs a recommendation function in-process."""
+
+    def __init__(self, recommend: Callable[..., dict]):
+        self._recommend = recommend
+
+    def stream(self, request: dict) -> Iterator[dict]:
+        yield {'type': 'progress', 'value': 0.1, 'message': 'Đang phân tích yêu cầu'}
+        result = self._recommend(
+            request['business_type'], request['pain_points'],
+            request['integration_needs'], request['special_requirements'],
+        )
+        yield {'type': 'progress', 'value': 0.9, 'message': 'Đang tổng hợp khuyến nghị'}
+        yield {'type': 'result', 'result': result}
+
+
+class HttpBackend:
+    """Posts the request to a model server that streams newline-delimited JSON events."""
+
+    def __init__(self, url: str, timeout: float = 60.0, pool_size: int = 16,
+                 session: Optional['requests.Session'] = None):
+        self.url = url
+        self.timeout = timeout
+        if session is None:
+            import requests  # deferred: only needed when a model server is configured
+
+            # Keep one pooled connection per worker thread.
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self._session = session
+
+    def stream(self, request: dict) -> Iterator[dict]:
+        with self._session.post(self.url, json=request, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            for line in response.iter_lines(chunk_size=None):
+                if line:
+                    yield json.loads(line)
+
+
+class ConsultationJob:
+    __slots__ = ('id', 'request', 'status', 'progress', 'message', 'text',
+                 'result', 'error', 'created', 'finished', '_cancel', '_future')
+
+    def __init__(self, request: dict):
+        self.id = uuid.uuid4().hex
+        self.request = request
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = ''
+        self.text = ''
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+        self._cancel = threading.Event()
+        self._future = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATES
+
+
+class ConsultationQueue:
+    """Bounded worker pool running consultation jobs for all sessions."""
+
+    def __init__(self, backend, max_workers: int = 16, max_pending: int = 256,
+                 retention: float = 600.0):
+        self.backend = backend
+        self.max_pending = max_pending
+        self.retention = retention
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='consultation')
+        self._jobs: Dict[str, ConsultationJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, request: dict) -> str:
+        """Queue a consultation and return its job id."""
+        job = ConsultationJob(request)
+        with self._lock:
+            self._prune()
+            pending = sum(1 for other in self._jobs.values() if not other.done)
+            if pending >= self.max_pending:
+                raise QueueFullError(f'{pending} consultations already pending')
+            self._jobs[job.id] = job
+        job._future = self._executor.submit(self._run, job)
+        return job.id
+
+    def get(self, job_id: str) -> Optional[ConsultationJob]:
+        return self._jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation. Running jobs stop at their next event."""
+        job = self._jobs.get(job_id)
+        if job is None or job.done:
+            return False
+        job._cancel.set()
+        if job._future is not None and job._future.cancel():
+            self._finish(job, CANCELLED)
+        return True
+
+    def _run(self, job: ConsultationJob):
+        if job._cancel.is_set():
+            self._finish(job, CANCELLED)
+            return
+        job.status = RUNNING
+        try:
+            for event in self.backend.stream(job.request):
+                if job._cancel.is_set():
+                    self._finish(job, CANCELLED)
+                    return
+                kind = event.get('type')
+                if kind == 'progress':
+                    job.progress = float(event.get('value', job.progress))
+                    job.message = event.get('message', job.message)
+                elif kind == 'text':
+                    job.text += event.get('text', '')
+                elif kind == 'result':
+                    job.result = event['result']
+            if job.result is None:
+                raise RuntimeError('backend finished without a result')
+            job.progress = 1.0
+            self._finish(job, DONE)
+        except Exception as e:
+            job.error = str(e)
+            self._finish(job, FAILED)
+
+    def _finish(self, job: ConsultationJob, status: str):
+        job.status = status
+        job.finished = time.time()
+
+    def _prune(self):
+        cutoff = time.time() - self.retention
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.done and job.finished < cutoff]:
+            del self._jobs[job_id]
@@ -0,0 +1,177 @@
+"""Survey search and software recommendation, independent of the UI.
+
+The functions take the indexes they need as arguments, so the Streamlit
+pages call them with the process-wide indexes from ``app_pages.resources``.
+``ResearchEngine`` bundles a catalog with its own indexes for headless use
+(see ``market_research.batch_api``).
+
+A survey is a dict with ``category`` and optionally ``deployment_preference``,
+``priority_features``, ``budget_range``, ``company_size`` and
+``requirements``; a consultation has ``business_type``, ``pain_points``,
+``integration_needs`` and ``special_requirements``.
+"""
+import threading
+from typing import Dict, List, Optional
+
+from market_research.batch_scoring import ProductMatrix, score_surveys
+from market_research.search_index import SearchIndex
+from market_research.survey_results import SurveyResults
+from market_research.text_index import TextIndex
+
+SEARCH_TOP_K = 50
+TEXT_MATCH_SCORE = 30
+SURVEY_DEFAULTS = {
+    'deployment_preference': [],
+    'priority_features': [],
+    'budget_range': None,
+    'company_size': None,
+    'requirements': '',
+}
+CONSULTATION_FIELDS = ('business_type', 'pain_points', 'integration_needs', 'special_requirements')
+
+
+def normalize_survey(survey: dict) -> dict:
+    """``survey`` with missing optional criteria filled in; raises ValueError without a category."""
+    if not survey.get('category'):
+        raise ValueError('survey has no category')
+    return {**SURVEY_DEFAULTS, **{key: value for key, value in survey.items() if value is not None}}
+
+
+def text_match_points(text_index: TextIndex, text: str, category: Optional[str] = None) -> Dict[int, int]:
+    """Scale BM25 relevance of free text into 0..TEXT_MATCH_SCORE match points per product"""
+    relevance = text_index.scores(text, category) if text else {}
+    if not relevance:
+        return {}
+    best = max(relevance.values())
+    return {product_id: round(TEXT_MATCH_SCORE * score / best) for product_id, score in relevance.items()}
+
+
+def search_survey(search_index: SearchIndex, text_index: TextIndex, survey: dict,
+                  top_k: int = SEARCH_TOP_K) -> SurveyResults:
+    """Rank the catalog for one survey with the inverted index."""
+    ranking = search_index.rank(
+        survey['category'],
+        deployments=survey['deployment_preference'],
+        local_support='Local support' in survey['priority_features'],
+        budget_range=survey.get('budget_range'),
+        company_size=survey.get('company_size'),
+        boosts=text_match_points(text_index, survey.get('requirements', ''), survey['category']),
+        k=top_k,
+    )
+    return SurveyResults(ranking, search_index.version)
+
+
+def rank_surveys(matrix, text_index: TextIndex, surveys: List[dict], top_k: int = SEARCH_TOP_K,
+                 workers: int = 1) -> List[SurveyResults]:
+    """Rank the catalog for many surveys in one pass over a ProductMatrix."""
+    # Batches repeat the same requirements often; score each (text, category) once
+    points: Dict[tuple, Dict[int, int]] = {}
+    boosts = []
+    for survey in surveys:
+        key = (survey.get('requirements', ''), survey['category'])
+        if key not in points:
+            points[key] = text_match_points(text_index, *key)
+        boosts.append(points[key])
+    rankings = score_surveys(matrix, surveys, boosts=boosts, k=top_k, workers=workers)
+    return [SurveyResults(ranking, matrix.version) for ranking in rankings]
+
+
+def generate_ai_recommendation(business_type, pain_points, integration_needs, special_requirements,
+                               text_index):
+    """Generate AI recommendation based on input - This would use actual AI/LLM in production"""
+    # Mock AI recommendation logic
+    recommendations = []
+
+    # Full-text relevance of the described needs against the catalog
+    query = ' '.join([pain_points, integration_needs, special_requirements])
+    hits = text_index.search(query, k=3)
+    best = hits[0][1] if hits else 0
+    for software, relevance, terms in hits:
+        recommendations.append({
+            'name': software['name'],
+            'match_score': 60 + round(TEXT_MATCH_SCORE * relevance / best),
+            'rating': software['rating'],
+            'estimated_cost': software['price_range'],
+            'reason': f"Đáp ứng các nhu cầu: {', '.join(terms)}"
+        })
+
+    # Simple rule-based recommendation for demo
+    if business_type == 'Thương mại' and 'Oracle NetSuite' not in [rec['name'] for rec in recommendations]:
+        recommendations.append({
+            'name': 'Oracle NetSuite',
+            'match_score': 78,
+            'rating': 4.1,
+            'estimated_cost': '500 triệu - 2 tỷ VNĐ',
+            'reason': 'Giải pháp cloud tốt cho doanh nghiệp thương mại, tích hợp e-commerce'
+        })
+
+    # Ensure we have at least some recommendations
+    if not recommendations:
+        recommendations = [
+            {
+                'name': 'HubSpot CRM',
+                'match_score': 72,
+                'rating': 4.5,
+                'estimated_cost': '100-500 triệu VNĐ/năm',
+                'reason': 'Phù hợp cho doanh nghiệp SME, dễ sử dụng và có tier miễn phí'
+            }
+        ]
+
+    recommendations.sort(key=lambda rec: rec['match_score'], reverse=True)
+
+    return {
+        'top_recommendations': recommendations[:3],
+        'analysis': f"""
+        **Phân tích tình huống:**
+        - Loại hình: {business_type}
+        - Vấn đề chính: {pain_points}
+        - Yêu cầu tích hợp: {integration_needs}
+        
+        **Đánh giá:**
+        Dựa trên thông tin bạn cung cấp, AI khuyến nghị tập trung vào các giải pháp có khả năng tích hợp cao 
+        và phù hợp với quy mô doanh nghiệp của bạn.
+        """,
+        'considerations': """
+        **Những điểm cần lưu ý:**
+        - Nên thực hiện POC (Proof of Concept) trước khi đầu tư lớn
+        - Xem xét khả năng hỗ trợ và đào tạo người dùng
+        - Đánh giá tổng chi phí sở hữu (TCO) trong 3-5 năm
+        - Kiểm tra khả năng tuân thủ quy định pháp lý Việt Nam
+        """
+    }
+
+
+class ResearchEngine:
+    """A catalog with the indexes needed to answer surveys and consultations."""
+
+    def __init__(self, store, workers: int = 1):
+        self.store = store
+        self.workers = workers
+        self.search_index = SearchIndex()
+        self.text_index = TextIndex()
+        store.add_listener(self.search_index)
+        store.add_listener(self.text_index)
+        self._matrix = None
+        self._lock = threading.Lock()
+
+    def matrix(self):
+        """ProductMatrix of the latest snapshot, rebuilt once per catalog version."""
+        from market_research.frame import CatalogFrame  # pandas
+
+        snapshot = self.store.snapshot()
+        with self._lock:
+            if self._matrix is None or self._matrix.version != snapshot.version:
+                self._matrix = ProductMatrix(CatalogFrame(snapshot))
+            return self._matrix
+
+    def search(self, survey: dict, top_k: int = SEARCH_TOP_K) -> SurveyResults:
+        return search_survey(self.search_index, self.text_index, normalize_survey(survey), top_k)
+
+    def rank(self, surveys: List[dict], top_k: int = SEARCH_TOP_K) -> List[SurveyResults]:
+        """Score many surveys at once; much cheaper per survey than ``search`` for large batches."""
+        surveys = [normalize_survey(survey) for survey in surveys]
+        return rank_surveys(self.matrix(), self.text_index, surveys, top_k, self.workers)
+
+    def recommend(self, consultation: dict) -> dict:
+        return generate_ai_recommendation(*(consultation.get(field) or '' for field in CONSULTATION_FIELDS),
+                                          text_index=self.text_index)
@@ -0,0 +1,95 @@
+"""Chunked export of catalog rows to CSV, Excel and Parquet.
+
+Rows are consumed from an iterator and written in batches into a spooled
+temporary file that moves to disk past a few megabytes, so generating an
+export never holds the whole catalog as a DataFrame or base64 string.
+"""
+import csv
+import io
+import tempfile
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, List
+
+EXPORT_FORMATS = {
+    'csv': ('text/csv', '.csv'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', '.xlsx'),
+    'parquet': ('application/vnd.apache.parquet', '.parquet'),
+}
+CHUNK_ROWS = 5000
+SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def export_rows(rows: Iterable[dict], columns: List[str], fmt: str,
+                chunk_rows: int = CHUNK_ROWS) -> BinaryIO:
+    """Write ``rows`` in ``fmt`` and return the file rewound to the start."""
+    out = tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES)
+    batches = _batches(rows, columns, chunk_rows)
+    if fmt == 'csv':
+        _write_csv(batches, columns, out)
+    elif fmt == 'xlsx':
+        _write_xlsx(batches, columns, out)
+    elif fmt == 'parquet':
+        _write_parquet(batches, columns, out)
+    else:
+        raise ValueError(f'unknown export format: {fmt}')
+    out.seek(0)
+    return out
+
+
+def _batches(rows: Iterable[dict], columns: List[str], size: int) -> Iterator[List[list]]:
+    rows = iter(rows)
+    while True:
+        batch = [[_cell(row.get(column)) for column in columns] for row in islice(rows, size)]
+        if not batch:
+            return
+        yield batch
+
+
+def _cell(value):
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value)
+    return value
+
+
+def _write_csv(batches, columns, out):
+    # utf-8-sig so Excel opens Vietnamese text correctly
+    text = io.TextIOWrapper(out, encoding='utf-8-sig', newline='')
+    writer = csv.writer(text)
+    writer.writerow(columns)
+    for batch in batches:
+        writer.writerows(batch)
+    text.flush()
+    text.detach()
+
+
+def _write_xlsx(batches, columns, out):
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(columns)
+    for batch in batches:
+        for row in batch:
+            sheet.append(row)
+    workbook.save(out)
+
+
+def _write_parquet(batches, columns, out):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for batch in batches:
+            table = pa.Table.from_pylist(
+                [dict(zip(columns, row)) for row in batch],
+                schema=writer.schema if writer else None,
+            )
+            if writer is None:
+                writer = pq.ParquetWriter(out, table.schema)
+            writer.write_table(table)
+        if writer is None:
+            writer = pq.ParquetWriter(out, pa.schema([(column, pa.string()) for column in columns]))
+    finally:
+        if writer is not None:
+            writer.close()
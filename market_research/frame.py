@@ -0,0 +1,103 @@
+"""Column-oriented, pre-parsed view of a catalog snapshot.
+
+Numeric fields are parsed once when the frame is built, deployment models
+become a multi-hot boolean block and prices become annual VND cost terms, so
+the browser's filter and sort and the batch scorer work on arrays instead of
+walks over nested dicts.
+"""
+from functools import cached_property
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from market_research.catalog import DEPLOYMENT_MODELS
+
+SORT_COLUMNS = ('name', 'vendor', 'category', 'rating', 'market_share')
+
+
+def parse_market_share(values) -> np.ndarray:
+    """Parse strings like '22%' into floats; unparseable values become NaN."""
+    series = pd.Series(values, dtype='object').astype('string').str.strip().str.rstrip('%')
+    return pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+
+
+class CatalogFrame:
+    """Columnar encoding of one catalog snapshot."""
+
+    def __init__(self, snapshot):
+        self.version = snapshot.version
+        products = list(snapshot.products())
+
+        self.df = pd.DataFrame({
+            'id': np.fromiter((sw['id'] for sw in products), dtype=np.int64, count=len(products)),
+            'name': [sw['name'] for sw in products],
+            'vendor': [sw['vendor'] for sw in products],
+            'category': pd.Categorical([sw['category'] for sw in products],
+                                       categories=snapshot.categories()),
+            'price_range': [sw['price_range'] for sw in products],
+            'rating': pd.to_numeric(pd.Series([sw['rating'] for sw in products], dtype='object'),
+                                    errors='coerce').to_numpy(dtype=float),
+            'market_share': parse_market_share([sw['market_share'] for sw in products]),
+            'support_vietnam': np.fromiter((bool(sw['support_vietnam']) for sw in products),
+                                           dtype=bool, count=len(products)),
+            'website': [sw['website'] for sw in products],
+        })
+
+        deployment_rows, deployment_labels = _explode(products, 'deployment')
+        columns = DEPLOYMENT_MODELS + sorted(set(deployment_labels) - set(DEPLOYMENT_MODELS))
+        block = np.zeros((len(products), len(columns)), dtype=bool)
+        block[deployment_rows, pd.Index(columns).get_indexer(deployment_labels)] = True
+        self.deployment = pd.DataFrame(block, index=self.df.index, columns=columns)
+
+        # (fixed_min, fixed_max, per_seat_min, per_seat_max) VND/year; NaN if unpriced
+        self.price_terms = np.array([sw['price'].annual_terms() if sw.get('price') else (np.nan,) * 4
+                                     for sw in products], dtype=float).reshape(len(products), 4)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def positions(self, ids: Iterable[int]) -> np.ndarray:
+        """Row positions of product ids; -1 for ids not in this snapshot.
+
+        Rows are grouped by category, so ids are not sorted; the lookup goes
+        through a hashed id index built on first use.
+        """
+        return self._rows.get_indexer(np.fromiter(ids, dtype=np.int64))
+
+    @cached_property
+    def _rows(self) -> pd.Index:
+        return pd.Index(self.df['id'])
+
+    def query(self, category: Optional[str] = None, ids: Optional[Iterable[int]] = None,
+              sort: str = 'name', descending: bool = False) -> np.ndarray:
+        """Row positions matching the filters, in sort order.
+
+        ``ids`` restricts the result to those products, e.g. the matches of a name search.
+        """
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f'cannot sort by {sort}')
+        mask = np.ones(len(self.df), dtype=bool)
+        if category:
+            mask &= (self.df['category'] == category).to_numpy()
+        if ids is not None:
+            only = np.zeros(len(self.df), dtype=bool)
+            positions = self.positions(ids)
+            only[positions[positions >= 0]] = True
+            mask &= only
+        column = self.df[sort]
+        if pd.api.types.is_string_dtype(column):
+            column = column.str.lower()
+        order = column[mask].sort_values(ascending=not descending, kind='stable',
+                                         na_position='last').index
+        return order.to_numpy()
+
+
+def _explode(products: List[dict], field: str) -> Tuple[np.ndarray, List[str]]:
+    """Flatten a list-valued field into parallel (row, label) arrays."""
+    rows, labels = [], []
+    for row, sw in enumerate(products):
+        values = sw.get(field) or ()
+        rows.extend([row] * len(values))
+        labels.extend(values)
+    return np.asarray(rows, dtype=np.int64), labels
@@ -0,0 +1,263 @@
+"""Market analysis report generated as an XLSX workbook in a background process.
+
+The workbook has an overview sheet, a per-category sheet, deployment trends,
+top features and the full product listing, with native Excel charts. It is
+built in a child process from the products of one catalog snapshot, so a
+large catalog does not hold the GIL of the Streamlit server. Progress comes
+back over a queue:
+
+    ('progress', 0.4, 'message')
+    ('done', path)
+    ('error', message)
+
+Finished reports are kept as files named after the catalog version. A
+request for a version that already has a report returns it immediately.
+"""
+import multiprocessing
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from market_research.aggregates import MarketAggregates
+from market_research.catalog import DEPLOYMENT_MODELS
+from market_research.consultation import DONE, FAILED, FINISHED_STATES, QUEUED, RUNNING
+
+MARKET_REPORT_COLUMNS = ['Tên', 'Nhà cung cấp', 'Danh mục', 'Giá', 'Triển khai', 'Đánh giá',
+                         'Thị phần', 'Hỗ trợ VN', 'Website', 'Tính năng']
+REPORT_TOP_FEATURES = 20
+REPORTS_KEPT = 3
+PROGRESS_ROWS = 5000
+POLL_SECONDS = 0.5
+
+
+def market_report_rows(products) -> Iterator[dict]:
+    """Comprehensive market report, one row per product"""
+    for sw in products:
+        yield {
+            'Tên': sw['name'],
+            'Nhà cung cấp': sw['vendor'],
+            'Danh mục': sw['category'],
+            'Giá': sw['price_range'],
+            'Triển khai': ', '.join(sw['deployment']),
+            'Đánh giá': sw['rating'],
+            'Thị phần': sw['market_share'],
+            'Hỗ trợ VN': sw['support_vietnam'],
+            'Website': sw['website'],
+            'Tính năng': ', '.join(sw['features'][:3])  # Top 3 features
+        }
+
+
+def write_report(products: List[dict], version: int, out, progress=lambda value, message: None):
+    """Write the report workbook for ``products`` (one catalog version) to ``out``."""
+    from openpyxl import Workbook
+    from openpyxl.chart import BarChart, PieChart, Reference
+
+    progress(0.05, 'Đang tổng hợp số liệu')
+    aggregates = MarketAggregates(top_n=REPORT_TOP_FEATURES)
+    aggregates.apply_changes(products, [], version)
+    summary = aggregates.summary()
+    by_category: Dict[str, Counter] = defaultdict(Counter)
+    for product in products:
+        by_category[product['category']].update(product.get('deployment') or ())
+    categories = sorted(summary.categories, key=lambda stats: stats.count, reverse=True)
+
+    workbook = Workbook(write_only=True)
+
+    progress(0.1, 'Đang tạo trang tổng quan')
+    sheet = workbook.create_sheet('Tổng quan')
+    sheet.append(['Chỉ số', 'Giá trị'])
+    sheet.append(['Tổng số phần mềm', summary.total])
+    sheet.append(['Số danh mục', len(summary.categories)])
+    sheet.append(['Hỗ trợ VN', summary.vietnam_support])
+    sheet.append(['Đánh giá TB', round(summary.avg_rating, 2)])
+    sheet.append(['Phiên bản catalog', version])
+    sheet.append(['Thời điểm tạo', datetime.now().strftime('%d/%m/%Y %H:%M')])
+
+    progress(0.15, 'Đang phân tích theo danh mục')
+    sheet = workbook.create_sheet('Danh mục')
+    sheet.append(['Danh mục', 'Số lượng', 'Đánh giá TB', 'Hỗ trợ VN (%)'])
+    for stats in categories:
+        sheet.append(list(stats))
+    if categories:
+        rows = len(categories) + 1
+        labels = Reference(sheet, min_col=1, min_row=2, max_row=rows)
+        for column, title, anchor in ((2, 'Số lượng Phần mềm theo Danh mục', 'F2'),
+                                      (3, 'Đánh giá Trung bình theo Danh mục', 'F20')):
+            chart = BarChart()
+            chart.title = title
+            chart.add_data(Reference(sheet, min_col=column, min_row=1, max_row=rows), titles_from_data=True)
+            chart.set_categories(labels)
+            sheet.add_chart(chart, anchor)
+
+    progress(0.2, 'Đang phân tích xu hướng triển khai')
+    sheet = workbook.create_sheet('Triển khai')
+    sheet.append(['Hình thức', 'Số lượng'])
+    for deployment in DEPLOYMENT_MODELS:
+        sheet.append([deployment, summary.deployment_counts.get(deployment, 0)])
+    sheet.append([])
+    sheet.append(['Danh mục'] + DEPLOYMENT_MODELS)
+    for stats in categories:
+        counts = by_category[stats.category]
+        sheet.append([stats.category] + [counts[deployment] for deployment in DEPLOYMENT_MODELS])
+    pie = PieChart()
+    pie.title = 'Hình thức Triển khai'
+    pie.add_data(Reference(sheet, min_col=2, min_row=1, max_row=len(DEPLOYMENT_MODELS) + 1), titles_from_data=True)
+    pie.set_categories(Reference(sheet, min_col=1, min_row=2, max_row=len(DEPLOYMENT_MODELS) + 1))
+    sheet.add_chart(pie, 'F2')
+    if categories:
+        header = len(DEPLOYMENT_MODELS) + 3
+        stacked = BarChart()
+        stacked.type = 'col'
+        stacked.grouping = 'stacked'
+        stacked.overlap = 100
+        stacked.title = 'Hình thức Triển khai theo Danh mục'
+        stacked.add_data(Reference(sheet, min_col=2, max_col=len(DEPLOYMENT_MODELS) + 1,
+                                   min_row=header, max_row=header + len(categories)), titles_from_data=True)
+        stacked.set_categories(Reference(sheet, min_col=1, min_row=header + 1, max_row=header + len(categories)))
+        sheet.add_chart(stacked, 'F20')
+
+    progress(0.25, 'Đang thống kê tính năng')
+    sheet = workbook.create_sheet('Tính năng')
+    sheet.append(['Tính năng', 'Số phần mềm'])
+    for feature, count in summary.top_features:
+        sheet.append([feature, count])
+    if summary.top_features:
+        rows = len(summary.top_features) + 1
+        chart = BarChart()
+        chart.type = 'bar'
+        chart.title = f'Top {len(summary.top_features)} Tính năng Phổ biến'
+        chart.add_data(Reference(sheet, min_col=2, min_row=1, max_row=rows), titles_from_data=True)
+        chart.set_categories(Reference(sheet, min_col=1, min_row=2, max_row=rows))
+        chart.y_axis.scaling.orientation = 'minMax'
+        chart.x_axis.scaling.orientation = 'maxMin'  # most common feature on top
+        chart.height = max(7.5, rows * 0.6)
+        sheet.add_chart(chart, 'D2')
+
+    sheet = workbook.create_sheet('Danh sách')
+    sheet.append(MARKET_REPORT_COLUMNS)
+    for position, row in enumerate(market_report_rows(products), start=1):
+        sheet.append([row[column] for column in MARKET_REPORT_COLUMNS])
+        if position % PROGRESS_ROWS == 0:
+            progress(0.3 + 0.6 * position / len(products), f'Đang ghi danh sách: {position:,}/{len(products):,}')
+
+    progress(0.9, 'Đang lưu tệp Excel')
+    workbook.save(out)
+
+
+def _generate(products: List[dict], version: int, path: str, events):
+    """Child process entry point: write the report to ``path`` atomically."""
+    try:
+        partial = f'{path}.{os.getpid()}.tmp'
+        write_report(products, version, partial, lambda value, message: events.put(('progress', value, message)))
+        os.replace(partial, path)
+        events.put(('done', path))
+    except Exception as e:
+        events.put(('error', f'{type(e).__name__}: {e}'))
+
+
+class ReportJob:
+    """Progress of one report generation; read by the UI while it runs."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = ''
+        self.path: Optional[str] = None
+        self.error = None
+        self.started = time.time()
+        self.finished = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATES
+
+
+class MarketReportBuilder:
+    """Generates report workbooks off the server process and keeps them per catalog version."""
+
+    def __init__(self, directory: Optional[str] = None, keep: int = REPORTS_KEPT):
+        self.directory = directory or os.path.join(tempfile.gettempdir(), 'market_reports')
+        os.makedirs(self.directory, exist_ok=True)
+        self.keep = keep
+        self._jobs: Dict[int, ReportJob] = {}
+        self._lock = threading.Lock()
+
+    def path_for(self, version: int) -> str:
+        return os.path.join(self.directory, f'market_report_v{version}.xlsx')
+
+    def request(self, snapshot) -> ReportJob:
+        """The report job for ``snapshot``: finished if its version was already generated,
+        otherwise the running job or a newly started one."""
+        with self._lock:
+            job = self._get(snapshot.version)
+            if job is not None and job.status != FAILED:
+                return job
+            job = self._jobs[snapshot.version] = ReportJob(snapshot.version)
+        threading.Thread(target=self._run, args=(job, list(snapshot.products())),
+                         name='market-report', daemon=True).start()
+        return job
+
+    def get(self, version: int) -> Optional[ReportJob]:
+        """The job for ``version``, including a report generated before a restart."""
+        with self._lock:
+            return self._get(version)
+
+    def _get(self, version: int) -> Optional[ReportJob]:
+        job = self._jobs.get(version)
+        if job is None and os.path.exists(self.path_for(version)):
+            job = self._jobs[version] = ReportJob(version)
+            job.path, job.progress, job.status, job.finished = self.path_for(version), 1.0, DONE, time.time()
+        return job
+
+    def _run(self, job: ReportJob, products: List[dict]):
+        job.status = RUNNING
+        events = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_generate, name='market-report',
+                                          args=(products, job.version, self.path_for(job.version), events),
+                                          daemon=True)
+        try:
+            process.start()
+            while True:
+                try:
+                    event = events.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    if not process.is_alive():
+                        raise RuntimeError(f'report process exited with code {process.exitcode}')
+                    continue
+                if event[0] == 'progress':
+                    job.progress, job.message = event[1], event[2]
+                elif event[0] == 'done':
+                    job.path, job.progress = event[1], 1.0
+                    job.status = DONE
+                    break
+                else:
+                    raise RuntimeError(event[1])
+            process.join()
+            self._prune()
+        except Exception as e:
+            job.error = str(e)
+            job.status = FAILED
+        finally:
+            events.close()
+        job.finished = time.time()
+
+    def _prune(self):
+        """Drop all but the ``keep`` newest versions, on disk and in memory."""
+        with self._lock:
+            for version in sorted(self._jobs)[:-self.keep]:
+                if self._jobs[version].done:
+                    del self._jobs[version]
+        reports = sorted((name for name in os.listdir(self.directory)
+                          if name.startswith('market_report_v') and name.endswith('.xlsx')),
+                         key=lambda name: int(name[len('market_report_v'):-len('.xlsx')]))
+        for name in reports[:-self.keep]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
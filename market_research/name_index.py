@@ -0,0 +1,133 @@
+"""Typeahead index over product names and vendors.
+
+Names are folded (lowercase, no Vietnamese diacritics) and split into words.
+Each word is indexed by the 3-grams of the word padded with two leading
+spaces, so the first grams of a word double as 1- and 2-character prefixes:
+"sap" gives "  s", " sa" and "sap". A query is broken up the same way.
+Queries of one or two letters per word must match all their grams, which is
+a word-prefix search. Longer queries are matched on their inner grams (those
+without padding): a name needs most of them, so an infix or a typo still
+finds it, and the padded grams only add to the score. Results rank name
+prefixes first, then gram overlap, then shorter names.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from market_research.text import fold
+
+TYPEAHEAD_TOP_K = 20
+FUZZY_MATCH = 0.5  # share of the query's inner grams a name needs
+EXACT_GRAMS = 2  # ... but never fewer than this many
+
+_WORDS = re.compile(r'[^\W_]+')
+
+
+def name_grams(text: str) -> Set[str]:
+    """Padded word 3-grams of the folded ``text``."""
+    return _grams(fold(text))
+
+
+def _grams(folded: str) -> Set[str]:
+    grams = set()
+    for word in _WORDS.findall(folded):
+        padded = '  ' + word
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class NameIndex:
+    """Catalog listener mapping name and vendor n-grams to product ids."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = 0
+        self._names: Dict[int, Tuple[str, str]] = {}  # id -> (folded name, category)
+        self._grams: Dict[str, Set[int]] = defaultdict(set)
+        self._exact: Dict[str, Set[int]] = defaultdict(set)
+        self._vendors: Dict[Optional[str], frozenset] = {}
+
+    def apply_changes(self, added: List[dict], removed: List[dict], version: int):
+        with self._lock:
+            self.version = version
+            for product in removed:
+                self._remove(product)
+            for product in added:
+                self._add(product)
+
+    def lookup(self, name: str) -> Set[int]:
+        """Ids of the products named ``name``, ignoring case, diacritics and spacing."""
+        with self._lock:
+            return set(self._exact.get(fold(name), ()))
+
+    def matches(self, query: str, category: Optional[str] = None) -> Dict[int, float]:
+        """Every product whose name or vendor matches ``query``, with its share of the query's grams."""
+        grams = name_grams(query)
+        inner = {gram for gram in grams if gram[0] != ' '}
+        padded = grams - inner
+        if inner:
+            required = max(min(len(inner), EXACT_GRAMS), math.ceil(FUZZY_MATCH * len(inner)))
+        else:
+            inner, padded, required = padded, set(), len(padded)
+        counts = Counter()
+        with self._lock:
+            for gram in inner:
+                counts.update(self._grams.get(gram, ()))
+            hits = {product_id: count for product_id, count in counts.items()
+                    if count >= required and (category is None or self._names[product_id][1] == category)}
+            for gram in padded:
+                postings = self._grams.get(gram, ())
+                for product_id in hits:
+                    if product_id in postings:
+                        hits[product_id] += 1
+        return {product_id: count / len(grams) for product_id, count in hits.items()}
+
+    def search(self, query: str, k: int = TYPEAHEAD_TOP_K, category: Optional[str] = None) -> List[int]:
+        """The ``k`` best matching product ids for a partially typed name."""
+        matches = self.matches(query, category)
+        folded = fold(query)
+        with self._lock:
+            names = {product_id: self._names[product_id][0] for product_id in matches
+                     if product_id in self._names}
+
+        def rank(product_id):
+            name = names[product_id]
+            return (name.startswith(folded), matches[product_id], -len(name), -product_id)
+
+        return heapq.nlargest(k, names, key=rank)
+
+    def _add(self, product: dict):
+        product_id = product['id']
+        folded = fold(product.get('name') or '')
+        self._names[product_id] = (folded, product.get('category'))
+        self._exact[folded].add(product_id)
+        for gram in _grams(folded) | self._vendor_grams(product.get('vendor')):
+            self._grams[gram].add(product_id)
+
+    def _remove(self, product: dict):
+        product_id = product['id']
+        entry = self._names.pop(product_id, None)
+        if entry is None:
+            return
+        folded = entry[0]
+        _discard(self._exact, folded, product_id)
+        for gram in _grams(folded) | self._vendor_grams(product.get('vendor')):
+            _discard(self._grams, gram, product_id)
+
+    def _vendor_grams(self, vendor: Optional[str]) -> Set[str]:
+        # Many products share a vendor; fold and split each vendor name once
+        grams = self._vendors.get(vendor)
+        if grams is None:
+            grams = self._vendors[vendor] = frozenset(name_grams(vendor or ''))
+        return grams
+
+
+def _discard(index: Dict[str, Set[int]], key: str, product_id: int):
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(product_id)
+        if not ids:
+            del index[key]
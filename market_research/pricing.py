@@ -0,0 +1,191 @@
+"""Structured prices parsed from the free-text ``price_range`` field.
+
+Prices such as '99-499 USD/user/month' or 'Free - 1,200 USD/month' are
+parsed once, when a product enters the catalog, into a PriceQuote. A quote
+converts to an annual cost in VND as ``fixed + per_seat * headcount``, where
+the headcount comes from the survey's company size. PriceIndex keeps those
+annual cost intervals sorted per company size, both by lower and by upper
+bound, so "fits this budget" is an interval-overlap query.
+"""
+import bisect
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from market_research.text import fold
+
+CURRENCY_TO_VND = {'USD': 25_000, 'EUR': 27_000, 'VND': 1}
+PERIODS_PER_YEAR = {'month': 12, 'year': 1, None: 1}
+
+# Representative headcount for each company-size band of the survey form.
+COMPANY_HEADCOUNT = {
+    '< 50 nhân viên': 25,
+    '50-200 nhân viên': 100,
+    '200-1000 nhân viên': 500,
+    '> 1000 nhân viên': 2000,
+}
+BUDGET_RANGES = {
+    '< 100 triệu VNĐ': (0, 100e6),
+    '100-500 triệu VNĐ': (100e6, 500e6),
+    '500 triệu - 2 tỷ VNĐ': (500e6, 2e9),
+    '> 2 tỷ VNĐ': (2e9, float('inf')),
+}
+BULK_BATCH = 1000  # from this many changes on, rebuilding the sorted lists beats shifting them per item
+
+_NUMBER = re.compile(r'\d[\d.,]*')
+_THOUSANDS = re.compile(r'\d{1,3}(?:([.,])\d{3})(?:\1\d{3})*')
+_MULTIPLIERS = (('ty', 1e9), ('trieu', 1e6), ('tr', 1e6), ('k', 1e3))
+_CURRENCIES = ((r'usd|\$', 'USD'), (r'eur|€', 'EUR'),
+               (r'vnd|(?<![a-z])(dong|d|ty|trieu|tr)\b', 'VND'))
+_SEAT_UNITS = ('user', 'employee', 'seat', 'nguoi', 'nhan vien')
+_PERIODS = (('month', 'month'), ('/mo', 'month'), ('thang', 'month'),
+            ('year', 'year'), ('/yr', 'year'), ('nam', 'year'))
+
+
+class PriceQuote(NamedTuple):
+    min_price: float
+    max_price: float
+    currency: str
+    per_seat: bool
+    period: Optional[str]  # 'month', 'year' or None for a one-off price
+
+    def annual_terms(self) -> Tuple[float, float, float, float]:
+        """(fixed_min, fixed_max, per_seat_min, per_seat_max) in VND per year."""
+        factor = CURRENCY_TO_VND[self.currency] * PERIODS_PER_YEAR[self.period]
+        low, high = self.min_price * factor, self.max_price * factor
+        return (0.0, 0.0, low, high) if self.per_seat else (low, high, 0.0, 0.0)
+
+    def annual_cost(self, headcount: float) -> Tuple[float, float]:
+        fixed_min, fixed_max, seat_min, seat_max = self.annual_terms()
+        return fixed_min + seat_min * headcount, fixed_max + seat_max * headcount
+
+
+def parse_price(text: Optional[str]) -> Optional[PriceQuote]:
+    """Parse a price range; returns None when no amount can be read."""
+    text = fold(text or '')
+    if not text:
+        return None
+    text = re.sub(r'\b(free|mien phi)\b', '0', text)
+    amounts, multipliers = [], []
+    for match in _NUMBER.finditer(text):
+        amounts.append(_number(match.group().rstrip('.,')))
+        suffix = text[match.end():].lstrip()
+        multipliers.append(next((multiplier for word, multiplier in _MULTIPLIERS
+                                 if re.match(rf'{word}\b', suffix)), None))
+    if not amounts:
+        return None
+    # '10-50 triệu': a bare lower bound takes the multiplier of the upper one
+    scale = 1.0
+    for i in reversed(range(len(amounts))):
+        scale = multipliers[i] or scale
+        amounts[i] *= scale
+    currency = next((code for pattern, code in _CURRENCIES if re.search(pattern, text)), None)
+    if currency is None:
+        if any(amounts):
+            return None
+        currency = 'VND'
+    per_seat = any(re.search(rf'(/|per |moi ){unit}', text) for unit in _SEAT_UNITS)
+    period = next((period for marker, period in _PERIODS if re.search(rf'(/|per ){marker.lstrip("/")}', text)), None)
+    return PriceQuote(min(amounts), max(amounts), currency, per_seat, period)
+
+
+def budget_bounds(budget_range: str) -> Optional[Tuple[float, float]]:
+    return BUDGET_RANGES.get(budget_range)
+
+
+class PriceIndex:
+    """Annual cost intervals per company size, sorted by lower and by upper bound.
+
+    A cost [low, high] overlaps a budget [min, max] when low <= max and
+    high >= min. Each condition is a bisect on one of the sorted lists; the
+    query walks the shorter of the two matching runs and checks the other
+    bound, so it costs O(log n + min(#low <= max, #high >= min)) rather than
+    a scan of every product priced below the budget's upper end.
+
+    Not synchronized; the owning index calls it under its own lock.
+    """
+
+    def __init__(self):
+        self._lows: Dict[str, List[Tuple[float, int]]] = {size: [] for size in COMPANY_HEADCOUNT}
+        self._highs: Dict[str, List[Tuple[float, int]]] = {size: [] for size in COMPANY_HEADCOUNT}
+        self._costs: Dict[int, Dict[str, Tuple[float, float]]] = {}
+
+    def add(self, product_id: int, quote: Optional[PriceQuote]):
+        self.add_many([(product_id, quote)])
+
+    def remove(self, product_id: int):
+        self.remove_many([product_id])
+
+    def add_many(self, quotes: Iterable[Tuple[int, Optional[PriceQuote]]]):
+        """Index ``(product_id, quote)`` pairs; quotes that are None are skipped.
+
+        Each in-place insert shifts the rest of a list, so a batch of
+        BULK_BATCH or more (such as the initial load) is appended and the
+        lists re-sorted once instead.
+        """
+        added = {}
+        for product_id, quote in quotes:
+            if quote is not None:
+                added[product_id] = {size: quote.annual_cost(headcount)
+                                     for size, headcount in COMPANY_HEADCOUNT.items()}
+        self._costs.update(added)
+        for size in COMPANY_HEADCOUNT:
+            for entries, bound in ((self._lows[size], 0), (self._highs[size], 1)):
+                new = [(costs[size][bound], product_id) for product_id, costs in added.items()]
+                if len(new) >= BULK_BATCH:
+                    entries.extend(new)
+                    entries.sort()
+                else:
+                    for entry in new:
+                        bisect.insort(entries, entry)
+
+    def remove_many(self, product_ids: Iterable[int]):
+        """Drop products from the index; ids that were never added are ignored."""
+        removed = {}
+        for product_id in product_ids:
+            costs = self._costs.pop(product_id, None)
+            if costs is not None:
+                removed[product_id] = costs
+        for size in COMPANY_HEADCOUNT:
+            for entries, bound in ((self._lows[size], 0), (self._highs[size], 1)):
+                if len(removed) >= BULK_BATCH:
+                    entries[:] = [entry for entry in entries if entry[1] not in removed]
+                else:
+                    for product_id, costs in removed.items():
+                        del entries[bisect.bisect_left(entries, (costs[size][bound], product_id))]
+
+    def within(self, budget_range: str, company_size: str,
+               candidates: Optional[Set[int]] = None) -> Optional[Set[int]]:
+        """Ids (among ``candidates``) whose annual cost overlaps the budget.
+
+        Returns None if the budget or company size is unknown.
+        """
+        bounds = budget_bounds(budget_range)
+        if bounds is None or company_size not in self._lows:
+            return None
+        budget_min, budget_max = bounds
+        lows, highs = self._lows[company_size], self._highs[company_size]
+        low_end = bisect.bisect_right(lows, (budget_max, float('inf')))  # lows[:low_end] start in time
+        high_start = bisect.bisect_left(highs, (budget_min, float('-inf')))  # highs[high_start:] end in time
+        walk = min(low_end, len(highs) - high_start)
+        if candidates is not None and len(candidates) < walk:
+            # Fewer candidates than range hits: check the candidates directly
+            return {product_id for product_id in candidates
+                    if _overlaps(self._costs.get(product_id, {}).get(company_size), budget_min, budget_max)}
+        if low_end == walk:
+            hits = {product_id for _, product_id in lows[:low_end]
+                    if self._costs[product_id][company_size][1] >= budget_min}
+        else:
+            hits = {product_id for _, product_id in highs[high_start:]
+                    if self._costs[product_id][company_size][0] <= budget_max}
+        return hits if candidates is None else hits & candidates
+
+
+def _overlaps(cost: Optional[Tuple[float, float]], budget_min: float, budget_max: float) -> bool:
+    return cost is not None and cost[0] <= budget_max and cost[1] >= budget_min
+
+
+def _number(token: str) -> float:
+    # '1,200' and '1.200.000' use thousands separators; '4,5' is a decimal comma
+    if _THOUSANDS.fullmatch(token):
+        return float(re.sub(r'[.,]', '', token))
+    return float(token.replace(',', '.'))
@@ -0,0 +1,205 @@
+"""Render-time metrics for the Streamlit app.
+
+RenderMetrics is shared by all sessions and records per-section wall time,
+rerun counts and per-session ``st.session_state`` size. Metrics are
+exported as Prometheus text, either downloaded from the admin panel or
+scraped from a small HTTP endpoint started with ``serve_metrics``. When
+profiling is disabled the app never touches this module's hot path: a
+section costs one flag check and a shared null context.
+"""
+import cProfile
+import contextlib
+import hashlib
+import marshal
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple
+
+NULL_SECTION = contextlib.nullcontext()
+MAX_TRACKED_SESSIONS = 1000
+
+
+class Sample(NamedTuple):
+    name: str
+    kind: str  # 'counter' or 'gauge'
+    help: str
+    value: float
+    labels: Tuple[Tuple[str, str], ...] = ()
+
+
+class SectionStats(NamedTuple):
+    name: str
+    calls: int
+    total: float
+    last: float
+    max: float
+
+
+class _Totals:
+    __slots__ = ('calls', 'total', 'last', 'max')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+
+class RenderMetrics:
+    """Process-wide counters for reruns and section render times."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reruns = 0
+        self._sections: Dict[str, _Totals] = {}
+        self._session_bytes: 'OrderedDict[str, int]' = OrderedDict()
+
+    @contextlib.contextmanager
+    def section(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            totals = self._sections.get(name)
+            if totals is None:
+                totals = self._sections[name] = _Totals()
+            totals.calls += 1
+            totals.total += seconds
+            totals.last = seconds
+            totals.max = max(totals.max, seconds)
+
+    def record_rerun(self):
+        with self._lock:
+            self.reruns += 1
+
+    def record_session_size(self, session_id: str, nbytes: int):
+        with self._lock:
+            self._session_bytes[session_id] = nbytes
+            self._session_bytes.move_to_end(session_id)
+            while len(self._session_bytes) > MAX_TRACKED_SESSIONS:
+                self._session_bytes.popitem(last=False)
+
+    def sections(self) -> List[SectionStats]:
+        with self._lock:
+            return [SectionStats(name, t.calls, t.total, t.last, t.max)
+                    for name, t in self._sections.items()]
+
+    def samples(self) -> Iterable[Sample]:
+        yield Sample('app_reruns_total', 'counter', 'Script reruns', self.reruns)
+        for stats in self.sections():
+            labels = (('section', stats.name),)
+            yield Sample('app_section_calls_total', 'counter', 'Section renders', stats.calls, labels)
+            yield Sample('app_section_seconds_total', 'counter', 'Wall time spent rendering a section',
+                         stats.total, labels)
+            yield Sample('app_section_seconds_max', 'gauge', 'Slowest render of a section', stats.max, labels)
+        with self._lock:
+            session_bytes = list(self._session_bytes.items())
+        for session_id, nbytes in session_bytes:
+            # Session ids would let a scraper act as the session; export a digest
+            yield Sample('app_session_state_bytes', 'gauge', 'Approximate size of st.session_state',
+                         nbytes, (('session', _digest(session_id)),))
+
+
+def render_exposition(samples: Iterable[Sample]) -> str:
+    """Format samples in the Prometheus text exposition format."""
+    families: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        families.setdefault(sample.name, []).append(sample)
+    lines = []
+    for name, family in families.items():
+        # Each metric family must be contiguous and described once
+        lines.append(f'# HELP {name} {family[0].help}')
+        lines.append(f'# TYPE {name} {family[0].kind}')
+        for sample in family:
+            labels = ','.join(f'{key}="{_escape(value)}"' for key, value in sample.labels)
+            lines.append(f'{name}{{{labels}}} {sample.value:g}' if labels else f'{name} {sample.value:g}')
+    return '\n'.join(lines) + '\n'
+
+
+def serve_metrics(collect: Callable[[], Iterable[Sample]], port: int,
+                  host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Serve ``render_exposition(collect())`` on GET /metrics from a daemon thread.
+
+    Listens on loopback unless another ``host`` is given.
+    """
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/metrics':
+                self.send_error(404)
+                return
+            body = render_exposition(collect()).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True, name='metrics-server').start()
+    return server
+
+
+@contextlib.contextmanager
+def capture_profile(store: Callable[[bytes], None]):
+    """Profile the block and pass the stats, in ``.prof`` (pstats) format, to ``store``.
+
+    The stats are stored even if the block raises, e.g. on ``st.rerun()``.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        profiler.create_stats()
+        store(marshal.dumps(profiler.stats))
+
+
+def deep_sizeof(obj) -> int:
+    """Approximate memory held by ``obj`` and everything it references."""
+    seen, stack, total = set(), [obj], 0
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item, 0)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        else:
+            if hasattr(item, '__dict__'):
+                stack.append(vars(item))
+            stack.extend(_slot_values(item))
+    return total
+
+
+def _slot_values(obj) -> List[object]:
+    values = []
+    for cls in type(obj).__mro__:
+        slots = cls.__dict__.get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ('__dict__', '__weakref__') and hasattr(obj, name):
+                values.append(getattr(obj, name))
+    return values
+
+
+def _digest(session_id: str) -> str:
+    return hashlib.sha256(session_id.encode()).hexdigest()[:12]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
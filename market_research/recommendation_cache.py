@@ -0,0 +1,125 @@
+"""Cache of AI recommendations keyed on normalized consultation inputs.
+
+Near-identical forms (same business type, same pain points up to case,
+whitespace and Vietnamese diacritics) share one entry. Entries live in a
+TTL + LRU memory tier and, optionally, an SQLite disk tier that survives
+restarts. The cache listens to the catalog and drops everything when the
+catalog version changes.
+"""
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterator, Optional
+
+from market_research.lru import LRUCache
+from market_research.text import fold
+
+TEXT_FIELDS = ('pain_points', 'integration_needs', 'special_requirements')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recommendations (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    result TEXT NOT NULL
+)
+"""
+
+
+def normalize_request(request: dict) -> tuple:
+    return (request.get('business_type', ''),) + tuple(fold(request.get(field, '')) for field in TEXT_FIELDS)
+
+
+class RecommendationCache:
+    """Two-tier recommendation cache with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0, path: Optional[str] = None):
+        self.ttl = ttl
+        self.version = 0
+        self.disk_hits = 0
+        self._memory = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._conn = None
+        self._lock = threading.Lock()
+        if path:
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            with self._conn:
+                self._conn.execute(_SCHEMA)
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered from either tier."""
+        return self._memory.hits + self.disk_hits
+
+    @property
+    def misses(self) -> int:
+        return self._memory.misses - self.disk_hits
+
+    def apply_changes(self, added, removed, version: int):
+        if version == self.version:
+            return
+        self.version = version
+        self._memory.clear()
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute('DELETE FROM recommendations WHERE version != ? OR expires < ?',
+                                   (version, time.time()))
+
+    def get(self, request: dict, version: Optional[int] = None) -> Optional[dict]:
+        """Cached result for ``request`` at catalog ``version`` (default: the current one)."""
+        key = (self.version if version is None else version,) + normalize_request(request)
+        result = self._memory.get(key)
+        if result is not None or self._conn is None:
+            return result
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT result FROM recommendations WHERE key = ? AND expires >= ?',
+                (json.dumps(key, ensure_ascii=False), time.time()),
+            ).fetchone()
+            if row is None:
+                return None
+            self.disk_hits += 1
+        result = json.loads(row[0])
+        self._memory.put(key, result)
+        return result
+
+    def put(self, request: dict, result: dict, version: Optional[int] = None):
+        """Store ``result`` under the catalog version it was computed against.
+
+        Pass the version read when the request was looked up: a result that
+        finished after a catalog change is then dropped instead of being
+        served as fresh.
+        """
+        if version is None:
+            version = self.version
+        if version != self.version:
+            return  # already stale
+        key = (version,) + normalize_request(request)
+        self._memory.put(key, result)
+        if self._conn is not None:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO recommendations (key, version, expires, result) VALUES (?, ?, ?, ?)',
+                    (json.dumps(key, ensure_ascii=False), version, time.time() + self.ttl,
+                     json.dumps(result, ensure_ascii=False)),
+                )
+
+
+class CachedBackend:
+    """Consultation backend that answers repeated requests from a RecommendationCache."""
+
+    def __init__(self, backend, cache: RecommendationCache):
+        self.backend = backend
+        self.cache = cache
+
+    def stream(self, request: dict) -> Iterator[dict]:
+        # The catalog the answer is computed from; it may change while the backend runs
+        version = self.cache.version
+        result = self.cache.get(request, version)
+        if result is not None:
+            yield {'type': 'result', 'result': result}
+            return
+        for event in self.backend.stream(request):
+            if event.get('type') == 'result':
+                self.cache.put(request, event['result'], version)
+            yield event
@@ -0,0 +1,133 @@
+"""Inverted index over the catalog for survey search.
+
+Posting sets are keyed by category, deployment model, feature and the
+Vietnam-support flag, and annual costs are kept in a PriceIndex for budget
+range queries. A search intersects the relevant postings once,
+scores every candidate in the same pass and keeps only the top-k with a
+heap, so cost depends on the size of the category rather than on the
+whole catalog.
+"""
+import heapq
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from market_research.pricing import PriceIndex
+
+DEPLOYMENT_SCORE = 30
+LOCAL_SUPPORT_SCORE = 20
+BUDGET_SCORE = 25
+
+
+class SearchIndex:
+    """Catalog listener maintaining posting sets of product ids."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.version = 0
+        self._records: Dict[int, dict] = {}
+        self._by_category: Dict[str, Set[int]] = defaultdict(set)
+        self._by_deployment: Dict[str, Set[int]] = defaultdict(set)
+        self._by_feature: Dict[str, Set[int]] = defaultdict(set)
+        self._vietnam: Set[int] = set()
+        self._prices = PriceIndex()
+
+    def apply_changes(self, added: List[dict], removed: List[dict], version: int):
+        with self._lock:
+            self.version = version
+            for product in removed:
+                self._remove(product)
+            self._prices.remove_many(product['id'] for product in removed)
+            for product in added:
+                self._add(product)
+            self._prices.add_many((product['id'], product.get('price')) for product in added)
+
+    def postings(self, field: str, value: str) -> Set[int]:
+        """Return a copy of the ids indexed under ``field`` = ``value``."""
+        index = {
+            'category': self._by_category,
+            'deployment': self._by_deployment,
+            'feature': self._by_feature,
+        }[field]
+        with self._lock:
+            return set(index.get(value, ()))
+
+    def search(self, category: str, deployments: Iterable[str] = (),
+               local_support: bool = False, budget_range: Optional[str] = None,
+               company_size: Optional[str] = None, boosts: Optional[Dict[int, int]] = None,
+               k: Optional[int] = None) -> List[dict]:
+        """Like ``rank``, but each result is a copy of the product with ``match_score`` added."""
+        ranking = self.rank(category, deployments, local_support, budget_range, company_size, boosts, k)
+        with self._lock:
+            return [dict(self._records[product_id], match_score=score) for product_id, score in ranking
+                    if product_id in self._records]
+
+    def rank(self, category: str, deployments: Iterable[str] = (),
+             local_support: bool = False, budget_range: Optional[str] = None,
+             company_size: Optional[str] = None, boosts: Optional[Dict[int, int]] = None,
+             k: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Score products in ``category`` and return the best ``k`` (all if None).
+
+        Products whose annual cost for ``company_size`` overlaps
+        ``budget_range`` get BUDGET_SCORE. ``boosts`` adds extra points per product id (e.g. text relevance).
+        Returns ``(product_id, match_score)`` pairs ordered by score and then by insertion order.
+        """
+        with self._lock:
+            candidates = self._by_category.get(category)
+            if not candidates:
+                return []
+            deployment_hits = set()
+            for deployment in deployments:
+                deployment_hits |= self._by_deployment.get(deployment, set())
+            deployment_hits &= candidates
+            vietnam_hits = candidates & self._vietnam if local_support else set()
+            budget_hits = self._prices.within(budget_range, company_size, candidates) or set()
+
+            scores = dict.fromkeys(candidates, 0)
+            for product_id in deployment_hits:
+                scores[product_id] += DEPLOYMENT_SCORE
+            for product_id in vietnam_hits:
+                scores[product_id] += LOCAL_SUPPORT_SCORE
+            for product_id in budget_hits:
+                scores[product_id] += BUDGET_SCORE
+            for product_id, points in (boosts or {}).items():
+                if product_id in scores:
+                    scores[product_id] += points
+
+            def rank(product_id):
+                return scores[product_id], -product_id
+
+            if k is None or k >= len(scores):
+                top = sorted(scores, key=rank, reverse=True)
+            else:
+                top = heapq.nlargest(k, scores, key=rank)
+            return [(product_id, scores[product_id]) for product_id in top]
+
+    def _add(self, product: dict):
+        product_id = product['id']
+        self._records[product_id] = product
+        self._by_category[product['category']].add(product_id)
+        for deployment in product.get('deployment') or ():
+            self._by_deployment[deployment].add(product_id)
+        for feature in product.get('features') or ():
+            self._by_feature[feature].add(product_id)
+        if product.get('support_vietnam'):
+            self._vietnam.add(product_id)
+
+    def _remove(self, product: dict):
+        product_id = product['id']
+        self._records.pop(product_id, None)
+        _discard(self._by_category, product['category'], product_id)
+        for deployment in product.get('deployment') or ():
+            _discard(self._by_deployment, deployment, product_id)
+        for feature in product.get('features') or ():
+            _discard(self._by_feature, feature, product_id)
+        self._vietnam.discard(product_id)
+
+
+def _discard(index: Dict[str, Set[int]], key: str, product_id: int):
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(product_id)
+        if not ids:
+            del index[key]
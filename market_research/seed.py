@@ -0,0 +1,81 @@
+"""Seed data loaded into an empty catalog on first start."""
+
+# Database mẫu các phần mềm thị trường
+SEED_CATALOG = {
+    'ERP': [
+        {
+            'name': 'SAP S/4HANA',
+            'vendor': 'SAP SE',
+            'category': 'ERP',
+            'price_range': '50,000-500,000 USD',
+            'deployment': ['On-premise', 'Cloud', 'Hybrid'],
+            'features': ['Financial Management', 'Supply Chain', 'Manufacturing', 'HR'],
+            'pros': ['Comprehensive functionality', 'Strong integration', 'Industry-specific solutions'],
+            'cons': ['High cost', 'Complex implementation', 'Steep learning curve'],
+            'rating': 4.2,
+            'market_share': '22%',
+            'website': 'https://www.sap.com',
+            'support_vietnam': True
+        },
+        {
+            'name': 'Oracle NetSuite',
+            'vendor': 'Oracle Corporation',
+            'category': 'ERP',
+            'price_range': '99-499 USD/user/month',
+            'deployment': ['Cloud'],
+            'features': ['Financials', 'CRM', 'E-commerce', 'Inventory'],
+            'pros': ['Cloud-native', 'Scalable', 'Good for SMEs'],
+            'cons': ['Limited customization', 'Can be expensive', 'Learning curve'],
+            'rating': 4.1,
+            'market_share': '15%',
+            'website': 'https://www.netsuite.com',
+            'support_vietnam': True
+        }
+    ],
+    'CRM': [
+        {
+            'name': 'Salesforce Sales Cloud',
+            'vendor': 'Salesforce',
+            'category': 'CRM',
+            'price_range': '25-300 USD/user/month',
+            'deployment': ['Cloud'],
+            'features': ['Lead Management', 'Opportunity Management', 'Sales Analytics', 'Mobile App'],
+            'pros': ['Market leader', 'Extensive customization', 'Strong ecosystem'],
+            'cons': ['Expensive', 'Complex for small businesses', 'Requires training'],
+            'rating': 4.3,
+            'market_share': '23%',
+            'website': 'https://www.salesforce.com',
+            'support_vietnam': True
+        },
+        {
+            'name': 'HubSpot CRM',
+            'vendor': 'HubSpot',
+            'category': 'CRM',
+            'price_range': 'Free - 1,200 USD/month',
+            'deployment': ['Cloud'],
+            'features': ['Contact Management', 'Deal Pipeline', 'Email Marketing', 'Reports'],
+            'pros': ['Free tier available', 'User-friendly', 'Good integration'],
+            'cons': ['Limited advanced features in free tier', 'Can get expensive'],
+            'rating': 4.5,
+            'market_share': '12%',
+            'website': 'https://www.hubspot.com',
+            'support_vietnam': False
+        }
+    ],
+    'HR': [
+        {
+            'name': 'Workday HCM',
+            'vendor': 'Workday',
+            'category': 'HR',
+            'price_range': '100-300 USD/employee/year',
+            'deployment': ['Cloud'],
+            'features': ['Core HR', 'Payroll', 'Talent Management', 'Analytics'],
+            'pros': ['Modern UI', 'Mobile-first', 'Strong analytics'],
+            'cons': ['Expensive', 'Limited customization', 'Implementation complexity'],
+            'rating': 4.0,
+            'market_share': '18%',
+            'website': 'https://www.workday.com',
+            'support_vietnam': False
+        }
+    ]
+}
@@ -0,0 +1,159 @@
+"""MinHash/LSH indexes for similar products and likely duplicates.
+
+Each product is reduced to two shingle sets: its *identity* (character
+3-grams of the folded name without the vendor's name, ignoring spacing and
+punctuation) and its *content* (word tokens of name, vendor, features, pros
+and cons). Each set is summarized by a MinHash signature and bucketed by locality-sensitive
+hashing, so a query only compares against products sharing at least one
+band bucket instead of scanning the catalog. The estimated Jaccard
+similarity is the fraction of equal signature slots.
+
+Identity matches flag likely duplicates ("Sales force CRM" / "Salesforce
+CRM"); content matches drive the "similar products" panel. Both indexes are
+catalog listeners updated incrementally.
+"""
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from market_research.text import fold
+from market_research.text_index import TEXT_FIELDS, tokenize
+
+DUPLICATE_THRESHOLD = 0.5
+SIMILAR_THRESHOLD = 0.2
+
+_PRIME = np.uint64(4294967291)  # largest prime below 2**32
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+class MinHashLSH:
+    """MinHash signatures of shingle sets, bucketed into ``bands`` of ``rows`` slots.
+
+    Two sets with Jaccard similarity ``s`` share a bucket with probability
+    ``1 - (1 - s ** rows) ** bands``; the steep part of that curve sits
+    near ``(1 / bands) ** (1 / rows)``.
+    """
+
+    def __init__(self, bands: int, rows: int, seed: int = 1):
+        self.bands = bands
+        self.rows = rows
+        rng = np.random.default_rng(seed)
+        permutations = bands * rows
+        # a * x + b stays below 2**64 for 32-bit shingle hashes x
+        self._a = rng.integers(1, 1 << 31, permutations, dtype=np.uint64)[:, None]
+        self._b = rng.integers(0, 1 << 32, permutations, dtype=np.uint64)[:, None]
+        self._signatures: Dict[int, np.ndarray] = {}
+        self._buckets: Dict[Tuple[int, bytes], Set[int]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def signature(self, shingles: Iterable[str]) -> Optional[np.ndarray]:
+        """MinHash signature of ``shingles``; None for an empty set."""
+        hashes = np.fromiter({zlib.crc32(shingle.encode()) for shingle in shingles}, dtype=np.uint64)
+        if not len(hashes):
+            return None
+        return ((self._a * hashes + self._b) % _PRIME).min(axis=1).astype(np.uint32)
+
+    def add(self, key: int, signature: Optional[np.ndarray]):
+        self.remove(key)
+        if signature is None:
+            return
+        self._signatures[key] = signature
+        for bucket in self._band_keys(signature):
+            self._buckets[bucket].add(key)
+
+    def remove(self, key: int):
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for bucket in self._band_keys(signature):
+            members = self._buckets.get(bucket)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._buckets[bucket]
+
+    def query(self, signature: Optional[np.ndarray], threshold: float = 0.0,
+              exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """``(key, estimated similarity)`` of bucket neighbours at or above ``threshold``, best first."""
+        if signature is None:
+            return []
+        candidates: Set[int] = set()
+        for bucket in self._band_keys(signature):
+            candidates |= self._buckets.get(bucket, set())
+        candidates.discard(exclude)
+        if not candidates:
+            return []
+        keys = sorted(candidates)
+        similarity = (np.stack([self._signatures[key] for key in keys]) == signature).mean(axis=1)
+        matches = [(key, float(score)) for key, score in zip(keys, similarity) if score >= threshold]
+        return sorted(matches, key=lambda match: (-match[1], match[0]))
+
+    def get(self, key: int) -> Optional[np.ndarray]:
+        return self._signatures.get(key)
+
+    def _band_keys(self, signature: np.ndarray) -> List[Tuple[int, bytes]]:
+        return [(band, chunk.tobytes()) for band, chunk in enumerate(signature.reshape(self.bands, self.rows))]
+
+
+def identity_shingles(product: dict) -> Set[str]:
+    """Character 3-grams of the name, spacing, punctuation and the vendor's name removed.
+
+    Names often repeat the vendor ("Microsoft Teams", "Microsoft Excel"), which
+    would make every product of a vendor look alike.
+    """
+    name = _NON_ALNUM.sub('', fold(product.get('name') or ''))
+    vendor = _NON_ALNUM.sub('', fold(product.get('vendor') or ''))
+    if vendor:
+        name = name.replace(vendor, '') or name
+    return {name[i:i + 3] for i in range(max(len(name) - 2, 1))} if name else set()
+
+
+def content_shingles(product: dict) -> Set[str]:
+    values = [product.get('name') or '', product.get('vendor') or '']
+    for field in TEXT_FIELDS:
+        values.extend(product.get(field) or ())
+    return set(tokenize(' '.join(values)))
+
+
+class SimilarityIndex:
+    """Catalog listener answering "similar to X" and "likely duplicate of X"."""
+
+    def __init__(self):
+        self.version = 0
+        self._lock = threading.Lock()
+        self._identity = MinHashLSH(bands=16, rows=2)   # steep near 0.25; verified at DUPLICATE_THRESHOLD
+        self._content = MinHashLSH(bands=20, rows=3)    # steep near 0.37
+
+    def __len__(self) -> int:
+        return len(self._content)
+
+    def apply_changes(self, added: List[dict], removed: List[dict], version: int):
+        with self._lock:
+            for product in removed:
+                self._identity.remove(product['id'])
+                self._content.remove(product['id'])
+            for product in added:
+                self._identity.add(product['id'], self._identity.signature(identity_shingles(product)))
+                self._content.add(product['id'], self._content.signature(content_shingles(product)))
+            self.version = version
+
+    def similar(self, product_id: int, k: int = 10,
+                threshold: float = SIMILAR_THRESHOLD) -> List[Tuple[int, float]]:
+        """Up to ``k`` ``(product_id, similarity)`` with content similar to an indexed product."""
+        with self._lock:
+            return self._content.query(self._content.get(product_id), threshold, exclude=product_id)[:k]
+
+    def duplicates(self, product: dict, threshold: float = DUPLICATE_THRESHOLD) -> List[Tuple[int, float]]:
+        """Indexed products whose name likely denotes the same product as ``product``.
+
+        ``product`` need not be in the catalog yet; if it is, it is not reported as its own duplicate.
+        """
+        signature = self._identity.signature(identity_shingles(product))
+        with self._lock:
+            return self._identity.query(signature, threshold, exclude=product.get('id'))
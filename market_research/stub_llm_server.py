@@ -0,0 +1,68 @@
+"""Local stand-in for the consultation model server.
+
+Streams the same newline-delimited JSON events that HttpBackend expects,
+with a configurable delay between events, so the background job path can
+be exercised without a real model:
+
+    python -m market_research.stub_llm_server --port 8765 --delay 0.5
+    AI_BACKEND_URL=http://127.0.0.1:8765/ streamlit run streamlit_app.py
+"""
+import argparse
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def stub_events(request: dict):
+    yield {'type': 'progress', 'value': 0.2, 'message': 'Đang phân tích yêu cầu'}
+    yield {'type': 'text', 'text': f"Loại hình: {request.get('business_type', '')}\n"}
+    yield {'type': 'progress', 'value': 0.6, 'message': 'Đang đối chiếu danh mục'}
+    yield {'type': 'text', 'text': f"Vấn đề chính: {request.get('pain_points', '')}\n"}
+    yield {'type': 'result', 'result': {
+        'top_recommendations': [{
+            'name': 'Stub Product',
+            'match_score': 50,
+            'rating': 4.0,
+            'estimated_cost': 'N/A',
+            'reason': 'Phản hồi mẫu từ stub server',
+        }],
+        'analysis': 'Phân tích mẫu từ stub server.',
+        'considerations': 'Không có.',
+    }}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    delay = 0.0
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        request = json.loads(self.rfile.read(length) or b'{}')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        for event in stub_events(request):
+            time.sleep(self.delay)
+            line = json.dumps(event, ensure_ascii=False).encode() + b'\n'
+            self.wfile.write(b'%x\r\n%s\r\n' % (len(line), line))
+            self.wfile.flush()
+        self.wfile.write(b'0\r\n\r\n')
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host: str = '127.0.0.1', port: int = 8765, delay: float = 0.5) -> ThreadingHTTPServer:
+    """Create the server; call ``serve_forever()`` on it (e.g. in a thread)."""
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'delay': delay})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=0.5)
+    args = parser.parse_args()
+    serve(args.host, args.port, args.delay).serve_forever()
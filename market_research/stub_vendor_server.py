@@ -0,0 +1,115 @@
+"""Local stand-in for vendor data feeds, for exercising VendorRefresher.
+
+Serves ``GET /vendors/<vendor>`` for every vendor in a catalog database with
+ETag / Last-Modified validators and 304 responses, a configurable latency,
+and a configurable share of transient 503s:
+
+    python -m market_research.stub_vendor_server --catalog catalog.db --port 8766 --delay 0.05
+    VENDOR_DATA_URL='http://127.0.0.1:8766/vendors/{vendor}' streamlit run streamlit_app.py
+
+Published values are derived from the product name and the server's
+``revision``. Increasing the revision changes the data of
+``change_percent``% of the vendors; the rest keep answering 304.
+"""
+import argparse
+import hashlib
+import json
+import random
+import sqlite3
+import time
+import zlib
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from urllib.parse import unquote
+
+STARTED = time.time()
+
+
+def load_vendors(catalog_path: str) -> Dict[str, List[dict]]:
+    """Live products of a catalog database, grouped by vendor."""
+    vendors: Dict[str, List[dict]] = {}
+    with sqlite3.connect(catalog_path) as conn:
+        for (data,) in conn.execute('SELECT data FROM products WHERE deleted = 0'):
+            product = json.loads(data)
+            vendors.setdefault(product.get('vendor') or '', []).append(product)
+    return vendors
+
+
+def published(products: List[dict], revision: int) -> dict:
+    items = []
+    for product in products:
+        digest = zlib.crc32(f"{product['name']}:{revision}".encode())
+        items.append({
+            'name': product['name'],
+            'rating': round(3.0 + digest % 21 / 10, 1),
+            'market_share': f'{digest % 300 / 10:g}%',
+            'website': product.get('website') or '',
+        })
+    return {'products': items}
+
+
+class StubVendorHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        time.sleep(server.delay)
+        prefix = '/vendors/'
+        vendor = unquote(self.path[len(prefix):]) if self.path.startswith(prefix) else None
+        if vendor not in server.vendors:
+            self._send(404, b'{}')
+            return
+        if server.fail_rate and random.random() < server.fail_rate:
+            self._send(503, b'{}', {'Retry-After': '0'})
+            return
+        changed = zlib.crc32(vendor.encode()) % 100 < server.change_percent
+        revision = server.revision if changed else 0
+        body = json.dumps(published(server.vendors[vendor], revision), ensure_ascii=False).encode()
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()[:16]
+        headers = {'ETag': etag, 'Last-Modified': formatdate(STARTED + revision, usegmt=True)}
+        if self.headers.get('If-None-Match') == etag:
+            self._send(304, b'', headers)
+            return
+        self._send(200, body, headers)
+
+    def _send(self, status: int, body: bytes, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(vendors: Dict[str, List[dict]], host: str = '127.0.0.1', port: int = 8766,
+          delay: float = 0.05, fail_rate: float = 0.0, change_percent: int = 10) -> ThreadingHTTPServer:
+    """Create the server; call ``serve_forever()`` on it (e.g. in a thread)."""
+    server = ThreadingHTTPServer((host, port), StubVendorHandler)
+    server.daemon_threads = True
+    server.vendors = vendors
+    server.delay = delay
+    server.fail_rate = fail_rate
+    server.change_percent = change_percent
+    server.revision = 0
+    return server
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--catalog', default='catalog.db')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--delay', type=float, default=0.05)
+    parser.add_argument('--fail-rate', type=float, default=0.0)
+    parser.add_argument('--change-percent', type=int, default=10)
+    parser.add_argument('--revision', type=int, default=1)
+    args = parser.parse_args()
+    stub = serve(load_vendors(args.catalog), args.host, args.port, args.delay, args.fail_rate, args.change_percent)
+    stub.revision = args.revision
+    stub.serve_forever()
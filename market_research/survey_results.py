@@ -0,0 +1,49 @@
+"""Survey results kept as references into the catalog.
+
+A survey stores only the ranked product ids and their scores, in two typed
+arrays, together with the catalog version they were ranked against. Session
+state therefore does not grow with copies of catalog records, and products
+are looked up in the catalog when the results are displayed, so edits made
+after the search show up and deleted products drop out.
+"""
+from array import array
+from typing import Iterable, Iterator, Optional, Tuple
+
+
+class SurveyResults:
+    """Ranked ``(product_id, score)`` references for one survey at one catalog version."""
+
+    __slots__ = ('version', '_ids', '_scores')
+
+    def __init__(self, ranking: Iterable[Tuple[int, int]] = (), version: Optional[int] = None):
+        self.version = version
+        self._ids = array('q')
+        self._scores = array('i')
+        for product_id, score in ranking:
+            self._ids.append(product_id)
+            self._scores.append(score)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, Optional[int]]]:
+        """``(product_id, score, catalog_version)`` in rank order."""
+        for product_id, score in zip(self._ids, self._scores):
+            yield product_id, score, self.version
+
+    def resolve(self, snapshot, limit: Optional[int] = None) -> Iterator[dict]:
+        """Yield up to ``limit`` current records from ``snapshot`` with ``match_score`` added.
+
+        Products deleted since the ranking are skipped.
+        """
+        if limit is not None and limit <= 0:
+            return
+        count = 0
+        for product_id, score in zip(self._ids, self._scores):
+            product = snapshot.get(product_id)
+            if product is None:
+                continue
+            yield dict(product, match_score=score)
+            count += 1
+            if count == limit:
+                return
@@ -0,0 +1,15 @@
+"""Text normalization shared by caches and search indexes."""
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fold(text: str) -> str:
+    """Lowercase, strip Vietnamese diacritics and collapse whitespace."""
+    if not text:
+        return ''
+    text = text.lower().replace('đ', 'd')
+    text = ''.join(ch for ch in unicodedata.normalize('NFD', text)
+                   if not unicodedata.combining(ch))
+    return _WHITESPACE.sub(' ', text).strip()
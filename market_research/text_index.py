@@ -0,0 +1,155 @@
+"""BM25 full-text index over product names, features, pros and cons.
+
+Text is folded (case, diacritics), tokenized and lightly stemmed; queries
+written in Vietnamese are expanded with the English terms used in the
+catalog, so a pain point like "quản lý kho" finds inventory products.
+Postings are updated incrementally from catalog changes.
+"""
+import heapq
+import math
+import re
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from market_research.text import fold
+
+TEXT_FIELDS = ('features', 'pros', 'cons')
+
+# Folded Vietnamese phrase -> English catalog vocabulary.
+QUERY_EXPANSIONS = {
+    'kho': 'inventory warehouse supply chain',
+    'ton kho': 'inventory',
+    'chuoi cung ung': 'supply chain',
+    'san xuat': 'manufacturing',
+    'ke toan': 'accounting financial financials',
+    'tai chinh': 'financial financials',
+    'bao cao': 'report reports analytics',
+    'phan tich': 'analytics',
+    'nhan su': 'hr core talent',
+    'luong': 'payroll',
+    'tuyen dung': 'talent',
+    'khach hang': 'crm contact customer',
+    'ban hang': 'sales lead deal pipeline opportunity',
+    'tiep thi': 'marketing',
+    'thuong mai dien tu': 'e-commerce',
+    'di dong': 'mobile',
+    'tich hop': 'integration',
+    'de su dung': 'user-friendly easy',
+    'chi phi thap': 'free cost-effective',
+    'mien phi': 'free',
+}
+
+STOPWORDS = frozenset({
+    'and', 'or', 'the', 'of', 'for', 'in', 'to', 'a', 'an', 'with', 'can', 'be',
+    'va', 'cua', 'cho', 'voi', 'cac', 'nhung', 'la', 'co', 'khong', 'duoc',
+    'phai', 'hien', 'tai', 'qua', 'rat', 'nhu', 'vi', 'du',
+})
+
+_TOKEN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+_EXPANSIONS = sorted(QUERY_EXPANSIONS.items(), key=lambda item: -len(item[0]))
+
+
+def tokenize(text: str) -> List[str]:
+    return [_stem(token) for token in _TOKEN.findall(fold(text)) if token not in STOPWORDS]
+
+
+def expand_query(text: str) -> str:
+    folded = fold(text)
+    padded = f' {folded} '
+    extra = [english for phrase, english in _EXPANSIONS if f' {phrase} ' in padded]
+    return ' '.join([folded] + extra)
+
+
+def _document_text(product: dict) -> str:
+    values = [product.get('name') or '']
+    for field in TEXT_FIELDS:
+        values.extend(product.get(field) or ())
+    return ' '.join(values)
+
+
+def _stem(token: str) -> str:
+    # Plural folding only; enough to match "Reports" with "report".
+    if len(token) > 3 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+class TextIndex:
+    """Incrementally maintained BM25 index; a catalog listener."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self.version = 0
+        self._lock = threading.Lock()
+        self._records: Dict[int, dict] = {}
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._doc_len: Dict[int, int] = {}
+        self._total_len = 0
+
+    def apply_changes(self, added: List[dict], removed: List[dict], version: int):
+        with self._lock:
+            for product in removed:
+                self._remove(product['id'])
+            for product in added:
+                self._add(product)
+            self.version = version
+
+    def scores(self, query: str, category: Optional[str] = None) -> Dict[int, float]:
+        """BM25 score of every product matching ``query``."""
+        with self._lock:
+            return {product_id: score
+                    for product_id, (score, _) in self._score(query, category).items()}
+
+    def search(self, query: str, k: int = 10,
+               category: Optional[str] = None) -> List[Tuple[dict, float, List[str]]]:
+        """Top-k (product, score, matched terms) for ``query``."""
+        with self._lock:
+            scored = self._score(query, category)
+            top = heapq.nlargest(k, scored.items(), key=lambda item: (item[1][0], -item[0]))
+            return [(self._records[product_id], score, sorted(matched))
+                    for product_id, (score, matched) in top]
+
+    def _score(self, query: str, category: Optional[str]) -> Dict[int, Tuple[float, List[str]]]:
+        terms = set(tokenize(expand_query(query)))
+        results = {}
+        n_docs = len(self._doc_len)
+        if not n_docs or not terms:
+            return results
+        avg_len = self._total_len / n_docs
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            idf = math.log(1 + (n_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            for product_id, tf in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self._doc_len[product_id] / avg_len)
+                score, matched = results.get(product_id, (0.0, []))
+                matched.append(term)
+                results[product_id] = (score + idf * tf * (self.k1 + 1) / (tf + norm), matched)
+        if category is not None:
+            results = {product_id: hit for product_id, hit in results.items()
+                       if self._records[product_id]['category'] == category}
+        return results
+
+    def _add(self, product: dict):
+        product_id = product['id']
+        counts = Counter(tokenize(_document_text(product)))
+        self._records[product_id] = product
+        self._doc_len[product_id] = sum(counts.values())
+        self._total_len += self._doc_len[product_id]
+        for term, tf in counts.items():
+            self._postings[term][product_id] = tf
+
+    def _remove(self, product_id: int):
+        product = self._records.pop(product_id, None)
+        if product is None:
+            return
+        self._total_len -= self._doc_len.pop(product_id)
+        for term in set(tokenize(_document_text(product))):
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(product_id, None)
+                if not postings:
+                    del self._postings[term]
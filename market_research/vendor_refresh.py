@@ -0,0 +1,241 @@
+"""Background refresh of vendor-published product data.
+
+Vendors publish the current ``rating``, ``market_share`` and ``website`` of
+their products as JSON at a URL built from a template (``VENDOR_DATA_URL``),
+where ``{vendor}`` is the URL-quoted vendor name and ``{domain}`` the host of
+the product's website:
+
+    https://data.example.com/vendors/{vendor}
+    https://{domain}/vendor-data.json
+
+    {"products": [{"name": "...", "rating": 4.3, "market_share": "12%", "website": "https://..."}]}
+
+A refresh fetches every distinct URL once on a thread pool sharing one
+requests session, whose keep-alive connection pools are sized to the
+per-host limit. At most ``per_host`` requests are in flight per host.
+Requests are conditional (ETag / If-Modified-Since), so unchanged vendors
+answer 304 without a body. Connection errors, 429 and 5xx are retried with
+exponential backoff, honouring Retry-After. Changed fields are written with
+``CatalogStore.update_products`` in batches: one transaction and one catalog
+version per batch.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+from market_research.bulk_import import REFRESHABLE_FIELDS, normalize_field
+from market_research.consultation import CANCELLED, DONE, FAILED, FINISHED_STATES, QUEUED, RUNNING
+from market_research.text import fold
+
+if TYPE_CHECKING:
+    import requests
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_REPORTED_ERRORS = 100
+
+
+class RefreshJob:
+    """Progress of one refresh run; read by the UI while the run is in progress."""
+
+    def __init__(self):
+        self.status = QUEUED
+        self.total = 0
+        self.fetched = 0
+        self.not_modified = 0
+        self.failed = 0
+        self.updated = 0
+        self.errors: List[Tuple[str, str]] = []
+        self.error = None
+        self.started = time.time()
+        self.finished = None
+        self._cancel = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    @property
+    def completed(self) -> int:
+        return self.fetched + self.not_modified + self.failed
+
+    def cancel(self):
+        self._cancel.set()
+
+    def fail(self, url: str, error: Exception):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((url, str(error)))
+
+
+class VendorRefresher:
+    """Revalidates catalog fields against vendor data feeds, off the script thread."""
+
+    def __init__(self, store, url_template: str, workers: int = 32, per_host: int = 4,
+                 timeout: float = 10.0, retries: int = 3, backoff: float = 0.5,
+                 batch_size: int = 500, session: Optional['requests.Session'] = None):
+        self.store = store
+        self.url_template = url_template
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self.batch_size = batch_size
+        if session is None:
+            session = _pooled_session(workers, per_host, retries, backoff)
+        self._session = session
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self.job: Optional[RefreshJob] = None
+
+    def start(self) -> RefreshJob:
+        """Start a refresh on a background thread unless one is running; returns the current job."""
+        with self._lock:
+            if self.job is not None and not self.job.done:
+                return self.job
+            job = self.job = RefreshJob()
+        threading.Thread(target=self.run, args=(job,), name='vendor-refresh', daemon=True).start()
+        return job
+
+    def schedule(self, interval: float):
+        """Start a refresh every ``interval`` seconds from a daemon thread."""
+        def loop():
+            while True:
+                self.start()
+                time.sleep(interval)
+
+        threading.Thread(target=loop, name='vendor-refresh-schedule', daemon=True).start()
+
+    def run(self, job: Optional[RefreshJob] = None) -> RefreshJob:
+        """Refresh the whole catalog and return the finished job."""
+        job = job or RefreshJob()
+        job.status = RUNNING
+        try:
+            targets = self.targets()
+            job.total = len(targets)
+            pending: Dict[int, dict] = {}
+            validated: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='vendor-refresh')
+            try:
+                futures = {executor.submit(self._fetch, url): url for url in targets}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        response = future.result()
+                        if response is not None:
+                            payload, validators = response
+                            changes = self._changes(targets[url], payload)
+                    except Exception as e:
+                        job.fail(url, e)
+                    else:
+                        if response is None:
+                            job.not_modified += 1
+                        else:
+                            job.fetched += 1
+                            pending.update(changes)
+                            validated[url] = validators
+                    if len(pending) >= self.batch_size:
+                        self._write(pending, validated, job)
+                    if job._cancel.is_set():
+                        break
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            self._write(pending, validated, job)
+            job.status = CANCELLED if job._cancel.is_set() else DONE
+        except Exception as e:
+            job.error = str(e)
+            job.status = FAILED
+        job.finished = time.time()
+        return job
+
+    def targets(self) -> Dict[str, List[int]]:
+        """Product ids of the current catalog grouped by the URL their vendor data comes from."""
+        targets: Dict[str, List[int]] = {}
+        for product in self.store.snapshot().products():
+            url = self.url_for(product)
+            if url is not None:
+                targets.setdefault(url, []).append(product['id'])
+        return targets
+
+    def url_for(self, product: dict) -> Optional[str]:
+        domain = urlsplit(product.get('website') or '').hostname
+        if '{domain}' in self.url_template and not domain:
+            return None
+        return self.url_template.format(vendor=quote(product.get('vendor') or '', safe=''), domain=domain or '')
+
+    def _fetch(self, url: str):
+        """(payload, validators) for ``url``, or None if it has not changed since the last refresh."""
+        etag, modified = self._validators.get(url, (None, None))
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        with self._host_slot(urlsplit(url).netloc):
+            response = self._session.get(url, headers=headers, timeout=self.timeout)
+        with response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            return response.json(), (response.headers.get('ETag'), response.headers.get('Last-Modified'))
+
+    def _host_slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def _changes(self, product_ids: List[int], payload) -> Dict[int, dict]:
+        """Changed fields per product id; raises ValueError if ``payload`` is not a vendor feed."""
+        if not isinstance(payload, dict):
+            raise ValueError(f'expected a JSON object, got {type(payload).__name__}')
+        items = payload.get('products') or []
+        if not isinstance(items, list):
+            raise ValueError(f'"products" must be a list, got {type(items).__name__}')
+        published = {fold(item['name']): item for item in items
+                     if isinstance(item, dict) and isinstance(item.get('name'), str) and item['name']}
+        changes = {}
+        for product_id in product_ids:
+            product = self.store.get(product_id)
+            item = product and published.get(fold(product['name']))
+            if not item:
+                continue
+            fields = {}
+            for field in REFRESHABLE_FIELDS:
+                if field not in item:
+                    continue
+                try:
+                    value = normalize_field(field, item[field])
+                except (TypeError, ValueError):
+                    continue
+                if value != product.get(field):
+                    fields[field] = value
+            if fields:
+                changes[product_id] = fields
+        return changes
+
+    def _write(self, pending: Dict[int, dict], validated: Dict[str, tuple], job: RefreshJob):
+        if pending:
+            job.updated += len(self.store.update_products(pending))
+            pending.clear()
+        # Only remembered once the data they validate has been written
+        self._validators.update(validated)
+        validated.clear()
+
+
+def _pooled_session(workers: int, per_host: int, retries: int, backoff: float) -> 'requests.Session':
+    import requests  # deferred: only needed when a vendor feed is configured
+    from urllib3.util.retry import Retry
+
+    retry = Retry(total=retries, backoff_factor=backoff, backoff_jitter=backoff / 2,
+                  status_forcelist=RETRY_STATUSES, allowed_methods=('GET',),
+                  respect_retry_after_header=True, raise_on_status=False)
+    # One keep-alive pool per host, as large as the per-host limit
+    adapter = requests.adapters.HTTPAdapter(pool_connections=max(workers, 10), pool_maxsize=per_host,
+                                            max_retries=retry)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
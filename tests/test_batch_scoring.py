@@ -0,0 +1,59 @@
+import random
+
+from market_research import batch_scoring
+from market_research.batch_scoring import ProductMatrix, score_surveys
+from market_research.catalog import CatalogStore
+from market_research.frame import CatalogFrame
+from market_research.pricing import BUDGET_RANGES, COMPANY_HEADCOUNT
+from market_research.search_index import SearchIndex
+
+CATEGORIES = ['CRM', 'ERP', 'HR']
+DEPLOYMENTS = ['Cloud', 'On-premise', 'Hybrid']
+PRICES = ['', 'Free', '10 USD/user/month', '99-499 USD/month', '50-200 triệu VNĐ', '5,000 USD/year']
+
+
+def _catalog(tmp_path, rng, n=300):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    store.add_products([{
+        'name': f'Product {i}', 'vendor': 'Vendor', 'category': rng.choice(CATEGORIES),
+        'price_range': rng.choice(PRICES), 'deployment': rng.sample(DEPLOYMENTS, rng.randint(0, 2)),
+        'features': [], 'pros': [], 'cons': [], 'rating': 4.0, 'market_share': '1%', 'website': '',
+        'support_vietnam': rng.random() < 0.3,
+    } for i in range(n)])
+    index = SearchIndex()
+    store.add_listener(index)
+    return store, index
+
+
+def _surveys(rng, ids, n=40):
+    return [{
+        'category': rng.choice(CATEGORIES + ['Unknown']),
+        'deployment_preference': rng.sample(DEPLOYMENTS, rng.randint(0, 3)),
+        'priority_features': ['Local support'] if rng.random() < 0.5 else [],
+        'budget_range': rng.choice(list(BUDGET_RANGES) + [None]),
+        'company_size': rng.choice(list(COMPANY_HEADCOUNT)),
+        'boosts': {product_id: rng.randint(1, 40) for product_id in rng.sample(ids, 5)},
+    } for _ in range(n)]
+
+
+def _expected(index, survey, k):
+    return index.rank(survey['category'], survey['deployment_preference'],
+                      'Local support' in survey['priority_features'], survey['budget_range'],
+                      survey['company_size'], survey['boosts'], k)
+
+
+def test_batch_scores_match_the_search_index(tmp_path, monkeypatch):
+    rng = random.Random(7)
+    store, index = _catalog(tmp_path, rng)
+    ids = [product['id'] for product in store.snapshot().products()]
+    surveys = _surveys(rng, ids)
+    matrix = ProductMatrix(CatalogFrame(store.snapshot()))
+    boosts = [survey['boosts'] for survey in surveys]
+
+    for k in (None, 5):
+        expected = [_expected(index, survey, k) for survey in surveys]
+        assert score_surveys(matrix, surveys, boosts=boosts, k=k) == expected
+
+    monkeypatch.setattr(batch_scoring, 'SHARD_MIN_PRODUCTS', 1)
+    assert score_surveys(matrix, surveys, boosts=boosts, k=5, workers=2) == [
+        _expected(index, survey, 5) for survey in surveys]
@@ -0,0 +1,65 @@
+import io
+
+from openpyxl import Workbook
+
+from market_research.bulk_import import import_catalog
+from market_research.catalog import CatalogStore
+from market_research.similarity import SimilarityIndex
+
+GOOD = '{"name": "%s", "vendor": "Vendor", "category": "CRM", "rating": 4}'
+
+
+def test_malformed_jsonl_lines_are_rejected_with_line_numbers(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    lines = [GOOD % 'A', '{not json', '', '[1, 2]', GOOD % 'B', 'null']
+    report = import_catalog(store, io.BytesIO('\n'.join(lines).encode()), 'jsonl', batch_size=2)
+
+    assert report.imported == 2
+    assert [row for row, _ in report.rejected] == [2, 4, 6]
+    assert report.rows_read == 5
+    assert sorted(product['name'] for product in store.snapshot().products()) == ['A', 'B']
+
+
+CSV_ROWS = """name,vendor,category,deployment,features,rating,market_share,support_vietnam
+Sổ Kho,Misa,ERP,"SaaS, on-prem","Kho, Kế toán",4,"12,5 %",Có
+No Vendor,,ERP,Cloud,,4,,
+Bad Rating,X,ERP,Cloud,,7,,
+Bad Deploy,X,ERP,Mainframe,,4,,
+Sổ  kho,MISA,ERP,Cloud,,"4,25",,no
+"""
+
+
+def test_csv_rows_are_normalized_rejected_and_flagged_in_batches(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    similarity = SimilarityIndex()
+    store.add_listener(similarity)
+    batches = []
+    report = import_catalog(store, io.BytesIO(CSV_ROWS.encode('utf-8-sig')), 'csv', batch_size=3,
+                            progress=lambda report: batches.append(report.rows_read),
+                            duplicates=similarity.duplicates)
+
+    assert batches == [3, 5]
+    assert store.version == 2
+    assert (report.imported, report.rows_read) == (2, 5)
+    assert [row for row, _ in report.rejected] == [2, 3, 4]  # data rows, header excluded
+    assert [(row, name) for row, name, _, _ in report.duplicates] == [(5, 'Sổ  kho')]
+    first, second = store.snapshot().products()
+    assert first['deployment'] == ['Cloud', 'On-premise'] and first['features'] == ['Kho', 'Kế toán']
+    assert (first['rating'], first['market_share'], first['support_vietnam']) == (4.0, '12.5%', True)
+    assert (second['rating'], second['market_share'], second['support_vietnam']) == (4.2, '', False)
+
+
+def test_xlsx_rows_are_imported(tmp_path):
+    workbook = Workbook()
+    workbook.active.append(['name', 'vendor', 'category', 'rating', 'support_vietnam'])
+    workbook.active.append(['Sheet CRM', 'Vendor', 'CRM', 4.5, True])
+    workbook.active.append([None, None, None, None, None])
+    file = io.BytesIO()
+    workbook.save(file)
+    file.seek(0)
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    report = import_catalog(store, file, 'xlsx')
+
+    assert report.imported == 1 and [row for row, _ in report.rejected] == [2]
+    product, = store.snapshot().products()
+    assert (product['name'], product['rating'], product['support_vietnam']) == ('Sheet CRM', 4.5, True)
@@ -0,0 +1,66 @@
+from market_research.catalog import CatalogStore
+
+
+def _product(name, category='CRM', **fields):
+    return dict({'name': name, 'vendor': 'Vendor', 'category': category, 'price_range': '10 USD/user/month',
+                 'deployment': ['Cloud'], 'features': [], 'pros': [], 'cons': [],
+                 'rating': 4.0, 'market_share': '1%', 'website': '', 'support_vietnam': False}, **fields)
+
+
+class RecordingListener:
+    def __init__(self):
+        self.calls = []
+
+    def apply_changes(self, added, removed, version):
+        self.calls.append(([product['name'] for product in added], [product['name'] for product in removed],
+                           version))
+
+
+def test_catalog_is_seeded_once_and_persists(tmp_path):
+    path = str(tmp_path / 'catalog.db')
+    store = CatalogStore(path)
+    seeded = len(store)
+    assert seeded > 0 and store.version == 1
+
+    product_id = store.add_product(_product('Persisted CRM'))
+    store.update_product(product_id, {'rating': 4.6})
+    reopened = CatalogStore(path)
+
+    assert len(reopened) == seeded + 1
+    assert reopened.version == store.version == 3
+    assert reopened.get(product_id)['rating'] == 4.6
+    assert reopened.get(product_id)['price'].per_seat
+
+
+def test_listeners_follow_each_committed_write(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    first = store.add_product(_product('A'))
+    listener = RecordingListener()
+    store.add_listener(listener)
+
+    second, = store.add_products([_product('B')])
+    store.update_product(first, {'name': 'A2'})
+    store.delete_products([second, 999])
+    assert store.delete_product(second) is False
+
+    assert listener.calls == [(['A'], [], 1), (['B'], [], 2), (['A2'], ['A'], 3), ([], ['B'], 4)]
+
+
+def test_snapshots_are_isolated_from_later_writes(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    kept, changed, deleted = store.add_products([_product('Kept', 'ERP'), _product('Changed'), _product('Deleted')])
+    before = store.snapshot()
+
+    store.update_product(changed, {'name': 'Changed again', 'category': 'HR'})
+    store.delete_product(deleted)
+    added = store.add_product(_product('Added'))
+    after = store.snapshot()
+
+    assert before.version == 1 and after.version == 4
+    assert [product['name'] for product in before.products()] == ['Kept', 'Changed', 'Deleted']
+    assert before.get(added) is None and before.get(deleted)['name'] == 'Deleted'
+    assert before.categories() == ['ERP', 'CRM']
+    assert [product['name'] for product in after.products('CRM')] == ['Added']
+    assert [product['name'] for product in after.products('HR')] == ['Changed again']
+    assert after.get(deleted) is None and len(after) == 3
+    assert after.get(kept) is before.get(kept)  # untouched records are shared, not copied
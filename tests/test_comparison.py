@@ -0,0 +1,17 @@
+from market_research.comparison import PresenceMatrix
+
+
+def _product(product_id, name, vendor, features):
+    return {'id': product_id, 'name': name, 'vendor': vendor, 'features': features,
+            'pros': [], 'cons': [], 'deployment': ['Cloud']}
+
+
+def test_products_with_the_same_name_keep_their_own_columns():
+    matrix = PresenceMatrix([_product(1, 'CRM', 'Alpha', ['Email']), _product(2, 'CRM', 'Beta', ['Chat']),
+                             _product(3, 'CRM', 'Beta', ['Email', 'Chat'])])
+    grid = matrix.to_frame()
+
+    assert list(grid.columns) == ['CRM · Alpha', 'CRM · Beta #2', 'CRM · Beta #3']
+    assert grid.loc[('Tính năng', 'Email')].tolist() == [True, False, True]
+    assert grid.loc[('Triển khai', 'Cloud')].tolist() == [True, True, True]
+    assert matrix.product_coverage()['Tính năng'].tolist() == [1, 1, 2]
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from market_research.catalog import CatalogStore
+from market_research.frame import CatalogFrame
+
+
+def _product(name, category):
+    return {'name': name, 'vendor': 'Vendor', 'category': category, 'price_range': '',
+            'deployment': ['Cloud'], 'features': [], 'pros': [], 'cons': [],
+            'rating': 4.0, 'market_share': '1%', 'website': '', 'support_vietnam': False}
+
+
+def test_positions_after_adding_to_an_earlier_category(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    store.add_products([_product('ERP 1', 'ERP'), _product('ERP 2', 'ERP'),
+                        _product('CRM 1', 'CRM'), _product('CRM 2', 'CRM'), _product('HR 1', 'HR')])
+    late = store.add_product(_product('ERP 3', 'ERP'))
+    frame = CatalogFrame(store.snapshot())
+    ids = frame.df['id'].tolist()
+    assert ids != sorted(ids)
+
+    for product_id in ids + [late]:
+        position = frame.positions([product_id])[0]
+        assert frame.df['id'].iat[position] == product_id
+        assert frame.df['name'].iat[position] == store.get(product_id)['name']
+    assert frame.positions([10_000]).tolist() == [-1]
+
+    wanted = {ids[-1], late, ids[0]}
+    assert set(frame.df['id'].iloc[frame.query(ids=wanted)]) == wanted
+    assert set(frame.df['id'].iloc[frame.query('ERP', ids=wanted)]) == {late, ids[0]} & set(
+        frame.df.loc[frame.df['category'] == 'ERP', 'id'])
+
+
+def test_fields_are_parsed_once_into_columns(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    store.add_products([
+        dict(_product('beta', 'CRM'), market_share='22%', rating='4.5', price_range='10 USD/user/month',
+             deployment=['Cloud', 'Hybrid']),
+        dict(_product('Alpha', 'CRM'), market_share='n/a', rating=None, deployment=['Edge']),
+        dict(_product('Gamma', 'ERP'), market_share=' 5 %', support_vietnam=True),
+    ])
+    frame = CatalogFrame(store.snapshot())
+
+    assert frame.df['market_share'].tolist()[::2] == [22.0, 5.0] and np.isnan(frame.df['market_share'][1])
+    assert frame.df['rating'][0] == 4.5 and np.isnan(frame.df['rating'][1])
+    assert list(frame.deployment.columns) == ['Cloud', 'On-premise', 'Hybrid', 'Edge']
+    assert frame.deployment.to_numpy().tolist()[:2] == [[True, False, True, False], [False, False, False, True]]
+    assert frame.price_terms[0].tolist() == [0.0, 0.0, 3_000_000.0, 3_000_000.0]
+    assert np.isnan(frame.price_terms[1]).all()
+
+    assert frame.df['name'].iloc[frame.query('CRM')].tolist() == ['Alpha', 'beta']
+    assert frame.df['name'].iloc[frame.query(sort='market_share', descending=True)].tolist() == [
+        'beta', 'Gamma', 'Alpha']
+    with pytest.raises(ValueError):
+        frame.query(sort='website')
@@ -0,0 +1,29 @@
+from market_research.name_index import NameIndex
+
+
+def _product(product_id, name, vendor='Vendor', category='CRM'):
+    return {'id': product_id, 'name': name, 'vendor': vendor, 'category': category}
+
+
+def test_typeahead_matches_prefixes_infixes_typos_and_follows_changes():
+    index = NameIndex()
+    index.apply_changes([_product(1, 'Quản lý Kho'), _product(2, 'SAP S/4HANA', 'SAP', 'ERP'),
+                         _product(3, 'Salesforce Sales Cloud', 'Salesforce'),
+                         _product(4, 'HubSpot CRM', 'HubSpot')], [], 1)
+
+    assert index.search('q') == [1]
+    assert index.search('quan ly') == [1]
+    assert index.search('sa')[:2] == [2, 3]  # name prefixes first, shorter names first
+    assert index.search('sales cloud') == [3]
+    assert index.search('salesfroce') == [3]  # a typo keeps most inner grams
+    assert index.search('hubspot') == [4]
+    assert index.search('sa', category='ERP') == [2]
+    assert index.search('zzz') == []
+    assert index.lookup('quan  ly KHO') == {1}
+
+    index.apply_changes([_product(4, 'Breeze CRM', 'HubSpot')], [_product(4, 'HubSpot CRM', 'HubSpot')], 2)
+    assert index.search('breeze') == [4]
+    assert index.search('hubspot') == [4]  # still matched by vendor
+    assert index.lookup('HubSpot CRM') == set()
+    index.apply_changes([], [_product(4, 'Breeze CRM', 'HubSpot')], 3)
+    assert index.search('breeze') == [] and index.version == 3
@@ -0,0 +1,72 @@
+import random
+
+from market_research.pricing import (BUDGET_RANGES, BULK_BATCH, COMPANY_HEADCOUNT, PriceIndex, PriceQuote,
+                                     budget_bounds, parse_price)
+
+PRICES = {
+    '99-499 USD/user/month': PriceQuote(99, 499, 'USD', True, 'month'),
+    'Free - 1,200 USD/month': PriceQuote(0, 1200, 'USD', False, 'month'),
+    '10-50 triệu VNĐ/năm': PriceQuote(10e6, 50e6, 'VND', False, 'year'),
+    '1.200.000 đ/người/tháng': PriceQuote(1.2e6, 1.2e6, 'VND', True, 'month'),
+    '4,5 tỷ': PriceQuote(4.5e9, 4.5e9, 'VND', False, None),
+    '€20/user/mo': PriceQuote(20, 20, 'EUR', True, 'month'),
+    'Miễn phí': PriceQuote(0, 0, 'VND', False, None),
+    'Liên hệ': None,
+    '500 / tháng': None,  # an amount without a currency
+    None: None,
+}
+
+
+def test_parse_price():
+    for text, quote in PRICES.items():
+        assert parse_price(text) == quote, text
+
+
+def test_annual_cost_scales_per_seat_prices_by_headcount():
+    assert PRICES['99-499 USD/user/month'].annual_cost(100) == (99 * 25_000 * 12 * 100, 499 * 25_000 * 12 * 100)
+    assert PRICES['10-50 triệu VNĐ/năm'].annual_cost(100) == (10e6, 50e6)
+    assert PRICES['4,5 tỷ'].annual_cost(2000) == (4.5e9, 4.5e9)
+
+
+def _brute_force(quotes, budget_range, company_size, candidates=None):
+    budget_min, budget_max = budget_bounds(budget_range)
+    headcount = COMPANY_HEADCOUNT[company_size]
+    return {product_id for product_id, quote in quotes.items()
+            if (candidates is None or product_id in candidates)
+            and quote.annual_cost(headcount)[0] <= budget_max and quote.annual_cost(headcount)[1] >= budget_min}
+
+
+def _check(index, quotes, candidates):
+    for budget_range in BUDGET_RANGES:
+        for company_size in COMPANY_HEADCOUNT:
+            assert index.within(budget_range, company_size) == _brute_force(quotes, budget_range, company_size)
+            assert index.within(budget_range, company_size, candidates) == _brute_force(
+                quotes, budget_range, company_size, candidates)
+
+
+def test_within_matches_interval_overlap():
+    rng = random.Random(0)
+    quotes = {}
+    for product_id in range(2 * BULK_BATCH):
+        low = rng.choice([0, rng.uniform(1, 100), rng.uniform(100, 5000)])
+        quotes[product_id] = PriceQuote(low, low * rng.choice([1, 2, 10, 1000]), 'USD',
+                                        rng.random() < 0.5, rng.choice(['month', 'year', None]))
+    index = PriceIndex()
+    index.add_many(quotes.items())  # bulk path
+    candidates = set(rng.sample(sorted(quotes), 50))
+    _check(index, quotes, candidates)
+
+    for product_id in rng.sample(sorted(quotes), 20):  # in-place path
+        index.remove(product_id)
+        del quotes[product_id]
+    index.add(10_000, PriceQuote(1, 1, 'VND', False, None))
+    quotes[10_000] = PriceQuote(1, 1, 'VND', False, None)
+    index.remove(20_000)
+    _check(index, quotes, candidates)
+
+    dropped = rng.sample(sorted(quotes), BULK_BATCH)  # bulk removal
+    index.remove_many(dropped)
+    for product_id in dropped:
+        del quotes[product_id]
+    _check(index, quotes, candidates)
+    assert index.within('không rõ', '< 50 nhân viên') is None
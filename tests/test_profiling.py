@@ -0,0 +1,29 @@
+import sys
+import urllib.request
+
+from market_research.profiling import RenderMetrics, deep_sizeof, render_exposition, serve_metrics
+from market_research.survey_results import SurveyResults
+
+
+def test_deep_sizeof_follows_slots():
+    results = SurveyResults(((product_id, 50) for product_id in range(10_000)), version=1)
+
+    assert deep_sizeof(results) >= sys.getsizeof(results._ids) + sys.getsizeof(results._scores)
+
+
+def test_metrics_hide_session_ids_and_listen_on_loopback():
+    metrics = RenderMetrics()
+    metrics.record_session_size('3f2a-secret-session', 1024)
+    server = serve_metrics(metrics.samples, 0)
+    try:
+        host, port = server.server_address
+        assert host == '127.0.0.1'
+        with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics') as response:
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert body == render_exposition(metrics.samples())
+    assert 'app_session_state_bytes{session="' in body
+    assert 'secret' not in body
@@ -0,0 +1,35 @@
+from market_research.recommendation_cache import CachedBackend, RecommendationCache
+
+REQUEST = {'business_type': 'Thương mại', 'pain_points': 'Quản lý kho',
+           'integration_needs': '', 'special_requirements': ''}
+
+
+class CatalogChangingBackend:
+    """Returns a result after the catalog has moved on, like a slow model call."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def stream(self, request):
+        self.cache.apply_changes([], [], self.cache.version + 1)
+        yield {'type': 'result', 'result': {'top_recommendations': []}}
+
+
+def test_result_computed_against_an_older_catalog_is_not_cached(tmp_path):
+    cache = RecommendationCache(path=str(tmp_path / 'cache.db'))
+    cache.apply_changes([], [], 1)
+    events = list(CachedBackend(CatalogChangingBackend(cache), cache).stream(REQUEST))
+
+    assert events[-1]['type'] == 'result'
+    assert cache.get(REQUEST) is None
+
+
+def test_disk_hits_count_as_hits(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    RecommendationCache(path=path).put(REQUEST, {'top_recommendations': []})
+    cache = RecommendationCache(path=path)
+
+    assert cache.get(REQUEST) == {'top_recommendations': []}  # disk tier
+    assert cache.get(REQUEST) == {'top_recommendations': []}  # memory tier
+    assert cache.get(dict(REQUEST, business_type='Sản xuất')) is None
+    assert (cache.hits, cache.misses) == (2, 1)
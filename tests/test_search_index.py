@@ -0,0 +1,37 @@
+from market_research.catalog import CatalogStore
+from market_research.search_index import (BUDGET_SCORE, DEPLOYMENT_SCORE, LOCAL_SUPPORT_SCORE,
+                                          SearchIndex)
+
+
+def _product(name, category='CRM', **fields):
+    return dict({'name': name, 'vendor': 'Vendor', 'category': category, 'price_range': '',
+                 'deployment': ['Cloud'], 'features': [], 'pros': [], 'cons': [],
+                 'rating': 4.0, 'market_share': '1%', 'website': '', 'support_vietnam': False}, **fields)
+
+
+def test_postings_follow_catalog_changes(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    index = SearchIndex()
+    store.add_listener(index)
+    local, priced, other = store.add_products([
+        _product('Local CRM', support_vietnam=True, deployment=['On-premise']),
+        _product('Priced CRM', price_range='10 USD/user/month', features=['Pipeline']),
+        _product('Payroll', 'HR'),
+    ])
+
+    def rank():
+        return index.rank('CRM', ['Cloud'], local_support=True, budget_range='100-500 triệu VNĐ',
+                          company_size='50-200 nhân viên')
+
+    assert rank() == [(priced, DEPLOYMENT_SCORE + BUDGET_SCORE), (local, LOCAL_SUPPORT_SCORE)]
+    assert index.postings('feature', 'Pipeline') == {priced}
+
+    store.update_product(local, {'deployment': ['Cloud'], 'category': 'HR'})
+    store.update_product(other, {'category': 'CRM'})
+    store.delete_product(priced)
+
+    assert rank() == [(other, DEPLOYMENT_SCORE)]
+    assert index.postings('category', 'HR') == {local}
+    assert index.postings('deployment', 'On-premise') == set()
+    assert index.postings('feature', 'Pipeline') == set()
+    assert [product['name'] for product in index.search('HR', ['Cloud'], k=1)] == ['Local CRM']
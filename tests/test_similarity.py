@@ -0,0 +1,30 @@
+from market_research.similarity import SimilarityIndex
+
+
+def _product(product_id, name, vendor, features=()):
+    return {'id': product_id, 'name': name, 'vendor': vendor, 'category': 'CRM',
+            'features': list(features), 'pros': [], 'cons': []}
+
+
+def test_products_of_one_vendor_are_not_duplicates():
+    index = SimilarityIndex()
+    index.apply_changes([_product(1, 'Microsoft Teams', 'Microsoft'),
+                         _product(2, 'Salesforce Sales Cloud', 'Salesforce'),
+                         _product(3, 'Salesforce CRM', 'Salesforce')], [], 1)
+
+    assert index.duplicates(_product(None, 'Microsoft Excel', 'Microsoft')) == []
+    assert index.duplicates(_product(None, 'Service Cloud', 'Salesforce')) == []
+    assert index.duplicates(_product(None, 'Salesforce Service Cloud', 'Salesforce')) == []
+    assert [product_id for product_id, _ in index.duplicates(_product(None, 'Sales force CRM', 'Salesforce'))] == [3]
+    assert [product_id for product_id, _ in index.duplicates(_product(None, 'MS Teams', 'Microsoft Corp.'))] == [1]
+
+
+def test_similar_follows_catalog_changes():
+    index = SimilarityIndex()
+    features = ['Pipeline', 'Email marketing', 'Lead scoring']
+    index.apply_changes([_product(1, 'Alpha CRM', 'Alpha', features), _product(2, 'Beta CRM', 'Beta', features),
+                         _product(3, 'Payroll', 'Gamma', ['Salary', 'Tax'])], [], 1)
+    assert [product_id for product_id, _ in index.similar(1)] == [2]
+
+    index.apply_changes([], [_product(2, 'Beta CRM', 'Beta', features)], 2)
+    assert index.similar(1) == []
@@ -0,0 +1,24 @@
+from market_research.text_index import TextIndex
+
+
+def _product(product_id, name, features=(), category='ERP'):
+    return {'id': product_id, 'name': name, 'category': category, 'features': list(features),
+            'pros': [], 'cons': []}
+
+
+def test_vietnamese_queries_find_english_terms_and_follow_changes():
+    index = TextIndex()
+    stock, books, crm = (_product(1, 'Stock', ['Inventory management', 'Warehouse']),
+                         _product(2, 'Books', ['Accounting', 'Financial reports']),
+                         _product(3, 'Leads', ['Sales pipeline'], 'CRM'))
+    index.apply_changes([stock, books, crm], [], 1)
+
+    hits = index.search('Quản lý kho hàng')
+    assert [product['id'] for product, _, _ in hits] == [1]
+    assert 'inventory' in hits[0][2]
+    assert set(index.scores('báo cáo tài chính')) == {2}
+    assert index.scores('bán hàng', category='ERP') == {}
+
+    index.apply_changes([_product(2, 'Books', ['Inventory costing'])], [books], 2)
+    assert set(index.scores('tồn kho')) == {1, 2}
+    assert index.scores('tài chính') == {}
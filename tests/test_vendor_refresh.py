@@ -0,0 +1,58 @@
+from market_research.catalog import CatalogStore
+from market_research.consultation import DONE
+from market_research.vendor_refresh import VendorRefresher
+
+
+def _product(name, vendor, rating=4.0):
+    return {'name': name, 'vendor': vendor, 'category': 'CRM', 'price_range': '',
+            'deployment': ['Cloud'], 'features': [], 'pros': [], 'cons': [],
+            'rating': rating, 'market_share': '1%', 'website': '', 'support_vietnam': False}
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, feeds):
+        self.feeds = feeds
+
+    def get(self, url, headers=None, timeout=None):
+        return FakeResponse(self.feeds[url.rsplit('/', 1)[-1]])
+
+
+def test_malformed_feeds_fail_alone(tmp_path):
+    store = CatalogStore(str(tmp_path / 'catalog.db'), seed=None)
+    good, listed, odd = store.add_products([_product('Good CRM', 'Good'), _product('Listed CRM', 'Listed'),
+                                            _product('Odd CRM', 'Odd')])
+    feeds = {
+        'Good': {'products': [{'name': 'Good CRM', 'rating': 4.8}]},
+        'Listed': [{'name': 'Listed CRM', 'rating': 1.0}],
+        'Odd': {'products': [{'name': 42, 'rating': 1.0}, {'name': 'Odd CRM', 'rating': 3.5}]},
+    }
+    refresher = VendorRefresher(store, 'https://feeds.test/{vendor}', workers=2,
+                                session=FakeSession(feeds))
+    job = refresher.run()
+
+    assert job.status == DONE
+    assert (job.fetched, job.failed, job.updated) == (2, 1, 2)
+    assert job.errors[0][0].endswith('/Listed')
+    assert store.get(good)['rating'] == 4.8
+    assert store.get(listed)['rating'] == 4.0
+    assert store.get(odd)['rating'] == 3.5